@@ -46,6 +46,9 @@ def get_matchup_projection(
     optimize_opponent_roster: bool = Query(
         False, description="Optimize opponent's roster positions for maximum active players"
     ),
+    refresh: bool = Query(
+        False, description="Recompute instead of serving a recently cached projection"
+    ),
 ):
     """Get matchup projection for a team."""
     # Verify authentication
@@ -72,6 +75,7 @@ def get_matchup_projection(
             projection_mode=projection_mode,
             optimize_user_roster=optimize_user_roster,
             optimize_opponent_roster=optimize_opponent_roster,
+            force_refresh=refresh,
         )
     except YahooAuthError as e:
         raise HTTPException(
@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from app.auth import yahoo_web
 
 from tools.boxscore import boxscore_cache, boxscore_fetcher, boxscore_refresh
-from tools.utils import player_index, waiver_cache
+from tools.utils import player_index, projection_cache, waiver_cache
 
 router = APIRouter()
 
@@ -160,6 +160,9 @@ def refresh_box_scores_sync(
     else:
         result = boxscore_refresh.smart_refresh(season=season)
 
+    # Cached matchup projections were computed from the old box scores
+    projection_cache.clear_all_caches()
+
     return {
         "box_scores": {
             "games_fetched": result.get("games_fetched", 0),
@@ -215,6 +215,11 @@ class RefreshCommand(Command):
                     from tools.utils import waiver_cache
 
                     waiver_cache.clear_all_caches()
+
+                # Cached matchup projections were computed from the old box scores
+                from tools.utils import projection_cache
+
+                projection_cache.clear_all_caches()
             except Exception as err:
                 progress.add_line(f"[red]✗[/red] Error refreshing cache: {err}")
                 return
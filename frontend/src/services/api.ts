@@ -164,7 +164,8 @@ class ApiClient {
     projectionMode: string = 'season',
     teamKey?: string,
     optimizeUserRoster: boolean = false,
-    optimizeOpponentRoster: boolean = false
+    optimizeOpponentRoster: boolean = false,
+    refresh: boolean = false
   ): Promise<MatchupProjectionResponse> {
     const response = await this.client.get('/api/matchup', {
       params: {
@@ -174,6 +175,7 @@ class ApiClient {
         team_key: teamKey,
         optimize_user_roster: optimizeUserRoster,
         optimize_opponent_roster: optimizeOpponentRoster,
+        refresh,
       },
     });
     return response.data;
@@ -310,6 +310,23 @@ def load_player_games(player_id: int, season: str) -> Optional[dict]:
         return None
 
 
+def player_has_game_on(player_id: int, season: str, game_date: str) -> bool:
+    """Check whether a player's cached game index includes a game on a date.
+
+    Args:
+        player_id: NBA player ID
+        season: Season string (e.g., "2025-26")
+        game_date: Date in YYYY-MM-DD format
+
+    Returns:
+        True if a box score for that date is cached for the player
+    """
+    player_data = load_player_games(player_id, season)
+    if not player_data:
+        return False
+    return any(game.get("date") == game_date for game in player_data.get("games", []))
+
+
 def save_player_games(player_id: int, player_name: str, data: dict,
                       season: str) -> None:
     """Save a player's game index to cache.
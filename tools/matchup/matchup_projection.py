@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
 from datetime import date, timedelta
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from tools.boxscore import boxscore_cache
 from tools.player import player_fetcher
-from tools.player.player_stats import compute_player_stats
+from tools.player.player_stats import PlayerStats, compute_player_stats
 from tools.schedule import schedule_fetcher
+from tools.utils import projection_cache
 from tools.utils.yahoo import (
     determine_current_week,
     extract_team_id,
@@ -23,6 +42,71 @@ from tools.utils.yahoo import (
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for cache/API reads, created on first use and kept warm across projections
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+# Upper bound on league matchups projected at once; each also runs one thread per team.
+# This parallelizes cache and NBA reads; Yahoo calls are capped separately below.
+_MAX_MATCHUP_WORKERS = 6
+
+# Upper bound on Yahoo API calls in flight at once across every projection thread.
+# They all share one OAuth session, and Yahoo throttles bursts of requests.
+_YAHOO_MAX_CONCURRENCY = int(os.getenv("SHAMS_YAHOO_CONCURRENCY", "3"))
+_YAHOO_CALL_LIMIT = threading.BoundedSemaphore(_YAHOO_MAX_CONCURRENCY)
+
+# Pool for Yahoo calls issued in the background, sized to the Yahoo limit
+_YAHOO_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    """Return the module-wide I/O thread pool, creating it on first use.
+
+    Only submit leaf I/O work (cache reads, single API calls) to this pool. A task
+    running on it must not block on other tasks submitted to the same pool, or a
+    saturated pool can deadlock.
+    """
+    global _IO_POOL  # pylint: disable=global-statement
+    if _IO_POOL is None:
+        with _IO_POOL_LOCK:
+            if _IO_POOL is None:
+                _IO_POOL = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("SHAMS_IO_POOL_SIZE", "16")),
+                    thread_name_prefix="shams-io",
+                )
+    return _IO_POOL
+
+
+def _yahoo_pool() -> ThreadPoolExecutor:
+    """Return the module-wide pool for background Yahoo calls, creating it on first use.
+
+    Tasks on it should go through _yahoo_call. Unlike the I/O pool, a worker here
+    may wait for a Yahoo slot without holding up cache reads.
+    """
+    global _YAHOO_POOL  # pylint: disable=global-statement
+    if _YAHOO_POOL is None:
+        with _IO_POOL_LOCK:
+            if _YAHOO_POOL is None:
+                _YAHOO_POOL = ThreadPoolExecutor(
+                    max_workers=_YAHOO_MAX_CONCURRENCY,
+                    thread_name_prefix="shams-yahoo",
+                )
+    return _YAHOO_POOL
+
+
+def _yahoo_call(func, *args):
+    """Call a Yahoo API helper while holding one of the module-wide Yahoo slots."""
+    with _YAHOO_CALL_LIMIT:
+        return func(*args)
+
+
+@atexit.register
+def _shutdown_io_pool() -> None:
+    if _IO_POOL is not None:
+        _IO_POOL.shutdown(wait=False)
+    if _YAHOO_POOL is not None:
+        _YAHOO_POOL.shutdown(wait=False)
+
 
 def _current_season() -> str:
     """Return the active NBA season string derived from today's date (e.g. '2025-26')."""
@@ -49,6 +133,23 @@ def _is_category_desc(stat: Dict[str, object]) -> bool:
     return stat.get("sort_order", "") in {"0", 0, "asc"}
 
 
+# Inactive positions - bench and injured list
+# Note: DNP was mentioned in docs but missing from original set
+_INACTIVE_POSITIONS = frozenset({"BN", "IL", "IL+", "DNP", ""})
+
+# Injured list slots - never moved by the roster optimizer
+_IL_POSITIONS = frozenset({"IL", "IL+"})
+
+# Positions that don't count toward totals in optimized (per-day) lineups
+_OPTIMIZED_INACTIVE_POSITIONS = frozenset({"BN", "IL", "IL+"})
+
+# Shared empty active-date set for players with no active days
+_NO_ACTIVE_DATES: FrozenSet[str] = frozenset()
+
+# Read-only stand-in for a missing opponent entry, so lookups need no throwaway dict
+_EMPTY_ENTRY: Mapping[str, object] = MappingProxyType({})
+
+
 def _player_is_active(player: dict) -> bool:
     """Check if player is in an active roster position.
 
@@ -57,90 +158,210 @@ def _player_is_active(player: dict) -> bool:
     selected_position = player.get("selected_position")
     if isinstance(selected_position, dict):
         position = selected_position.get("position")
-    elif selected_position is not None:
+    else:
         # If it's a string or other type, use it directly
         position = str(selected_position) if selected_position else None
-    else:
-        position = None
 
-    # Inactive positions - bench and injured list
-    # Note: DNP was mentioned in docs but missing from original set
-    inactive_positions = {"BN", "IL", "IL+", "DNP", ""}
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_player_activity(player, position)
 
-    if not position:
-        # Missing position data - treat as inactive to be safe
-        player_name = player.get("name", {})
-        if isinstance(player_name, dict):
-            full_name = player_name.get("full", "Unknown")
-        else:
-            full_name = str(player_name)
-        logger.debug(f"Player {full_name} has no position data, treating as inactive")
-        return False
+    # Missing position data - treat as inactive to be safe
+    return bool(position) and position not in _INACTIVE_POSITIONS
 
-    is_active = position not in inactive_positions
 
-    # Log IL+ players specifically since that's the bug being reported
-    if position in {"IL", "IL+"}:
-        player_name = player.get("name", {})
-        if isinstance(player_name, dict):
-            full_name = player_name.get("full", "Unknown")
-        else:
-            full_name = str(player_name)
-        logger.debug(
-            f"Player {full_name} is in {position} position - marked as inactive"
-        )
+def _log_player_activity(player: dict, position: Optional[str]) -> None:
+    """Debug-log why a player is treated as inactive (no position, or IL/IL+)."""
+    if position and position not in _IL_POSITIONS:
+        return
 
-    return is_active
+    player_name = player.get("name", {})
+    if isinstance(player_name, dict):
+        full_name = player_name.get("full", "Unknown")
+    else:
+        full_name = str(player_name)
+
+    if not position:
+        logger.debug("Player %s has no position data, treating as inactive", full_name)
+    else:
+        # Log IL+ players specifically since that's the bug being reported
+        logger.debug("Player %s is in %s position - marked as inactive", full_name, position)
 
 
 def _player_key(player: dict) -> Optional[str]:
     return player.get("player_key")
 
 
+def _lookup_player_id(
+    player_name: str, id_cache: Optional[Dict[str, Optional[int]]] = None
+) -> Optional[int]:
+    """Resolve a player's NBA ID, reusing earlier lookups recorded in id_cache.
+
+    A team projection resolves the same roster names in several passes; sharing
+    one id_cache across them does each name lookup once.
+    """
+    if id_cache is None:
+        return player_fetcher.player_id_lookup(player_name)
+    if player_name not in id_cache:
+        id_cache[player_name] = player_fetcher.player_id_lookup(player_name)
+    return id_cache[player_name]
+
+
+def _player_schedule(
+    nba_id: int,
+    week_start_str: str,
+    week_end_str: str,
+    season: str,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
+) -> schedule_fetcher.PlayerSchedule:
+    """Load a player's cached schedule for the week, reusing earlier loads in schedule_cache.
+
+    The optimizer, projected and daily passes all need the same schedules; sharing
+    one schedule_cache across them reads each player's schedule once.
+    """
+    if schedule_cache is None:
+        return schedule_fetcher.fetch_player_upcoming_games_from_cache(
+            nba_id, week_start_str, week_end_str, season
+        )
+    key = (nba_id, week_start_str, week_end_str)
+    schedule = schedule_cache.get(key)
+    if schedule is None:
+        schedule = schedule_fetcher.fetch_player_upcoming_games_from_cache(
+            nba_id, week_start_str, week_end_str, season
+        )
+        schedule_cache[key] = schedule
+    return schedule
+
+
+def _keyed_roster(roster: Dict[str, List[dict]]) -> Dict[str, List[Tuple[str, dict]]]:
+    """Pair each roster entry with its player key, dropping entries without one.
+
+    Functions that walk the roster more than once build this view once and
+    unpack (player_key, player) pairs instead of re-deriving the key per walk.
+    """
+    keyed: Dict[str, List[Tuple[str, dict]]] = {}
+    for date_str, players in roster.items():
+        keyed[date_str] = [
+            (player_key, player)
+            for player in players
+            if (player_key := _player_key(player))
+        ]
+    return keyed
+
+
+def _dedup_players(keyed_roster: Dict[str, List[Tuple[str, dict]]]) -> Dict[str, dict]:
+    """Map each player key on the roster to its first roster entry, in date order."""
+    unique_players: Dict[str, dict] = {}
+    for keyed_players in keyed_roster.values():
+        for player_key, player in keyed_players:
+            if player_key not in unique_players:
+                unique_players[player_key] = player
+    return unique_players
+
+
+def _roster_positions_by_date(
+    keyed_roster: Dict[str, List[Tuple[str, dict]]],
+) -> Dict[str, Dict[str, str]]:
+    """Map date -> player_key -> Yahoo selected position ("" when missing)."""
+    positions_by_date: Dict[str, Dict[str, str]] = {}
+    for date_str, keyed_players in keyed_roster.items():
+        positions_today: Dict[str, str] = {}
+        for player_key, player in keyed_players:
+            selected_position = player.get("selected_position")
+            if isinstance(selected_position, dict):
+                position = selected_position.get("position", "")
+            else:
+                position = selected_position if selected_position else ""
+            positions_today[player_key] = position or ""
+        positions_by_date[date_str] = positions_today
+    return positions_by_date
+
+
+def _roster_dates(roster: Dict[str, List[dict]]) -> List[str]:
+    """Return the roster's ISO dates in chronological order.
+
+    _collect_roster inserts dates in order, so the keys are normally already
+    sorted and this is a linear check rather than a sort.
+    """
+    dates = list(roster)
+    if any(earlier > later for earlier, later in zip(dates, dates[1:])):
+        dates.sort()
+    return dates
+
+
+def _normalize_roster_entries(players: Iterable[object]) -> List[dict]:
+    """Convert a Yahoo roster response into a list of player dicts."""
+    all_players = []
+    for entry in players:
+        player = entry
+        if isinstance(entry, dict):
+            player = entry.get("player", entry)
+
+        # Handle both dict and yfpy Player objects
+        if not isinstance(player, dict):
+            # Convert yfpy Player object to dict
+            if hasattr(player, "serialized"):
+                player = player.serialized()
+            elif hasattr(player, "__dict__"):
+                player = player.__dict__
+            else:
+                continue
+
+        # Include ALL players (active and benched) for display purposes
+        # Team totals will only count active players
+        all_players.append(player)
+    return all_players
+
+
 def _collect_roster(
     league_key: str, team_id: int, start: date, end: date
 ) -> Dict[str, List[dict]]:
+    """Fetch the team's roster for each date from start to end.
+
+    Dates of a past week are fetched in parallel on the Yahoo pool, so no more
+    than _YAHOO_MAX_CONCURRENCY requests are in flight; for the current week
+    they are fetched one at a time.
+
+    Returns:
+        Dict mapping ISO date strings to player dicts, with keys inserted in
+        chronological order
+    """
     rosters: Dict[str, List[dict]] = {}
     today = date.today()
     logger.info(
         f"Collecting roster for team {team_id} from {start.isoformat()} to {end.isoformat()} (today: {today.isoformat()})"
     )
 
+    all_dates = list(_date_range(start, end))
+    fetch_dates = [current for current in all_dates if current <= today]
+    if end < today:
+        fetched = _yahoo_pool().map(
+            lambda current: _yahoo_call(
+                fetch_team_roster_for_date, league_key, team_id, current
+            ),
+            fetch_dates,
+        )
+    else:
+        fetched = (
+            _yahoo_call(fetch_team_roster_for_date, league_key, team_id, current)
+            for current in fetch_dates
+        )
     last_fetched: List[dict] = []
-    for current in _date_range(start, end):
-        if current > today:
-            # Yahoo's API rejects future-date roster requests.
-            # Reuse the most recent fetched roster as the standing projection lineup.
-            rosters[current.isoformat()] = last_fetched
-            logger.debug(
-                f"  Date {current.isoformat()}: future date, reusing roster from {today.isoformat()} ({len(last_fetched)} players)"
-            )
-            continue
-
-        players = fetch_team_roster_for_date(league_key, team_id, current)
-        all_players = []
-        for entry in players:
-            player = entry
-            if isinstance(entry, dict):
-                player = entry.get("player", entry)
-
-            # Handle both dict and yfpy Player objects
-            if not isinstance(player, dict):
-                # Convert yfpy Player object to dict
-                if hasattr(player, "serialized"):
-                    player = player.serialized()
-                elif hasattr(player, "__dict__"):
-                    player = player.__dict__
-                else:
-                    continue
-
-            # Include ALL players (active and benched) for display purposes
-            # Team totals will only count active players
-            all_players.append(player)
-        rosters[current.isoformat()] = all_players
-        last_fetched = all_players
+    for current, players in zip(fetch_dates, fetched):
+        date_str = current.isoformat()
+        last_fetched = _normalize_roster_entries(players)
+        rosters[date_str] = last_fetched
+        logger.debug("  Date %s: %d players fetched", date_str, len(last_fetched))
+
+    # Yahoo's API rejects future-date roster requests.
+    # Reuse the most recent fetched roster as the standing projection lineup.
+    for current in all_dates[len(fetch_dates):]:
+        date_str = current.isoformat()
+        rosters[date_str] = last_fetched
         logger.debug(
-            f"  Date {current.isoformat()}: {len(all_players)} players fetched"
+            "  Date %s: future date, reusing roster from %s (%d players)",
+            date_str,
+            today,
+            len(last_fetched),
         )
 
     logger.info(f"Roster collection complete: {len(rosters)} dates fetched")
@@ -153,6 +374,8 @@ def _build_optimized_player_active_dates(
     week_start: date,
     week_end: date,
     season: str,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
 ) -> Tuple[Dict[str, set], Dict[str, str]]:
     """Build mapping of player_key -> set of dates where player is active, using optimized roster positions.
 
@@ -165,6 +388,8 @@ def _build_optimized_player_active_dates(
         week_start: Start date of week
         week_end: End date of week
         season: NBA season string
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        schedule_cache: Optional NBA ID/week -> schedule cache shared across passes (see _player_schedule)
 
     Returns:
         Tuple of (active_dates_map, optimized_positions_by_date)
@@ -192,12 +417,8 @@ def _build_optimized_player_active_dates(
         return _build_player_active_dates(roster), {}
 
     # Deduplicate players and collect their eligible positions
-    unique_players: Dict[str, dict] = {}
-    for players in roster.values():
-        for player in players:
-            player_key = _player_key(player)
-            if player_key and player_key not in unique_players:
-                unique_players[player_key] = player
+    keyed_roster = _keyed_roster(roster)
+    unique_players = _dedup_players(keyed_roster)
 
     # Extract eligible positions for each player from already-fetched roster data
     # PERFORMANCE NOTE: No additional API calls are made here!
@@ -214,7 +435,7 @@ def _build_optimized_player_active_dates(
         if not eligible_positions:
             missing_eligibility_count += 1
             player_name = player.get("name", {}).get("full", "")
-            nba_id = player_fetcher.player_id_lookup(player_name)
+            nba_id = _lookup_player_id(player_name, id_cache)
             if nba_id:
                 cached_eligibility = boxscore_cache.load_player_eligibility(nba_id, season)
                 if cached_eligibility:
@@ -239,32 +460,17 @@ def _build_optimized_player_active_dates(
         )
 
     # Build Yahoo positions per day from roster
-    yahoo_positions_by_date: Dict[str, Dict[str, str]] = {}  # date -> player_key -> position
-    for date_str, players in roster.items():
-        yahoo_positions_by_date[date_str] = {}
-        for player in players:
-            player_key = _player_key(player)
-            if not player_key:
-                continue
-
-            # Extract position from Yahoo roster
-            selected_position = player.get("selected_position")
-            if isinstance(selected_position, dict):
-                position = selected_position.get("position", "")
-            else:
-                position = selected_position if selected_position else ""
-
-            yahoo_positions_by_date[date_str][player_key] = position or ""
+    yahoo_positions_by_date = _roster_positions_by_date(keyed_roster)  # date -> player_key -> position
 
     # Build player schedules: map player_key -> set of dates with games
+    week_start_str = week_start.isoformat()
+    week_end_str = week_end.isoformat()
     player_schedules: Dict[str, Set[str]] = {}
     for player_key, player in unique_players.items():
         player_name = player.get("name", {}).get("full", "")
-        nba_id = player_fetcher.player_id_lookup(player_name)
+        nba_id = _lookup_player_id(player_name, id_cache)
         if nba_id:
-            schedule = schedule_fetcher.fetch_player_upcoming_games_from_cache(
-                nba_id, week_start.isoformat(), week_end.isoformat(), season
-            )
+            schedule = _player_schedule(nba_id, week_start_str, week_end_str, season, schedule_cache)
             if schedule.game_dates:
                 player_schedules[player_key] = set(schedule.game_dates)
             else:
@@ -272,15 +478,26 @@ def _build_optimized_player_active_dates(
         else:
             player_schedules[player_key] = set()
 
+    # Invert schedules once: date -> players with a game that day
+    players_by_game_date: Dict[str, Set[str]] = {}
+    for player_key, game_dates in player_schedules.items():
+        for game_date in game_dates:
+            players_by_game_date.setdefault(game_date, set()).add(player_key)
+
     # Optimize roster PER DAY to maximize active players each day
     player_active_dates: Dict[str, set] = {}
     optimized_positions_by_date: Dict[str, Dict[str, str]] = {}  # date -> player_key -> position
 
     # Collect all dates in the roster
-    all_dates = sorted(roster.keys())
+    all_dates = _roster_dates(roster)
 
     logger.info(f"Optimizing roster per-day for {len(all_dates)} dates")
 
+    # The optimizer's output depends only on who is on the roster and who has a
+    # game, so days with identical inputs (common when the roster doesn't change)
+    # reuse an earlier day's assignment instead of re-solving.
+    optimizer_results: Dict[Tuple[FrozenSet[str], FrozenSet[str]], Dict[str, str]] = {}
+
     for date_str in all_dates:
         # Get Yahoo positions for this date
         yahoo_positions_today = yahoo_positions_by_date.get(date_str, {})
@@ -291,38 +508,44 @@ def _build_optimized_player_active_dates(
         # Identify players in IL/IL+ positions - these should NOT be optimized
         players_in_il_today: Dict[str, str] = {}  # player_key -> IL position
         for player_key, position in yahoo_positions_today.items():
-            if position in ["IL", "IL+"]:
+            if position in _IL_POSITIONS:
                 players_in_il_today[player_key] = position
 
         # Determine which players have games on this specific date (excluding IL/IL+ players)
         # IMPORTANT: Only consider players who are actually on the roster for this date
-        players_with_games_today: Set[str] = set()
-        for player_key, game_dates in player_schedules.items():
-            if (date_str in game_dates
-                and player_key not in players_in_il_today
-                and player_key in players_on_roster_today):
-                players_with_games_today.add(player_key)
+        players_with_games_today: Set[str] = (
+            players_by_game_date.get(date_str, set()) & players_on_roster_today
+        ).difference(players_in_il_today)
 
         if players_in_il_today:
             logger.debug(f"  {date_str}: {len(players_with_games_today)} players with games, {len(players_in_il_today)} in IL/IL+")
         else:
             logger.debug(f"  {date_str}: {len(players_with_games_today)} players with games")
 
-        # Filter players_for_optimizer to only include players on roster today
-        # This prevents dropped players from being assigned positions for future dates
-        players_for_optimizer_today = [
-            p for p in players_for_optimizer
-            if p.get("player_key") in players_on_roster_today
-        ]
-
-        # Run optimizer for this specific date (excluding IL/IL+ players)
-        # Pass player_ranks for tie-breaking when players have same flexibility
-        optimized_positions_today = roster_optimizer.optimize_roster_positions(
-            players_for_optimizer_today,
-            league_roster_positions,
-            players_with_games_today,
-            player_ranks=player_ranks,
+        optimizer_key = (
+            frozenset(players_on_roster_today),
+            frozenset(players_with_games_today),
         )
+        optimized_positions_today = optimizer_results.get(optimizer_key)
+        if optimized_positions_today is None:
+            # Filter players_for_optimizer to only include players on roster today
+            # This prevents dropped players from being assigned positions for future dates
+            players_for_optimizer_today = [
+                p for p in players_for_optimizer
+                if p.get("player_key") in players_on_roster_today
+            ]
+
+            # Run optimizer for this specific date (excluding IL/IL+ players)
+            # Pass player_ranks for tie-breaking when players have same flexibility
+            optimized_positions_today = roster_optimizer.optimize_roster_positions(
+                players_for_optimizer_today,
+                league_roster_positions,
+                players_with_games_today,
+                player_ranks=player_ranks,
+            )
+            optimizer_results[optimizer_key] = optimized_positions_today
+        else:
+            logger.debug(f"  {date_str}: same roster and games as an earlier day, reusing assignment")
 
         # Merge optimized positions with IL/IL+ positions (IL/IL+ takes precedence)
         final_positions_today = {**optimized_positions_today, **players_in_il_today}
@@ -330,9 +553,8 @@ def _build_optimized_player_active_dates(
         optimized_positions_by_date[date_str] = final_positions_today
 
         # Track which players are active on this date
-        inactive_positions = {"BN", "IL", "IL+"}
         for player_key, position in final_positions_today.items():
-            if position not in inactive_positions:
+            if position not in _OPTIMIZED_INACTIVE_POSITIONS:
                 if player_key not in player_active_dates:
                     player_active_dates[player_key] = set()
                 player_active_dates[player_key].add(date_str)
@@ -361,8 +583,11 @@ def _build_player_active_dates(roster: Dict[str, List[dict]]) -> Dict[str, set]:
     # Get today for filtering
     today = date.today().isoformat()
 
+    # Name/position/ownership extraction below only feeds debug logging
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # Collect all dates sorted
-    sorted_dates = sorted(roster.keys())
+    sorted_dates = _roster_dates(roster)
 
     for date_str in sorted_dates:
         players = roster.get(date_str, [])
@@ -375,34 +600,35 @@ def _build_player_active_dates(roster: Dict[str, List[dict]]) -> Dict[str, set]:
             if player_key not in player_first_seen:
                 player_first_seen[player_key] = date_str
 
-            player_name = player.get("name", {})
-            if isinstance(player_name, dict):
-                full_name = player_name.get("full", "Unknown")
-            else:
-                full_name = str(player_name)
-
-            # Get position for logging
-            selected_position = player.get("selected_position")
-            if isinstance(selected_position, dict):
-                position = selected_position.get("position", "N/A")
-            else:
-                position = selected_position if selected_position else "N/A"
-
             is_active = _player_is_active(player)
 
-            # Check for ownership data to determine when player was actually added
-            ownership = player.get("ownership")
-            if ownership:
-                # Serialize if needed
-                if not isinstance(ownership, dict) and hasattr(ownership, "serialized"):
-                    ownership = ownership.serialized()
-                elif not isinstance(ownership, dict) and hasattr(ownership, "__dict__"):
-                    ownership = ownership.__dict__
+            if debug_enabled:
+                player_name = player.get("name", {})
+                if isinstance(player_name, dict):
+                    full_name = player_name.get("full", "Unknown")
+                else:
+                    full_name = str(player_name)
 
-                if isinstance(ownership, dict):
-                    # Check for transaction data within ownership
-                    # Note: The structure varies, but we're looking for acquisition date/time
-                    logger.debug(f"Player {full_name} ownership data: {ownership}")
+                # Get position for logging
+                selected_position = player.get("selected_position")
+                if isinstance(selected_position, dict):
+                    position = selected_position.get("position", "N/A")
+                else:
+                    position = selected_position if selected_position else "N/A"
+
+                # Check for ownership data to determine when player was actually added
+                ownership = player.get("ownership")
+                if ownership:
+                    # Serialize if needed
+                    if not isinstance(ownership, dict) and hasattr(ownership, "serialized"):
+                        ownership = ownership.serialized()
+                    elif not isinstance(ownership, dict) and hasattr(ownership, "__dict__"):
+                        ownership = ownership.__dict__
+
+                    if isinstance(ownership, dict):
+                        # Check for transaction data within ownership
+                        # Note: The structure varies, but we're looking for acquisition date/time
+                        logger.debug("Player %s ownership data: %s", full_name, ownership)
 
             # Yahoo API limitation workaround:
             # If this is the first date we see the player AND it's today or later,
@@ -411,10 +637,15 @@ def _build_player_active_dates(roster: Dict[str, List[dict]]) -> Dict[str, set]:
             if date_str < today <= first_seen_date:
                 continue
 
-            # Log position info for all players (can be filtered by log level)
-            logger.debug(
-                f"Date {date_str}: {full_name:30} | Position: {position:5} | Active: {is_active}"
-            )
+            if debug_enabled:
+                # Log position info for all players
+                logger.debug(
+                    "Date %s: %-30s | Position: %-5s | Active: %s",
+                    date_str,
+                    full_name,
+                    position,
+                    is_active,
+                )
 
             if is_active:
                 if player_key not in player_active_dates:
@@ -424,101 +655,279 @@ def _build_player_active_dates(roster: Dict[str, List[dict]]) -> Dict[str, set]:
     return player_active_dates
 
 
-def _season_stat_map(player: dict) -> Dict[str, float]:
-    """Extract season stat averages from a player dict."""
-    stats = player.get("player_stats", {})
+# Map stat names/abbreviations to boxscore cache field names (for season stats - lowercase).
+# The field names match the PlayerStats attributes used for non-season projections.
+_STAT_NAME_TO_CACHE: Dict[str, str] = {
+    # Percentage stats
+    "FG%": "fg_pct",
+    "FT%": "ft_pct",
+    # Counting stats - both abbreviations and full names
+    "3PTM": "threes",
+    "3PM": "threes",
+    "3-Point Baskets Made": "threes",
+    "PTS": "points",
+    "Points": "points",
+    "REB": "rebounds",
+    "Rebounds": "rebounds",
+    "AST": "assists",
+    "Assists": "assists",
+    "ST": "steals",
+    "STL": "steals",
+    "Steals": "steals",
+    "BLK": "blocks",
+    "Blocks": "blocks",
+    "TO": "turnovers",
+    "Turnovers": "turnovers",
+}
+
+# Map stat names/abbreviations to boxscore game field names (UPPERCASE)
+_STAT_NAME_TO_GAME_FIELD: Dict[str, str] = {
+    # Percentage stats - stored but not used directly
+    "FG%": "FG_PCT",
+    "FT%": "FT_PCT",
+    # Counting stats
+    "3PTM": "FG3M",
+    "3PM": "FG3M",
+    "PTS": "PTS",
+    "REB": "REB",
+    "AST": "AST",
+    "ST": "STL",
+    "STL": "STL",
+    "BLK": "BLK",
+    "TO": "TO",
+}
+
+
+class _StatCategory(NamedTuple):
+    """A scored stat category with every name-derived lookup resolved once."""
+
+    stat_id: str
+    name: str
+    is_percentage: bool
+    cache_field: Optional[str]  # season stats field, also the PlayerStats attribute
+    game_field: Optional[str]  # boxscore game field summed for counting stats
+    is_ascending: bool  # lower is better (e.g. turnovers)
+    tiebreak_volume_key: Optional[str]  # "_FGA"/"_FTA" for FG%/FT%, else None
+
+
+# Percentage categories whose ties are broken by shooting volume
+_TIEBREAK_VOLUME_KEYS = {"FG%": "_FGA", "FT%": "_FTA"}
+
+
+class _ProjectionPlan(NamedTuple):
+    """Stat categories resolved once for projection, aggregation and scoring."""
+
+    categories: Tuple[_StatCategory, ...]  # every scored category, in stat_meta order
+    stat_ids: Tuple[str, ...]  # every scored stat_id, in stat_meta order
+    counting_ids: Tuple[str, ...]  # every scored non-percentage stat_id
+    counting_fields: Tuple[Tuple[str, str], ...]  # (stat_id, boxscore game field)
+    fg_pct_ids: Tuple[str, ...]
+    ft_pct_ids: Tuple[str, ...]
+
+
+def _projection_plan(stat_meta: Sequence[Dict[str, object]]) -> _ProjectionPlan:
+    """Resolve the scored stat categories of stat_meta into a projection plan.
+
+    Display-only stats are excluded and stat names use the display_name -> name ->
+    abbr fallback. Built once per projection request and passed down to the helpers.
+    """
+    categories: List[_StatCategory] = []
+    for stat in stat_meta:
+        if stat.get("is_only_display_stat") == 1:
+            continue
+        stat_name = str(stat.get("display_name") or stat.get("name") or stat.get("abbr", ""))
+        categories.append(
+            _StatCategory(
+                str(stat.get("stat_id")),
+                stat_name,
+                "%" in stat_name,
+                _STAT_NAME_TO_CACHE.get(stat_name),
+                _STAT_NAME_TO_GAME_FIELD.get(stat_name),
+                stat.get("sort_order") in {"0", 0, "asc"},
+                _TIEBREAK_VOLUME_KEYS.get(stat_name),
+            )
+        )
+    return _ProjectionPlan(
+        categories=tuple(categories),
+        stat_ids=tuple(category.stat_id for category in categories),
+        counting_ids=tuple(
+            category.stat_id for category in categories if not category.is_percentage
+        ),
+        counting_fields=tuple(
+            (category.stat_id, category.game_field)
+            for category in categories
+            if not category.is_percentage and category.game_field
+        ),
+        fg_pct_ids=tuple(category.stat_id for category in categories if category.name == "FG%"),
+        ft_pct_ids=tuple(category.stat_id for category in categories if category.name == "FT%"),
+    )
 
-    # Serialize if it's a yfpy object
-    if not isinstance(stats, dict) and hasattr(stats, "serialized"):
-        stats = stats.serialized()
-    elif not isinstance(stats, dict) and hasattr(stats, "__dict__"):
-        stats = stats.__dict__
 
-    stat_entries = stats.get("stats") if isinstance(stats, dict) else stats
+def _apply_shooting_percentages(
+    totals: Dict[str, float],
+    plan: _ProjectionPlan,
+    fgm: float,
+    fga: float,
+    ftm: float,
+    fta: float,
+) -> None:
+    """Set the plan's FG%/FT% stats in totals from shooting volume."""
+    fg_pct = (fgm / fga) if fga > 0 else 0.0
+    ft_pct = (ftm / fta) if fta > 0 else 0.0
+    for stat_id in plan.fg_pct_ids:
+        totals[stat_id] = fg_pct
+    for stat_id in plan.ft_pct_ids:
+        totals[stat_id] = ft_pct
+
+
+def _project_season_stats(
+    cached_stats: Dict[str, float],
+    games_count: int,
+    categories: Sequence[_StatCategory],
+) -> Dict[str, float]:
+    """Scale cached per-game season averages into projected totals.
 
-    result: Dict[str, float] = {}
-    for stat in stat_entries or []:
-        # Serialize stat if it's a yfpy object
-        if not isinstance(stat, dict):
-            if hasattr(stat, "serialized"):
-                stat = stat.serialized()
-            elif hasattr(stat, "__dict__"):
-                stat = stat.__dict__
-
-        stat_obj = stat.get("stat") if isinstance(stat, dict) else stat
-
-        # Serialize stat_obj if it's a yfpy object
-        if not isinstance(stat_obj, dict):
-            if hasattr(stat_obj, "serialized"):
-                stat_obj = stat_obj.serialized()
-            elif hasattr(stat_obj, "__dict__"):
-                stat_obj = stat_obj.__dict__
-
-        if not isinstance(stat_obj, dict):
-            continue
+    Percentage stats are passed through unscaled; counting stats are multiplied
+    by the number of games. Stats without a cache field project to 0.0.
+    """
+    projected: Dict[str, float] = {}
+    for category in categories:
+        cache_field = category.cache_field
+        if not cache_field:
+            projected[category.stat_id] = 0.0
+        elif category.is_percentage:
+            projected[category.stat_id] = cached_stats.get(cache_field, 0.0)
+        else:
+            projected[category.stat_id] = cached_stats.get(cache_field, 0.0) * games_count
+    return projected
 
-        stat_id = str(stat_obj.get("stat_id"))
-        try:
-            value = float(stat_obj.get("value", 0.0))
-        except (TypeError, ValueError):
-            value = 0.0
-        result[stat_id] = value
 
-    return result
+def _project_season(
+    nba_id: int,
+    categories: Sequence[_StatCategory],
+    games_count: int,
+    season: str,
+    prefetched_season_stats: Optional[Dict[int, Optional[dict]]] = None,
+) -> Dict[str, float]:
+    """Project a player from cached season averages.
 
+    Uses the prefetched season stats when they include the player, otherwise
+    loads them from the boxscore cache. Missing stats project to 0.0.
+    """
+    if prefetched_season_stats is not None and nba_id in prefetched_season_stats:
+        cached_stats = prefetched_season_stats[nba_id]
+    else:
+        cached_stats = boxscore_cache.load_player_season_stats(nba_id, season)
 
-def _build_stat_name_to_cache_mapping() -> Dict[str, str]:
-    """Map stat names/abbreviations to boxscore cache field names (for season stats - lowercase)."""
-    return {
-        # Percentage stats
-        "FG%": "fg_pct",
-        "FT%": "ft_pct",
-        # Counting stats - both abbreviations and full names
-        "3PTM": "threes",
-        "3PM": "threes",
-        "3-Point Baskets Made": "threes",
-        "PTS": "points",
-        "Points": "points",
-        "REB": "rebounds",
-        "Rebounds": "rebounds",
-        "AST": "assists",
-        "Assists": "assists",
-        "ST": "steals",
-        "STL": "steals",
-        "Steals": "steals",
-        "BLK": "blocks",
-        "Blocks": "blocks",
-        "TO": "turnovers",
-        "Turnovers": "turnovers",
-    }
+    if not cached_stats:
+        return dict.fromkeys((category.stat_id for category in categories), 0.0)
 
+    return _project_season_stats(cached_stats, games_count, categories)
 
-def _build_stat_name_to_game_field_mapping() -> Dict[str, str]:
-    """Map stat names/abbreviations to boxscore game field names (UPPERCASE)."""
-    return {
-        # Percentage stats - stored but not used directly
-        "FG%": "FG_PCT",
-        "FT%": "FT_PCT",
-        # Counting stats
-        "3PTM": "FG3M",
-        "3PM": "FG3M",
-        "PTS": "PTS",
-        "REB": "REB",
-        "AST": "AST",
-        "ST": "STL",
-        "STL": "STL",
-        "BLK": "BLK",
-        "TO": "TO",
+
+def _prefetch_season_stats(
+    nba_ids: Iterable[Optional[int]], season: str
+) -> Dict[int, Optional[dict]]:
+    """Load cached season stats for many players concurrently.
+
+    Each load is an independent file read, so they are issued in parallel on the
+    shared I/O pool rather than one player at a time.
+
+    Args:
+        nba_ids: NBA player IDs (None entries are skipped)
+        season: NBA season string
+
+    Returns:
+        Dict mapping NBA player ID to season stats (None if not cached)
+    """
+    unique_ids = {nba_id for nba_id in nba_ids if nba_id}
+    if not unique_ids:
+        return {}
+
+    season_stats: Dict[int, Optional[dict]] = {}
+    futures = {
+        _io_pool().submit(boxscore_cache.load_player_season_stats, nba_id, season): nba_id
+        for nba_id in unique_ids
     }
+    for future in as_completed(futures):
+        season_stats[futures[future]] = future.result()
+    return season_stats
+
+
+def _prefetch_played_on(nba_ids: Iterable[int], season: str, game_date: str) -> Set[int]:
+    """Return the NBA IDs whose cached game index already has a game on game_date.
+
+    The per-player index reads are independent, so they run on the shared I/O pool.
+    """
+    unique_ids = list(dict.fromkeys(nba_ids))
+    flags = _io_pool().map(
+        lambda nba_id: boxscore_cache.player_has_game_on(nba_id, season, game_date),
+        unique_ids,
+    )
+    return {nba_id for nba_id, played in zip(unique_ids, flags) if played}
+
+
+def _compute_mode_stats(
+    nba_id: int,
+    season: str,
+    projection_mode: str,
+    stats_cache: Optional[Dict[Tuple[int, str], Optional[PlayerStats]]] = None,
+) -> Optional[PlayerStats]:
+    """Compute a player's per-game averages for projection_mode, reusing stats_cache.
+
+    Both the stat projection and the shooting projection need the same averages;
+    sharing one stats_cache across passes computes them once per player and mode.
+    """
+    key = (nba_id, projection_mode)
+    if stats_cache is not None and key in stats_cache:
+        return stats_cache[key]
+
+    player_stats = compute_player_stats(
+        player_id=nba_id,
+        season=season,
+        mode=projection_mode,
+        season_start=schedule_fetcher.get_season_start_date(season),
+        today=date.today(),
+        agg_mode="avg",  # Always get per-game averages for projection
+    )
+    if stats_cache is not None:
+        stats_cache[key] = player_stats
+    return player_stats
+
+
+def _prefetch_mode_stats(
+    nba_ids: Iterable[Optional[int]],
+    season: str,
+    projection_mode: str,
+    stats_cache: Dict[Tuple[int, str], Optional[PlayerStats]],
+) -> None:
+    """Compute per-mode stats for many players concurrently into stats_cache.
+
+    Each computation reads one player's cached game index, so they run on the
+    shared I/O pool; players already in stats_cache are skipped.
+    """
+    pending = [
+        nba_id
+        for nba_id in dict.fromkeys(nba_ids)
+        if nba_id and (nba_id, projection_mode) not in stats_cache
+    ]
+    computed = _io_pool().map(
+        lambda nba_id: _compute_mode_stats(nba_id, season, projection_mode), pending
+    )
+    for nba_id, player_stats in zip(pending, computed):
+        stats_cache[(nba_id, projection_mode)] = player_stats
 
 
 def _project_player_stats(
     league_key: str,
     player: dict,
     game_dates: Sequence[str],
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     season: str,
     projection_mode: str = "season",
+    prefetched_season_stats: Optional[Dict[int, Optional[dict]]] = None,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    stats_cache: Optional[Dict[Tuple[int, str], Optional[PlayerStats]]] = None,
 ) -> Dict[str, float]:
     """Project a player's stats for the given game dates using boxscore cache.
 
@@ -526,133 +935,85 @@ def _project_player_stats(
         league_key: Yahoo league key
         player: Player dict from roster
         game_dates: List of game date strings to project for
-        stat_meta: Stat category metadata
+        plan: Stat categories resolved by _projection_plan
         season: NBA season string
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
+        prefetched_season_stats: Optional NBA ID -> season stats map (see
+            _prefetch_season_stats); players missing from it are loaded from cache
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        stats_cache: Optional per-mode stats cache shared across passes (see _compute_mode_stats)
 
     Returns:
         Dict mapping stat_id to projected value
     """
     key = _player_key(player)
-    stat_ids = [
-        str(s.get("stat_id")) for s in stat_meta if s.get("is_only_display_stat") != 1
-    ]
 
     if not key or not game_dates:
-        return {stat_id: 0.0 for stat_id in stat_ids}
+        return dict.fromkeys(plan.stat_ids, 0.0)
 
     # Get player name and look up NBA ID
     player_name = player.get("name", {}).get("full", "")
-    nba_id = player_fetcher.player_id_lookup(player_name)
+    nba_id = _lookup_player_id(player_name, id_cache)
 
     if not nba_id:
-        return {stat_id: 0.0 for stat_id in stat_ids}
+        return dict.fromkeys(plan.stat_ids, 0.0)
+
+    categories = plan.categories
+    games_count = len(game_dates)
 
     # Determine which computation method to use based on projection_mode
     if projection_mode == "season":
-        # Fast path: use pre-computed season stats from cache
-        cached_stats = boxscore_cache.load_player_season_stats(nba_id, season)
-
-        if not cached_stats:
-            return {stat_id: 0.0 for stat_id in stat_ids}
-
-        # Build mapping from stat names to cache fields
-        name_to_cache = _build_stat_name_to_cache_mapping()
-
-        # Map stats dynamically based on stat category metadata
-        projected = {}
-        games_count = len(game_dates)
+        return _project_season(nba_id, categories, games_count, season, prefetched_season_stats)
 
-        for stat in stat_meta:
-            stat_id = str(stat.get("stat_id"))
-            if stat.get("is_only_display_stat") == 1:
-                continue
-
-            # Get stat name (try display_name, then name, then abbreviation)
-            stat_name = (
-                stat.get("display_name") or stat.get("name") or stat.get("abbr", "")
-            )
+    # Compute per-game averages using selected mode
+    player_stats = _compute_mode_stats(nba_id, season, projection_mode, stats_cache)
 
-            # Look up cache field name
-            cache_field = name_to_cache.get(stat_name)
-            if not cache_field:
-                projected[stat_id] = 0.0
-                continue
+    if not player_stats:
+        # Fallback to season stats if computation fails
+        return _project_season(nba_id, categories, games_count, season, prefetched_season_stats)
 
-            # Get value from cache
-            value = cached_stats.get(cache_field, 0.0)
+    # Map PlayerStats to stat_ids
+    projected = {}
 
-            # Check if this is a percentage stat
-            is_percentage = "%" in stat_name
+    # Boxscore cache field names double as PlayerStats attribute names, so the
+    # resolved cache_field names the attribute without a name ladder.
+    for category in categories:
+        if not category.cache_field:
+            projected[category.stat_id] = 0.0
+            continue
+        value = getattr(player_stats, category.cache_field)
+        projected[category.stat_id] = value if category.is_percentage else value * games_count
 
-            if is_percentage:
-                # For percentage stats, don't multiply by games
-                projected[stat_id] = value
-            else:
-                # For counting stats, multiply by number of games
-                projected[stat_id] = value * games_count
+    return projected
 
-        return projected
 
-    # Compute stats using compute_player_stats for other modes
-    season_start = schedule_fetcher.get_season_start_date(season)
-    today = date.today()
+# Shooting volume columns carried alongside the stat_id columns of team totals
+_SHOOTING_TOTAL_KEYS = ("_FGM", "_FGA", "_FTM", "_FTA")
 
-    # Compute per-game averages using selected mode
-    player_stats = compute_player_stats(
-        player_id=nba_id,
-        season=season,
-        mode=projection_mode,
-        season_start=season_start,
-        today=today,
-        agg_mode="avg",  # Always get per-game averages for projection
-    )
+# Shooting volume fields of season stats and player shooting rows, aligned with
+# _SHOOTING_TOTAL_KEYS
+_SHOOTING_FIELDS = ("fgm", "fga", "ftm", "fta")
 
-    if not player_stats:
-        # Fallback to season stats if computation fails
-        return _project_player_stats(
-            league_key, player, game_dates, stat_meta, season, "season"
-        )
 
-    # Map PlayerStats to stat_ids
-    projected = {}
-    games_count = len(game_dates)
+def _combine_team_totals(
+    current_totals: Dict[str, float],
+    remaining_totals: Dict[str, float],
+    plan: _ProjectionPlan,
+) -> Dict[str, float]:
+    """Add two team totals column by column and re-derive FG%/FT% from the combined volume.
 
-    for stat in stat_meta:
-        stat_id = str(stat.get("stat_id"))
-        if stat.get("is_only_display_stat") == 1:
-            continue
+    Both inputs use the layout of _sum_player_contributions_to_team_total: one
+    column per scored stat_id plus the _FGM/_FGA/_FTM/_FTA shooting columns.
+    """
+    # For counting stats and shooting volume: add current + remaining
+    totals = dict.fromkeys(plan.stat_ids, 0.0)
+    for key in plan.counting_ids + _SHOOTING_TOTAL_KEYS:
+        totals[key] = current_totals.get(key, 0.0) + remaining_totals.get(key, 0.0)
 
-        stat_name = (
-            stat.get("display_name") or stat.get("name") or stat.get("abbr", "")
-        )
-        is_percentage = "%" in stat_name
-
-        # Map stat names to PlayerStats attributes
-        if stat_name == "FG%":
-            projected[stat_id] = player_stats.fg_pct
-        elif stat_name == "FT%":
-            projected[stat_id] = player_stats.ft_pct
-        elif stat_name in ["3PTM", "3PM", "3-Point Baskets Made"]:
-            projected[stat_id] = player_stats.threes * (
-                1 if is_percentage else games_count
-            )
-        elif stat_name in ["PTS", "Points"]:
-            projected[stat_id] = player_stats.points * games_count
-        elif stat_name in ["REB", "Rebounds"]:
-            projected[stat_id] = player_stats.rebounds * games_count
-        elif stat_name in ["AST", "Assists"]:
-            projected[stat_id] = player_stats.assists * games_count
-        elif stat_name in ["ST", "STL", "Steals"]:
-            projected[stat_id] = player_stats.steals * games_count
-        elif stat_name in ["BLK", "Blocks"]:
-            projected[stat_id] = player_stats.blocks * games_count
-        elif stat_name in ["TO", "Turnovers"]:
-            projected[stat_id] = player_stats.turnovers * games_count
-        else:
-            projected[stat_id] = 0.0
+    # For percentage stats: recalculate from combined shooting volume
+    _apply_shooting_percentages(totals, plan, *(totals[key] for key in _SHOOTING_TOTAL_KEYS))
 
-    return projected
+    return totals
 
 
 def _project_team(
@@ -660,10 +1021,15 @@ def _project_team(
     roster: Dict[str, List[dict]],
     matchup_start: date,
     matchup_end: date,
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     season: str,
     projection_mode: str = "season",
     optimize_roster: bool = False,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
+    stats_cache: Optional[Dict[Tuple[int, str], Optional[PlayerStats]]] = None,
+    projected_contributions: Optional[Tuple[Dict[str, Dict[str, float]], Dict[str, dict]]] = None,
+    current_contributions: Optional[Tuple[Dict[str, Dict[str, float]], Dict[str, dict]]] = None,
 ) -> Dict[str, float]:
     """Project team stats by combining actual results + remaining projections.
 
@@ -679,150 +1045,124 @@ def _project_team(
         roster: Player roster by date
         matchup_start: Start date of matchup
         matchup_end: End date of matchup
-        stat_meta: Stat category metadata
+        plan: Stat categories resolved by _projection_plan
         season: NBA season string
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
         optimize_roster: If True, optimize roster positions for maximum active players
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        schedule_cache: Optional NBA ID/week -> schedule cache shared across passes (see _player_schedule)
+        stats_cache: Optional per-mode stats cache shared across passes (see _compute_mode_stats)
+        projected_contributions: Optional (contributions, shooting) already returned by
+            _aggregate_projected_contributions for the same arguments; computed here if omitted
+        current_contributions: Optional (contributions, shooting) already returned by
+            _aggregate_current_week_player_contributions without roster optimization;
+            computed here if omitted
 
     Returns:
         Dict mapping stat_id to projected team total (current + remaining)
     """
-    today = date.today()
-
-    # For past weeks, use actual game data instead of projections
-    if matchup_end < today:
-        # This is a past week - use actual data
-        (current_contributions, _, current_player_shooting, _, _, _) = (
+    # Actual contributions from games already played this week. These always use
+    # the real (non-optimized) lineups, since past days can't be re-optimized.
+    if current_contributions is None:
+        (current_player_contributions, _, current_player_shooting, _, _, _) = (
             _aggregate_current_week_player_contributions(
-                league_key, roster, matchup_start, matchup_end, stat_meta, season
+                league_key,
+                roster,
+                matchup_start,
+                matchup_end,
+                plan,
+                season,
+                id_cache=id_cache,
+                schedule_cache=schedule_cache,
             )
         )
-        # Sum up the actual contributions
-        return _sum_player_contributions_to_team_total(
-            current_contributions, current_player_shooting, stat_meta
-        )
+    else:
+        current_player_contributions, current_player_shooting = current_contributions
+    current_totals = _sum_player_contributions_to_team_total(
+        current_player_contributions, current_player_shooting, plan
+    )
+
+    # For past weeks, the actual data is the whole result
+    if matchup_end < date.today():
+        return current_totals
 
     # For current/future weeks, combine actual stats from games played + remaining projections
     # This ensures projected totals are always >= current totals
     logger.info(
         f"Projecting team for current/future week: {matchup_start.isoformat()} to {matchup_end.isoformat()}"
     )
-
-    # 1. Get actual contributions from games already played this week
-    (current_contributions, _, current_player_shooting, _, _, _) = (
-        _aggregate_current_week_player_contributions(
-            league_key, roster, matchup_start, matchup_end, stat_meta, season
-        )
-    )
-    current_totals = _sum_player_contributions_to_team_total(
-        current_contributions, current_player_shooting, stat_meta
-    )
     logger.info(
-        f"Current totals calculated from actual games played: {len(current_contributions)} players"
+        f"Current totals calculated from actual games played: {len(current_player_contributions)} players"
     )
 
     # 2. Get remaining projections for games yet to be played
-    (proj_contributions, _, _, _, proj_player_shooting, _, _, _) = (
-        _aggregate_projected_contributions(
-            league_key,
-            roster,
-            matchup_start,
-            matchup_end,
-            stat_meta,
-            season,
-            projection_mode,
-            optimize_roster,
+    if projected_contributions is None:
+        (proj_contributions, _, _, _, proj_player_shooting, _, _, _) = (
+            _aggregate_projected_contributions(
+                league_key,
+                roster,
+                matchup_start,
+                matchup_end,
+                plan,
+                season,
+                projection_mode,
+                optimize_roster,
+                id_cache,
+                schedule_cache,
+                stats_cache,
+            )
         )
-    )
+    else:
+        proj_contributions, proj_player_shooting = projected_contributions
     remaining_totals = _sum_player_contributions_to_team_total(
-        proj_contributions, proj_player_shooting, stat_meta
+        proj_contributions, proj_player_shooting, plan
     )
     logger.info(
         f"Remaining projections calculated: {len(proj_contributions)} players"
     )
 
     # 3. Combine current + remaining for total projection
-    stat_ids = [
-        str(s.get("stat_id")) for s in stat_meta if s.get("is_only_display_stat") != 1
-    ]
-
-    # Find percentage stat IDs dynamically
-    percentage_stat_ids = set()
-    for stat in stat_meta:
-        if stat.get("is_only_display_stat") == 1:
-            continue
-        stat_name = stat.get("display_name") or stat.get("name") or ""
-        if "%" in stat_name:
-            percentage_stat_ids.add(str(stat.get("stat_id")))
-
-    # Combine stats
-    totals = {stat_id: 0.0 for stat_id in stat_ids}
-
-    # For counting stats: add current + remaining
-    for stat_id in stat_ids:
-        if stat_id not in percentage_stat_ids:
-            totals[stat_id] = current_totals.get(stat_id, 0.0) + remaining_totals.get(
-                stat_id, 0.0
-            )
-
-    # For percentage stats: recalculate from combined shooting volume
-    # Combine FGM/FGA and FTM/FTA from both current and remaining
-    total_fgm = current_totals.get("_FGM", 0.0) + remaining_totals.get("_FGM", 0.0)
-    total_fga = current_totals.get("_FGA", 0.0) + remaining_totals.get("_FGA", 0.0)
-    total_ftm = current_totals.get("_FTM", 0.0) + remaining_totals.get("_FTM", 0.0)
-    total_fta = current_totals.get("_FTA", 0.0) + remaining_totals.get("_FTA", 0.0)
-
-    # Calculate percentage values from combined shooting volume
-    for stat in stat_meta:
-        stat_id = str(stat.get("stat_id"))
-        if stat.get("is_only_display_stat") == 1:
-            continue
-        stat_name = stat.get("display_name") or stat.get("name") or ""
-
-        if stat_name == "FG%":
-            totals[stat_id] = (total_fgm / total_fga) if total_fga > 0 else 0.0
-        elif stat_name == "FT%":
-            totals[stat_id] = (total_ftm / total_fta) if total_fta > 0 else 0.0
-
-    # Add shooting volume stats as special keys
-    totals["_FGM"] = total_fgm
-    totals["_FGA"] = total_fga
-    totals["_FTM"] = total_ftm
-    totals["_FTA"] = total_fta
+    totals = _combine_team_totals(current_totals, remaining_totals, plan)
 
     logger.info("Combined projection complete. Total projection calculated.")
     return totals
 
 
-def _extract_team_stats(team_data: dict) -> Dict[str, float]:
-    stats_container = team_data.get("team_stats")
-    if hasattr(stats_container, "serialized"):
-        stats_container = stats_container.serialized()
-    stats_list = []
-    if isinstance(stats_container, dict):
-        stats_list = stats_container.get("stats", [])
-    elif hasattr(stats_container, "stats"):
-        stats_list = stats_container.stats
-
+def _stat_entries_to_map(stat_entries: Optional[Iterable[object]]) -> Dict[str, float]:
+    """Map Yahoo stat entries (dicts, {"stat": ...} wrappers or yfpy Stats) to stat_id -> value."""
     result: Dict[str, float] = {}
-    for stat_entry in stats_list or []:
-        stat_obj = stat_entry
+    for stat_entry in stat_entries or ():
         if isinstance(stat_entry, dict):
             stat_obj = stat_entry.get("stat", stat_entry)
+            if not isinstance(stat_obj, dict):
+                continue
         elif hasattr(stat_entry, "serialized"):
             stat_obj = stat_entry.serialized()
-
-        if not isinstance(stat_obj, dict):
+            if not isinstance(stat_obj, dict):
+                continue
+        else:
             continue
-        stat_id = str(stat_obj.get("stat_id"))
+        get = stat_obj.get
         try:
-            value = float(stat_obj.get("value", 0.0))
+            value = float(get("value", 0.0))
         except (TypeError, ValueError):
             value = 0.0
-        result[stat_id] = value
+        result[str(get("stat_id"))] = value
     return result
 
 
+def _extract_team_stats(team_data: dict) -> Dict[str, float]:
+    stats_container = team_data.get("team_stats")
+    if hasattr(stats_container, "serialized"):
+        stats_container = stats_container.serialized()
+    stats_list = []
+    if isinstance(stats_container, dict):
+        stats_list = stats_container.get("stats", [])
+    elif hasattr(stats_container, "stats"):
+        stats_list = stats_container.stats
+    return _stat_entries_to_map(stats_list)
+
+
 def _extract_player_stats(player: dict) -> Dict[str, float]:
     stats_container = player.get("player_stats", {})
     if hasattr(stats_container, "serialized"):
@@ -832,22 +1172,7 @@ def _extract_player_stats(player: dict) -> Dict[str, float]:
         if isinstance(stats_container, dict)
         else stats_container
     )
-    result: Dict[str, float] = {}
-    for stat_entry in stat_entries or []:
-        stat_obj = stat_entry
-        if isinstance(stat_entry, dict):
-            stat_obj = stat_entry.get("stat", stat_entry)
-        elif hasattr(stat_entry, "serialized"):
-            stat_obj = stat_entry.serialized()
-        if not isinstance(stat_obj, dict):
-            continue
-        stat_id = str(stat_obj.get("stat_id"))
-        try:
-            value = float(stat_obj.get("value", 0.0))
-        except (TypeError, ValueError):
-            value = 0.0
-        result[stat_id] = value
-    return result
+    return _stat_entries_to_map(stat_entries)
 
 
 def _extract_team_points(team_data: dict) -> Dict[str, float]:
@@ -890,14 +1215,47 @@ def _aggregate_player_contributions(
     return contributions, player_names
 
 
+def _empty_current_week_result(
+    unique_players: Dict[str, dict],
+    stat_ids: Sequence[str],
+    todays_roster_players: Set[str],
+) -> Tuple[
+    Dict[str, Dict[str, float]],
+    Dict[str, str],
+    Dict[str, dict],
+    Dict[str, bool],
+    Dict[str, int],
+    Dict[str, Optional[int]],
+]:
+    """Build the all-zero current-week result for every player.
+
+    Returned as-is when no games have been played yet, and used as the starting
+    point that players with counted games overwrite.
+    """
+    zero_stats = dict.fromkeys(stat_ids, 0.0)
+    return (
+        {player_key: zero_stats.copy() for player_key in unique_players},
+        {
+            player_key: player.get("name", {}).get("full", "")
+            for player_key, player in unique_players.items()
+        },
+        {player_key: {} for player_key in unique_players},
+        {player_key: player_key in todays_roster_players for player_key in unique_players},
+        dict.fromkeys(unique_players, 0),
+        dict.fromkeys(unique_players),
+    )
+
+
 def _aggregate_current_week_player_contributions(
     _league_key: str,
     roster: Dict[str, List[dict]],
     week_start: date,
     week_end: date,
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     _season: str,
     optimize_roster: bool = False,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
 ) -> Tuple[
     Dict[str, Dict[str, float]],
     Dict[str, str],
@@ -916,9 +1274,11 @@ def _aggregate_current_week_player_contributions(
         roster: Player roster by date
         week_start: Start date of week
         week_end: End date of week
-        stat_meta: Stat category metadata
+        plan: Stat categories resolved by _projection_plan
         _season: NBA season string
         optimize_roster: If True, optimize roster positions for maximum active players
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        schedule_cache: Optional NBA ID/week -> schedule cache shared across passes (see _player_schedule)
 
     Returns:
         Tuple of (contributions, player_names, player_shooting, is_on_roster_today, player_games_played, player_ids) where:
@@ -929,23 +1289,16 @@ def _aggregate_current_week_player_contributions(
         - player_games_played: number of games played this week while in active roster spot
         - player_ids: player key to NBA player ID mapping
     """
-    stat_ids = [
-        str(s.get("stat_id")) for s in stat_meta if s.get("is_only_display_stat") != 1
-    ]
-
-    contributions: Dict[str, Dict[str, float]] = {}
-    player_names: Dict[str, str] = {}
-    player_shooting: Dict[str, dict] = {}
-    is_on_roster_today: Dict[str, bool] = {}
-    player_games_played: Dict[str, int] = {}
-    player_ids: Dict[str, Optional[int]] = {}
+    stat_ids = plan.stat_ids
+    keyed_roster = _keyed_roster(roster)
+    unique_players = _dedup_players(keyed_roster)
 
     # Get today to determine what games have been played
     today = date.today()
 
     # Get the most recent roster to check which players are on the team
     # Use today's roster or the most recent past date (don't use future dates)
-    todays_roster_players = set()
+    todays_roster_players: Set[str] = set()
     if roster:
         # Get the most recent date that's <= today (don't use future roster dates)
         today_str = today.isoformat()
@@ -955,39 +1308,9 @@ def _aggregate_current_week_player_contributions(
             most_recent_date = min(roster.keys())
         else:
             most_recent_date = max(past_dates)
-        for player in roster[most_recent_date]:
-            player_key = _player_key(player)
-            if player_key:
-                todays_roster_players.add(player_key)
-
-    # Only fetch games from the week that have actually been played
-    # If today is before week_start, no games have been played yet
-    if today < week_start:
-        # Week hasn't started yet, return zeros for everyone
-        unique_players: Dict[str, dict] = {}
-        for players in roster.values():
-            for player in players:
-                player_key = _player_key(player)
-                if player_key and player_key not in unique_players:
-                    unique_players[player_key] = player
-
-        for player_key, player in unique_players.items():
-            player_names[player_key] = player.get("name", {}).get("full", "")
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
-            player_shooting[player_key] = {}
-            is_on_roster_today[player_key] = player_key in todays_roster_players
-            player_games_played[player_key] = 0
-            player_ids[player_key] = None
-
-        return (
-            contributions,
-            player_names,
-            player_shooting,
-            is_on_roster_today,
-            player_games_played,
-            player_ids,
-        )
+        todays_roster_players = {player_key for player_key, _ in keyed_roster[most_recent_date]}
 
+    # Only fetch games from the week that have actually been played.
     # Include games from week_start through today. Today's game is counted only when its
     # boxscore is already cached: fetch_player_stats_from_cache returns cached games only,
     # so a game that hasn't been played (or saved) yet contributes nothing here. This is
@@ -997,137 +1320,86 @@ def _aggregate_current_week_player_contributions(
     # current-week totals (old cutoff = yesterday) and the projection (double-exclusion).
     fetch_end = min(week_end, today)
 
-    # If we haven't had any completed days in the week yet, return zeros
+    # Week hasn't started yet (today < week_start), so return zeros for everyone
     if fetch_end < week_start:
-        unique_players: Dict[str, dict] = {}
-        for players in roster.values():
-            for player in players:
-                player_key = _player_key(player)
-                if player_key and player_key not in unique_players:
-                    unique_players[player_key] = player
-
-        for player_key, player in unique_players.items():
-            player_names[player_key] = player.get("name", {}).get("full", "")
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
-            player_shooting[player_key] = {}
-            is_on_roster_today[player_key] = player_key in todays_roster_players
-            player_games_played[player_key] = 0
-            player_ids[player_key] = None
-
-        return (
-            contributions,
-            player_names,
-            player_shooting,
-            is_on_roster_today,
-            player_games_played,
-            player_ids,
-        )
-
-    # Deduplicate players
-    unique_players: Dict[str, dict] = {}
-    for players in roster.values():
-        for player in players:
-            player_key = _player_key(player)
-            if player_key and player_key not in unique_players:
-                unique_players[player_key] = player
-
-    # Build mapping from stat names to game field names (UPPERCASE)
-    stat_name_to_field = _build_stat_name_to_game_field_mapping()
+        return _empty_current_week_result(unique_players, stat_ids, todays_roster_players)
 
     # Build mapping of which dates each player was active
     if optimize_roster:
         # Unpack tuple - we only need active_dates_map here, ignore optimized_positions_by_date
-        active_dates_map, _ = _build_optimized_player_active_dates(_league_key, roster, week_start, week_end, _season)
+        active_dates_map, _ = _build_optimized_player_active_dates(
+            _league_key, roster, week_start, week_end, _season, id_cache, schedule_cache
+        )
     else:
         active_dates_map = _build_player_active_dates(roster)
 
-    for player_key, player in unique_players.items():
-        player_name = player.get("name", {}).get("full", "")
-        player_names[player_key] = player_name
-        is_on_roster_today[player_key] = player_key in todays_roster_players
+    # Resolve NBA IDs up front, then read every player's cached games for the
+    # week in one parallel wave
+    resolved_ids: Dict[str, Optional[int]] = {
+        player_key: _lookup_player_id(player.get("name", {}).get("full", ""), id_cache)
+        for player_key, player in unique_players.items()
+    }
+    fetch_ids = list(dict.fromkeys(nba_id for nba_id in resolved_ids.values() if nba_id))
+    games_by_id = dict(
+        zip(
+            fetch_ids,
+            _io_pool().map(
+                lambda nba_id: player_fetcher.fetch_player_stats_from_cache(
+                    nba_id, _season, week_start, fetch_end
+                ),
+                fetch_ids,
+            ),
+        )
+    )
 
-        nba_id = player_fetcher.player_id_lookup(player_name)
-        player_ids[player_key] = nba_id
+    # Every player starts from the zero line; only players with a resolved NBA ID
+    # and cached games this week are filled in below (keeping roster order).
+    (
+        contributions,
+        player_names,
+        player_shooting,
+        is_on_roster_today,
+        player_games_played,
+        player_ids,
+    ) = _empty_current_week_result(unique_players, stat_ids, todays_roster_players)
+    player_ids.update(resolved_ids)
+
+    for player_key, nba_id in resolved_ids.items():
         if not nba_id:
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
-            player_shooting[player_key] = {}
-            player_games_played[player_key] = 0
             continue
 
         # Get dates when this player was active (on roster and not benched/IL)
-        active_dates = active_dates_map.get(player_key, set())
+        active_dates = active_dates_map.get(player_key, _NO_ACTIVE_DATES)
 
-        # Fetch only games that have actually been played (from week_start up to and including today)
-        games_this_week = player_fetcher.fetch_player_stats_from_cache(
-            nba_id, _season, week_start, fetch_end
-        )
+        # Only games that have actually been played (from week_start up to and including today)
+        games_this_week = games_by_id[nba_id]
+        if not games_this_week:
+            continue
 
         # Debug: Check if player has games but no active dates (indicating they're in IL/BN all week)
-        if games_this_week and not active_dates:
+        if not active_dates:
             logger.warning(
-                f"Player {player_name} has {len(games_this_week)} games this week but zero active dates. "
+                f"Player {player_names[player_key]} has {len(games_this_week)} games this week but zero active dates. "
                 f"This suggests they were in BN/IL/IL+ for all dates in the week."
             )
 
-        if not games_this_week:
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
-            player_shooting[player_key] = {}
-            player_games_played[player_key] = 0
-            continue
-
-        # Aggregate stats from games played this week
-        totals = {stat_id: 0.0 for stat_id in stat_ids}
-        total_fgm = 0.0
-        total_fga = 0.0
-        total_ftm = 0.0
-        total_fta = 0.0
-
-        games_counted = 0
-        for game in games_this_week:
-            # Only count games from dates when player was active on roster
-            game_date = game.get("date", "")
-            if game_date not in active_dates:
-                continue
-
-            games_counted += 1
-
-            total_fgm += float(game.get("FGM", 0))
-            total_fga += float(game.get("FGA", 0))
-            total_ftm += float(game.get("FTM", 0))
-            total_fta += float(game.get("FTA", 0))
-
-            # Accumulate counting stats
-            for stat in stat_meta:
-                stat_id = str(stat.get("stat_id"))
-                if stat.get("is_only_display_stat") == 1:
-                    continue
-
-                stat_name = (
-                    stat.get("display_name") or stat.get("name") or stat.get("abbr", "")
-                )
-                field_name = stat_name_to_field.get(stat_name)
-
-                if not field_name:
-                    continue
-
-                # For counting stats, sum them up
-                if "%" not in stat_name:
-                    totals[stat_id] += float(game.get(field_name, 0))
+        # Only count games from dates when player was active on roster
+        active_games = [game for game in games_this_week if game.get("date", "") in active_dates]
+        games_counted = len(active_games)
+
+        # Aggregate stats from games played this week, one stat column at a time.
+        # Box score counting fields are cached as JSON numbers, so the 0.0 start
+        # value is enough to produce float totals without casting each field.
+        totals = dict.fromkeys(stat_ids, 0.0)
+        for stat_id, field_name in plan.counting_fields:
+            totals[stat_id] = sum((game.get(field_name, 0) for game in active_games), 0.0)
+        total_fgm = sum((game.get("FGM", 0) for game in active_games), 0.0)
+        total_fga = sum((game.get("FGA", 0) for game in active_games), 0.0)
+        total_ftm = sum((game.get("FTM", 0) for game in active_games), 0.0)
+        total_fta = sum((game.get("FTA", 0) for game in active_games), 0.0)
 
         # Calculate percentage stats from totals
-        for stat in stat_meta:
-            stat_id = str(stat.get("stat_id"))
-            if stat.get("is_only_display_stat") == 1:
-                continue
-
-            stat_name = (
-                stat.get("display_name") or stat.get("name") or stat.get("abbr", "")
-            )
-
-            if stat_name == "FG%":
-                totals[stat_id] = (total_fgm / total_fga) if total_fga > 0 else 0.0
-            elif stat_name == "FT%":
-                totals[stat_id] = (total_ftm / total_fta) if total_fta > 0 else 0.0
+        _apply_shooting_percentages(totals, plan, total_fgm, total_fga, total_ftm, total_fta)
 
         contributions[player_key] = totals
         player_shooting[player_key] = {
@@ -1155,9 +1427,12 @@ def _compute_daily_player_contributions(
     roster: Dict[str, List[dict]],
     week_start: date,
     week_end: date,
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     season: str,
     optimized_positions_by_date: Optional[Dict[str, Dict[str, str]]] = None,
+    prefetched_season_stats: Optional[Dict[int, Optional[dict]]] = None,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
 ) -> Tuple[
     Dict[str, Dict[str, Dict[str, float]]],
     Dict[str, str],
@@ -1174,9 +1449,12 @@ def _compute_daily_player_contributions(
         roster: Player roster by date
         week_start: Start date of week
         week_end: End date of week
-        stat_meta: Stat category metadata
+        plan: Stat categories resolved by _projection_plan
         season: NBA season string
         optimized_positions_by_date: If provided, use these optimized positions (date -> player -> position) instead of Yahoo positions
+        prefetched_season_stats: Optional NBA ID -> season stats map; players missing from it are loaded from cache
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        schedule_cache: Optional NBA ID/week -> schedule cache shared across passes (see _player_schedule)
 
     Returns:
         Tuple of (remaining_days_projection, player_names, player_positions, player_ids) where:
@@ -1185,8 +1463,7 @@ def _compute_daily_player_contributions(
         - player_positions: Dict[player_key, Dict[date_str, str]] - position for each date
         - player_ids: Dict[player_key, Optional[int]] - player key to NBA player ID mapping
     """
-    # Build mapping from stat names to cache fields
-    name_to_cache = _build_stat_name_to_cache_mapping()
+    categories = plan.categories
 
     remaining_days_projection: Dict[str, Dict[str, Dict[str, float]]] = {}
     player_names: Dict[str, str] = {}
@@ -1199,10 +1476,9 @@ def _compute_daily_player_contributions(
     if optimized_positions_by_date:
         # Build active dates from optimized positions
         player_active_dates: Dict[str, set] = {}
-        inactive_positions = {"BN", "IL", "IL+"}
         for date_str, positions_map in optimized_positions_by_date.items():
             for player_key, position in positions_map.items():
-                if position not in inactive_positions:
+                if position not in _OPTIMIZED_INACTIVE_POSITIONS:
                     if player_key not in player_active_dates:
                         player_active_dates[player_key] = set()
                     player_active_dates[player_key].add(date_str)
@@ -1211,46 +1487,29 @@ def _compute_daily_player_contributions(
         player_active_dates = _build_player_active_dates(roster)
 
     # Build mapping of player positions per date from Yahoo (for fallback)
+    keyed_roster = _keyed_roster(roster)
     player_positions_by_date: Dict[str, Dict[str, str]] = {}
-    for date_str, players in roster.items():
-        for player in players:
-            player_key = _player_key(player)
-            if not player_key:
-                continue
-
-            # Get position
-            selected_position = player.get("selected_position")
-            if isinstance(selected_position, dict):
-                position = selected_position.get("position", "")
-            else:
-                position = selected_position if selected_position else ""
-
-            if player_key not in player_positions_by_date:
-                player_positions_by_date[player_key] = {}
-            player_positions_by_date[player_key][date_str] = position or ""
+    for date_str, positions_today in _roster_positions_by_date(keyed_roster).items():
+        for player_key, position in positions_today.items():
+            player_positions_by_date.setdefault(player_key, {})[date_str] = position
 
     # Deduplicate players
-    unique_players: Dict[str, dict] = {}
-    for players in roster.values():
-        for player in players:
-            player_key = _player_key(player)
-            if player_key and player_key not in unique_players:
-                unique_players[player_key] = player
+    unique_players = _dedup_players(keyed_roster)
 
+    week_start_str = week_start.isoformat()
+    week_end_str = week_end.isoformat()
     for player_key, player in unique_players.items():
         player_name = player.get("name", {}).get("full", "")
         player_names[player_key] = player_name
 
-        nba_id = player_fetcher.player_id_lookup(player_name)
+        nba_id = _lookup_player_id(player_name, id_cache)
         player_ids[player_key] = nba_id
         if not nba_id:
             remaining_days_projection[player_key] = {}
             player_positions[player_key] = {}
             continue
 
-        schedule = schedule_fetcher.fetch_player_upcoming_games_from_cache(
-            nba_id, week_start.isoformat(), week_end.isoformat(), season
-        )
+        schedule = _player_schedule(nba_id, week_start_str, week_end_str, season, schedule_cache)
 
         if not schedule.game_dates:
             remaining_days_projection[player_key] = {}
@@ -1258,17 +1517,32 @@ def _compute_daily_player_contributions(
             continue
 
         # Load season stats from cache
-        cached_stats = boxscore_cache.load_player_season_stats(nba_id, season)
+        if prefetched_season_stats is not None and nba_id in prefetched_season_stats:
+            cached_stats = prefetched_season_stats[nba_id]
+        else:
+            cached_stats = boxscore_cache.load_player_season_stats(nba_id, season)
         if not cached_stats:
             remaining_days_projection[player_key] = {}
             player_positions[player_key] = {}
             continue
 
+        # A player's projection is the same per-game line on every active date,
+        # so resolve it from the cached stats once and copy it per date.
+        per_game_stats: Dict[str, float] = {
+            category.stat_id: (
+                cached_stats.get(category.cache_field, 0.0) if category.cache_field else 0.0
+            )
+            for category in categories
+        }
+        # Add shooting volume stats (FGM/FGA, FTM/FTA) as special keys
+        for total_key, field in zip(_SHOOTING_TOTAL_KEYS, _SHOOTING_FIELDS):
+            per_game_stats[total_key] = cached_stats.get(field, 0.0)
+
         # For each game date, only project if player is ON THE ROSTER for that date
         # This includes both active positions and inactive positions (BN, IL, IL+)
         remaining_days_projection[player_key] = {}
         player_positions[player_key] = {}
-        active_dates = player_active_dates.get(player_key, set())
+        active_dates = player_active_dates.get(player_key, _NO_ACTIVE_DATES)
 
         # Get the dates when this player was actually on the roster
         roster_dates = player_positions_by_date.get(player_key, {})
@@ -1289,40 +1563,13 @@ def _compute_daily_player_contributions(
             # Check if player is active (not benched/IL) for this date
             is_active = game_date in active_dates
 
-            daily_stats = {}
-
             if is_active:
                 # Player is active - include actual projections
-                for stat in stat_meta:
-                    stat_id = str(stat.get("stat_id"))
-                    if stat.get("is_only_display_stat") == 1:
-                        continue
-
-                    # Get stat name and look up cache field
-                    stat_name = (
-                        stat.get("display_name")
-                        or stat.get("name")
-                        or stat.get("abbr", "")
-                    )
-                    cache_field = name_to_cache.get(stat_name)
-
-                    if not cache_field:
-                        daily_stats[stat_id] = 0.0
-                        continue
-
-                    # Get per-game value from cache
-                    value = cached_stats.get(cache_field, 0.0)
-                    daily_stats[stat_id] = value
-
-                # Add shooting volume stats (FGM/FGA, FTM/FTA) as special keys
-                daily_stats["_FGM"] = cached_stats.get("fgm", 0.0)
-                daily_stats["_FGA"] = cached_stats.get("fga", 0.0)
-                daily_stats["_FTM"] = cached_stats.get("ftm", 0.0)
-                daily_stats["_FTA"] = cached_stats.get("fta", 0.0)
+                daily_stats = dict(per_game_stats)
             else:
                 # Player is inactive (BN, IL, IL+) - add empty marker so frontend knows there's a game
                 # This allows the frontend to display the inactive position status
-                daily_stats["_INACTIVE"] = 1
+                daily_stats = {"_INACTIVE": 1}
 
             # Add entry for dates where player is on roster (whether active or inactive)
             remaining_days_projection[player_key][game_date] = daily_stats
@@ -1334,10 +1581,13 @@ def _aggregate_projected_contributions(
     roster: Dict[str, List[dict]],
     week_start: date,
     week_end: date,
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     season: str,
     projection_mode: str = "season",
     optimize_roster: bool = False,
+    id_cache: Optional[Dict[str, Optional[int]]] = None,
+    schedule_cache: Optional[Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule]] = None,
+    stats_cache: Optional[Dict[Tuple[int, str], Optional[PlayerStats]]] = None,
 ) -> Tuple[
     Dict[str, Dict[str, float]],
     Dict[str, str],
@@ -1355,17 +1605,18 @@ def _aggregate_projected_contributions(
         roster: Player roster by date
         week_start: Start date of week
         week_end: End date of week
-        stat_meta: Stat category metadata
+        plan: Stat categories resolved by _projection_plan
         season: NBA season string
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
         optimize_roster: If True, optimize roster positions for maximum active players
+        id_cache: Optional name -> NBA ID cache shared across passes (see _lookup_player_id)
+        schedule_cache: Optional NBA ID/week -> schedule cache shared across passes (see _player_schedule)
+        stats_cache: Optional per-mode stats cache shared across passes (see _compute_mode_stats)
 
     Returns:
         Tuple of (contributions, player_names, player_total_games, player_remaining_games, player_shooting, remaining_days_projection, player_positions, player_ids)
     """
-    stat_ids = [
-        str(s.get("stat_id")) for s in stat_meta if s.get("is_only_display_stat") != 1
-    ]
+    stat_ids = plan.stat_ids
 
     contributions: Dict[str, Dict[str, float]] = {}
     player_names: Dict[str, str] = {}
@@ -1374,46 +1625,97 @@ def _aggregate_projected_contributions(
     player_shooting: Dict[str, dict] = {}  # Store FGM/FGA, FTM/FTA
     player_ids: Dict[str, Optional[int]] = {}
 
-    # Get today's date for filtering remaining games
+    # Get today's date for filtering remaining games. ISO date strings order
+    # chronologically, so "after today" is the same as ">= tomorrow".
     today = date.today()
+    today_str = today.isoformat()
+    tomorrow_str = (today + timedelta(days=1)).isoformat()
 
     # Build mapping of which dates each player was active (on roster AND not benched/IL)
     optimized_positions_by_date: Optional[Dict[str, Dict[str, str]]] = None  # date -> player_key -> position
     if optimize_roster:
-        active_dates_map, optimized_positions_by_date = _build_optimized_player_active_dates(league_key, roster, week_start, week_end, season)
+        active_dates_map, optimized_positions_by_date = _build_optimized_player_active_dates(
+            league_key, roster, week_start, week_end, season, id_cache, schedule_cache
+        )
     else:
         active_dates_map = _build_player_active_dates(roster)
 
     # Deduplicate players
-    unique_players: Dict[str, dict] = {}
-    for players in roster.values():
-        for player in players:
-            player_key = _player_key(player)
-            if player_key and player_key not in unique_players:
-                unique_players[player_key] = player
+    unique_players = _dedup_players(_keyed_roster(roster))
+
+    # Resolve NBA IDs up front so season stats can be prefetched in one parallel wave
+    resolved_ids: Dict[str, Optional[int]] = {
+        player_key: _lookup_player_id(player.get("name", {}).get("full", ""), id_cache)
+        for player_key, player in unique_players.items()
+    }
+    season_stats_by_id = _prefetch_season_stats(resolved_ids.values(), season)
+
+    # Load every player's schedule in one parallel wave, then check today's
+    # boxscores for just the players who are active with a game today.
+    week_start_str = week_start.isoformat()
+    week_end_str = week_end.isoformat()
+    scheduled_keys = [player_key for player_key, nba_id in resolved_ids.items() if nba_id]
+    schedules: Dict[str, schedule_fetcher.PlayerSchedule] = dict(
+        zip(
+            scheduled_keys,
+            _io_pool().map(
+                lambda player_key: _player_schedule(
+                    resolved_ids[player_key], week_start_str, week_end_str, season, schedule_cache
+                ),
+                scheduled_keys,
+            ),
+        )
+    )
+    played_today = _prefetch_played_on(
+        {
+            resolved_ids[player_key]
+            for player_key, schedule in schedules.items()
+            if today_str in schedule.game_dates
+            and today_str in active_dates_map.get(player_key, _NO_ACTIVE_DATES)
+        },
+        season,
+        today_str,
+    )
+
+    # Other modes aggregate each player's recent games; every player with a
+    # scheduled game needs them, so compute them in one parallel wave too.
+    if projection_mode != "season":
+        if stats_cache is None:
+            stats_cache = {}
+        _prefetch_mode_stats(
+            (
+                resolved_ids[player_key]
+                for player_key, schedule in schedules.items()
+                if schedule.game_dates
+            ),
+            season,
+            projection_mode,
+            stats_cache,
+        )
+
+    # Players without an NBA ID or a schedule all get the same all-zero line
+    zero_line = dict.fromkeys(stat_ids, 0.0)
 
     for player_key, player in unique_players.items():
         player_name = player.get("name", {}).get("full", "")
         player_names[player_key] = player_name
 
-        nba_id = player_fetcher.player_id_lookup(player_name)
+        nba_id = resolved_ids[player_key]
         player_ids[player_key] = nba_id
         if not nba_id:
             logger.warning(
                 f"Player {player_name} - NBA ID lookup failed, setting contributions to 0"
             )
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
+            contributions[player_key] = dict(zero_line)
             player_total_games[player_key] = 0
             player_remaining_games[player_key] = 0
             player_shooting[player_key] = {}
             continue
 
-        schedule = schedule_fetcher.fetch_player_upcoming_games_from_cache(
-            nba_id, week_start.isoformat(), week_end.isoformat(), season
-        )
+        schedule = schedules[player_key]
 
         # Get dates when this player is active (on roster and not benched/IL)
-        active_dates = active_dates_map.get(player_key, set())
+        active_dates = active_dates_map.get(player_key, _NO_ACTIVE_DATES)
 
         # Calculate total games for the entire week (all scheduled games for the team)
         # This represents the total opportunity - how many games the player's team has
@@ -1431,28 +1733,16 @@ def _aggregate_projected_contributions(
             )
 
         # Check if today's game has a boxscore (to avoid double-counting)
-        today_str = today.isoformat()
-        today_has_boxscore = False
-        if today_str in schedule.game_dates and today_str in active_dates:
-            # Check if boxscore exists for today by looking at player's games
-            player_games_data = boxscore_cache.load_player_games(nba_id, season)
-            if player_games_data:
-                games_list = player_games_data.get("games", [])
-                # Check if any game in the list has today's date
-                today_has_boxscore = any(
-                    game.get("date") == today_str for game in games_list
-                )
+        today_has_boxscore = nba_id in played_today
 
         # Filter scheduled games to only include:
         # 1. Dates from today onwards (but exclude today if boxscore exists)
         # 2. Dates where player is in an active roster position
         # This prevents double-counting: if today's game has a boxscore, it's already
         # in current_player_contributions, so we exclude it from remaining projections
+        remaining_from = tomorrow_str if today_has_boxscore else today_str
         remaining_active_dates = [
-            d
-            for d in schedule.game_dates
-            if d in active_dates
-            and ((d > today_str) or (d == today_str and not today_has_boxscore))
+            d for d in schedule.game_dates if d >= remaining_from and d in active_dates
         ]
         num_remaining_games = len(remaining_active_dates)
         player_remaining_games[player_key] = num_remaining_games
@@ -1466,7 +1756,7 @@ def _aggregate_projected_contributions(
             )
 
         if not schedule.game_dates:
-            contributions[player_key] = {stat_id: 0.0 for stat_id in stat_ids}
+            contributions[player_key] = dict(zero_line)
             player_shooting[player_key] = {}
             continue
 
@@ -1475,119 +1765,80 @@ def _aggregate_projected_contributions(
             league_key,
             player,
             remaining_active_dates,
-            stat_meta,
+            plan,
             season,
             projection_mode,
+            season_stats_by_id,
+            id_cache,
+            stats_cache,
         )
         contributions[player_key] = projected
 
-        # Fetch shooting stats - use appropriate mode
+        # Per-game shooting averages (FGM, FGA, FTM, FTA) for the selected mode
+        shooting_averages: Optional[Tuple[float, ...]] = None
         if projection_mode == "season":
             # Fast path: use pre-computed season stats
-            cached_stats = boxscore_cache.load_player_season_stats(nba_id, season)
-
+            cached_stats = season_stats_by_id.get(nba_id)
             if cached_stats:
-                # Multiply by remaining active games count to get projected totals
-                projected_fgm = cached_stats.get("fgm", 0.0) * num_remaining_games
-                projected_fga = cached_stats.get("fga", 0.0) * num_remaining_games
-                projected_ftm = cached_stats.get("ftm", 0.0) * num_remaining_games
-                projected_fta = cached_stats.get("fta", 0.0) * num_remaining_games
-
-                # Calculate percentages from projected totals, not season averages
-                calculated_fg_pct = (
-                    projected_fgm / projected_fga if projected_fga > 0 else 0.0
+                shooting_averages = tuple(
+                    cached_stats.get(field, 0.0) for field in _SHOOTING_FIELDS
                 )
-                calculated_ft_pct = (
-                    projected_ftm / projected_fta if projected_fta > 0 else 0.0
-                )
-
-                player_shooting[player_key] = {
-                    "fgm": projected_fgm,
-                    "fga": projected_fga,
-                    "fg_pct": calculated_fg_pct,
-                    "ftm": projected_ftm,
-                    "fta": projected_fta,
-                    "ft_pct": calculated_ft_pct,
-                }
-
-                # Update percentage values in contributions dict to match calculated values
-                for stat in stat_meta:
-                    stat_id = str(stat.get("stat_id"))
-                    stat_name = stat.get("display_name") or stat.get("name") or ""
-                    if stat_name == "FG%":
-                        contributions[player_key][stat_id] = calculated_fg_pct
-                    elif stat_name == "FT%":
-                        contributions[player_key][stat_id] = calculated_ft_pct
-            else:
-                player_shooting[player_key] = {}
         else:
             # Compute shooting stats using the selected mode
-            season_start = schedule_fetcher.get_season_start_date(season)
-            today = date.today()
-            player_stats = compute_player_stats(
-                player_id=nba_id,
-                season=season,
-                mode=projection_mode,
-                season_start=season_start,
-                today=today,
-                agg_mode="avg",
-            )
-
+            player_stats = _compute_mode_stats(nba_id, season, projection_mode, stats_cache)
             if player_stats:
-                # Calculate projected totals from per-game averages
-                projected_fgm = (
-                    player_stats.fgm / player_stats.games_count * num_remaining_games
-                    if player_stats.games_count > 0
-                    else 0.0
-                )
-                projected_fga = (
-                    player_stats.fga / player_stats.games_count * num_remaining_games
-                    if player_stats.games_count > 0
-                    else 0.0
-                )
-                projected_ftm = (
-                    player_stats.ftm / player_stats.games_count * num_remaining_games
-                    if player_stats.games_count > 0
-                    else 0.0
-                )
-                projected_fta = (
-                    player_stats.fta / player_stats.games_count * num_remaining_games
-                    if player_stats.games_count > 0
-                    else 0.0
+                games_count = player_stats.games_count
+                shooting_averages = (
+                    tuple(
+                        total / games_count
+                        for total in (
+                            player_stats.fgm,
+                            player_stats.fga,
+                            player_stats.ftm,
+                            player_stats.fta,
+                        )
+                    )
+                    if games_count > 0
+                    else (0.0, 0.0, 0.0, 0.0)
                 )
 
-                # Calculate percentages from projected totals, not season averages
-                calculated_fg_pct = (
-                    projected_fgm / projected_fga if projected_fga > 0 else 0.0
-                )
-                calculated_ft_pct = (
-                    projected_ftm / projected_fta if projected_fta > 0 else 0.0
-                )
+        if shooting_averages is None:
+            player_shooting[player_key] = {}
+            continue
 
-                player_shooting[player_key] = {
-                    "fgm": projected_fgm,
-                    "fga": projected_fga,
-                    "fg_pct": calculated_fg_pct,
-                    "ftm": projected_ftm,
-                    "fta": projected_fta,
-                    "ft_pct": calculated_ft_pct,
-                }
-
-                # Update percentage values in contributions dict to match calculated values
-                for stat in stat_meta:
-                    stat_id = str(stat.get("stat_id"))
-                    stat_name = stat.get("display_name") or stat.get("name") or ""
-                    if stat_name == "FG%":
-                        contributions[player_key][stat_id] = calculated_fg_pct
-                    elif stat_name == "FT%":
-                        contributions[player_key][stat_id] = calculated_ft_pct
-            else:
-                player_shooting[player_key] = {}
+        # Multiply by remaining active games count to get projected totals
+        projected_fgm, projected_fga, projected_ftm, projected_fta = (
+            average * num_remaining_games for average in shooting_averages
+        )
+
+        # Calculate percentages from projected totals, not season averages
+        player_shooting[player_key] = {
+            "fgm": projected_fgm,
+            "fga": projected_fga,
+            "fg_pct": projected_fgm / projected_fga if projected_fga > 0 else 0.0,
+            "ftm": projected_ftm,
+            "fta": projected_fta,
+            "ft_pct": projected_ftm / projected_fta if projected_fta > 0 else 0.0,
+        }
+
+        # Update percentage values in contributions dict to match calculated values
+        _apply_shooting_percentages(
+            contributions[player_key], plan, projected_fgm, projected_fga, projected_ftm, projected_fta
+        )
 
     # Compute daily breakdown
     remaining_days_projection, _, player_positions, _ = (
         _compute_daily_player_contributions(
-            league_key, roster, week_start, week_end, stat_meta, season, optimized_positions_by_date
+            league_key,
+            roster,
+            week_start,
+            week_end,
+            plan,
+            season,
+            optimized_positions_by_date,
+            prefetched_season_stats=season_stats_by_id,
+            id_cache=id_cache,
+            schedule_cache=schedule_cache,
         )
     )
 
@@ -1622,8 +1873,12 @@ def _ensure_team_key(team_key: object) -> Optional[str]:
     return None
 
 
+# Values closer than this are a tie (accounting for float precision)
+_TIE_TOLERANCE = 0.001
+
+
 def _calculate_projected_points(
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
     team_a_projection: Dict[str, float],
     team_b_projection: Dict[str, float],
 ) -> Tuple[Dict[str, float], Dict[str, float]]:
@@ -1632,71 +1887,49 @@ def _calculate_projected_points(
     For FG% and FT% ties, uses volume (FGA/FTA) as tiebreaker - larger volume wins.
     For other stats, ties count as ties (not 0.5 points each).
     """
-    team_a_points = {"win": 0.0, "loss": 0.0, "tie": 0.0}
-    team_b_points = {"win": 0.0, "loss": 0.0, "tie": 0.0}
-
-    for stat in stat_meta:
-        stat_id = str(stat.get("stat_id"))
-        if stat.get("is_only_display_stat") == 1:
-            continue
-
-        stat_name = stat.get("display_name") or stat.get("name") or ""
-        a_value = team_a_projection.get(stat_id, 0.0)
-        b_value = team_b_projection.get(stat_id, 0.0)
-
-        # Determine if lower is better (ascending stat like turnovers)
-        is_ascending = stat.get("sort_order") in {"0", 0, "asc"}
-
-        if abs(a_value - b_value) < 0.001:  # Tie (accounting for float precision)
-            # For FG% and FT% ties, use volume as tiebreaker
-            if stat_name == "FG%":
-                a_volume = team_a_projection.get("_FGA", 0.0)
-                b_volume = team_b_projection.get("_FGA", 0.0)
-                if abs(a_volume - b_volume) > 0.001:
-                    # Higher volume wins the tiebreaker
-                    if a_volume > b_volume:
-                        team_a_points["win"] += 1.0
-                        team_b_points["loss"] += 1.0
-                    else:
-                        team_b_points["win"] += 1.0
-                        team_a_points["loss"] += 1.0
-                else:
-                    # True tie - both volumes equal
-                    team_a_points["tie"] += 1.0
-                    team_b_points["tie"] += 1.0
-            elif stat_name == "FT%":
-                a_volume = team_a_projection.get("_FTA", 0.0)
-                b_volume = team_b_projection.get("_FTA", 0.0)
-                if abs(a_volume - b_volume) > 0.001:
-                    # Higher volume wins the tiebreaker
-                    if a_volume > b_volume:
-                        team_a_points["win"] += 1.0
-                        team_b_points["loss"] += 1.0
-                    else:
-                        team_b_points["win"] += 1.0
-                        team_a_points["loss"] += 1.0
-                else:
-                    # True tie - both volumes equal
-                    team_a_points["tie"] += 1.0
-                    team_b_points["tie"] += 1.0
+    # Each category scores +1 (team A wins), -1 (team B wins) or 0 (tie)
+    a_wins = b_wins = ties = 0
+    for category in plan.categories:
+        a_value = team_a_projection.get(category.stat_id, 0.0)
+        b_value = team_b_projection.get(category.stat_id, 0.0)
+
+        if abs(a_value - b_value) < _TIE_TOLERANCE:
+            # For FG% and FT% ties, higher volume (FGA/FTA) wins the tiebreaker
+            volume_key = category.tiebreak_volume_key
+            if volume_key is None:
+                outcome = 0
             else:
-                # Other stats: count as a tie
-                team_a_points["tie"] += 1.0
-                team_b_points["tie"] += 1.0
-        elif (a_value > b_value and not is_ascending) or (
-            a_value < b_value and is_ascending
-        ):
-            # Team A wins
-            team_a_points["win"] += 1.0
-            team_b_points["loss"] += 1.0
+                a_volume = team_a_projection.get(volume_key, 0.0)
+                volume_diff = a_volume - team_b_projection.get(volume_key, 0.0)
+                outcome = (
+                    0 if abs(volume_diff) <= _TIE_TOLERANCE else (1 if volume_diff > 0 else -1)
+                )
         else:
-            # Team B wins
-            team_b_points["win"] += 1.0
-            team_a_points["loss"] += 1.0
-
-    # Calculate total (wins only, ties don't add to total)
-    team_a_points["total"] = team_a_points["win"]
-    team_b_points["total"] = team_b_points["win"]
+            # Orient the difference so positive favours team A (lower is better
+            # for ascending stats like turnovers)
+            diff = b_value - a_value if category.is_ascending else a_value - b_value
+            outcome = 1 if diff > 0 else -1
+
+        if outcome > 0:
+            a_wins += 1
+        elif outcome < 0:
+            b_wins += 1
+        else:
+            ties += 1
+
+    # Total counts wins only, ties don't add to it
+    team_a_points = {
+        "win": float(a_wins),
+        "loss": float(b_wins),
+        "tie": float(ties),
+        "total": float(a_wins),
+    }
+    team_b_points = {
+        "win": float(b_wins),
+        "loss": float(a_wins),
+        "tie": float(ties),
+        "total": float(b_wins),
+    }
 
     return team_a_points, team_b_points
 
@@ -1704,54 +1937,36 @@ def _calculate_projected_points(
 def _sum_player_contributions_to_team_total(
     player_contributions: Dict[str, Dict[str, float]],
     player_shooting: Dict[str, dict],
-    stat_meta: Sequence[Dict[str, object]],
+    plan: _ProjectionPlan,
 ) -> Dict[str, float]:
     """Sum up individual player contributions to get team totals.
 
     This properly handles percentage stats by using shooting volume.
     """
-    stat_ids = [
-        str(s.get("stat_id")) for s in stat_meta if s.get("is_only_display_stat") != 1
-    ]
-
-    # Find percentage stat IDs
-    percentage_stat_ids = set()
-    for stat in stat_meta:
-        if stat.get("is_only_display_stat") == 1:
-            continue
-        stat_name = stat.get("display_name") or stat.get("name") or ""
-        if "%" in stat_name:
-            percentage_stat_ids.add(str(stat.get("stat_id")))
-
-    # Sum counting stats
-    totals = {stat_id: 0.0 for stat_id in stat_ids}
-    total_fgm = 0.0
-    total_fga = 0.0
-    total_ftm = 0.0
-    total_fta = 0.0
-
-    for player_key, stats in player_contributions.items():
-        shooting = player_shooting.get(player_key, {})
-        total_fgm += shooting.get("fgm", 0.0)
-        total_fga += shooting.get("fga", 0.0)
-        total_ftm += shooting.get("ftm", 0.0)
-        total_fta += shooting.get("fta", 0.0)
-
-        for stat_id, value in stats.items():
-            if stat_id not in percentage_stat_ids:
+    counting_ids = plan.counting_ids
+
+    # Walk the players once, adding each counting stat as a running total.
+    # Every column still adds in player order. Totals are pre-seeded so categories
+    # nobody contributed to still score (and display) as 0.0 in stat_meta order.
+    totals = dict.fromkeys(plan.stat_ids, 0.0)
+    for row in player_contributions.values():
+        for stat_id in counting_ids:
+            value = row.get(stat_id)
+            if value is not None:
                 totals[stat_id] += value
 
-    # Calculate percentages from shooting volume
-    for stat in stat_meta:
-        stat_id = str(stat.get("stat_id"))
-        if stat.get("is_only_display_stat") == 1:
-            continue
-        stat_name = stat.get("display_name") or stat.get("name") or ""
+    # Shooting volume feeds the FG%/FT% division, so sum it with fsum to avoid
+    # accumulating rounding error across the roster
+    shooting_rows = [
+        shooting for shooting in map(player_shooting.get, player_contributions) if shooting
+    ]
+    total_fgm, total_fga, total_ftm, total_fta = (
+        math.fsum(shooting.get(field, 0.0) for shooting in shooting_rows)
+        for field in _SHOOTING_FIELDS
+    )
 
-        if stat_name == "FG%":
-            totals[stat_id] = (total_fgm / total_fga) if total_fga > 0 else 0.0
-        elif stat_name == "FT%":
-            totals[stat_id] = (total_ftm / total_fta) if total_fta > 0 else 0.0
+    # Calculate percentages from shooting volume
+    _apply_shooting_percentages(totals, plan, total_fgm, total_fga, total_ftm, total_fta)
 
     # Add shooting volume as special keys
     totals["_FGM"] = total_fgm
@@ -1762,6 +1977,228 @@ def _sum_player_contributions_to_team_total(
     return totals
 
 
+@dataclass(slots=True)
+class _ProjectedTeam:
+    """One team's projection and player breakdowns within a matchup."""
+
+    team_key: str
+    team_name: str
+    projection: Dict[str, float]
+    current: Dict[str, float]  # Sum of active player contributions
+    team_points: Dict[str, float]
+    # Actual stats accumulated so far this week
+    current_player_contributions: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    current_player_names: Dict[str, str] = field(default_factory=dict)
+    # Actual shooting stats from games played
+    current_player_shooting: Dict[str, dict] = field(default_factory=dict)
+    # NBA player IDs for current contributions
+    current_player_ids: Dict[str, Optional[int]] = field(default_factory=dict)
+    # Projected remaining contributions
+    player_contributions: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    player_names: Dict[str, str] = field(default_factory=dict)
+    player_total_games: Dict[str, int] = field(default_factory=dict)
+    player_remaining_games: Dict[str, int] = field(default_factory=dict)
+    # Games played so far this week in active roster spot
+    player_games_played: Dict[str, int] = field(default_factory=dict)
+    # Projected shooting stats for remaining games
+    player_shooting: Dict[str, dict] = field(default_factory=dict)
+    # NBA player IDs for projections
+    player_ids: Dict[str, Optional[int]] = field(default_factory=dict)
+    # Track which players are still on roster
+    is_on_roster_today: Dict[str, bool] = field(default_factory=dict)
+    remaining_days_projection: Dict[str, Dict[str, Dict[str, float]]] = field(
+        default_factory=dict
+    )
+    # Track player positions by date
+    player_positions: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # Head-to-head points, set only when the matchup has exactly two teams
+    projected_team_points: Optional[Dict[str, float]] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the team as a response dict.
+
+        The conversion is shallow: the nested breakdown dicts are shared, not
+        deep-copied as dataclasses.asdict would. projected_team_points is only
+        included once it has been set.
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if self.projected_team_points is None:
+            del data["projected_team_points"]
+        return data
+
+
+def _project_team_entry(
+    league_key: str,
+    plan: _ProjectionPlan,
+    week_start: date,
+    week_end: date,
+    team_data: dict,
+    season: str,
+    roster_cache: Dict[str, Dict[str, List[dict]]],
+    week: Optional[int],
+    projection_mode: str,
+    optimize_roster: bool,
+    team_key_value: str,
+) -> _ProjectedTeam:
+    """Build the projection entry for a single team in a matchup.
+
+    Args:
+        league_key: Yahoo league key
+        plan: Stat categories resolved by _projection_plan
+        week_start: Start date of week
+        week_end: End date of week
+        team_data: Team data dict
+        season: NBA season string
+        roster_cache: Cache of rosters by team, filled in if missing
+        week: Week number
+        projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
+        optimize_roster: Whether to use optimized roster positions
+        team_key_value: The team's key, already normalized by _ensure_team_key
+
+    Returns:
+        The team's projection, current totals and player breakdowns
+    """
+    team_id = extract_team_id(team_key_value)
+
+    # The weekly Yahoo stats call doesn't depend on the projection, so issue it
+    # on the Yahoo pool now (within the Yahoo limit) and collect it once the
+    # projection is done
+    weekly_future = (
+        _yahoo_pool().submit(
+            _yahoo_call, fetch_team_stats_for_week, league_key, team_id, week
+        )
+        if week is not None
+        else None
+    )
+
+    roster = roster_cache.get(team_key_value)
+    if roster is None:
+        roster = _collect_roster(league_key, team_id, week_start, week_end)
+        roster_cache[team_key_value] = roster
+
+    # NBA IDs, schedules and per-mode stats resolved while projecting this team,
+    # shared by every pass below
+    id_cache: Dict[str, Optional[int]] = {}
+    schedule_cache: Dict[Tuple[int, str, str], schedule_fetcher.PlayerSchedule] = {}
+    stats_cache: Dict[Tuple[int, str], Optional[PlayerStats]] = {}
+
+    # Get projected contributions per player; the team projection reuses them
+    (
+        proj_contributions,
+        proj_player_names,
+        player_total_games,
+        player_remaining_games,
+        proj_player_shooting,
+        remaining_days_projection,
+        player_positions,
+        proj_player_ids,
+    ) = _aggregate_projected_contributions(
+        league_key,
+        roster,
+        week_start,
+        week_end,
+        plan,
+        season,
+        projection_mode,
+        optimize_roster,
+        id_cache,
+        schedule_cache,
+        stats_cache,
+    )
+
+    # Get actual current week contributions for player breakdown. Without roster
+    # optimization this is exactly the pass the team projection needs, so it's reused
+    (
+        current_contributions,
+        current_player_names,
+        current_player_shooting,
+        is_on_roster_today,
+        player_games_played,
+        current_player_ids,
+    ) = _aggregate_current_week_player_contributions(
+        league_key,
+        roster,
+        week_start,
+        week_end,
+        plan,
+        season,
+        optimize_roster,
+        id_cache,
+        schedule_cache,
+    )
+
+    projection = _project_team(
+        league_key,
+        roster,
+        week_start,
+        week_end,
+        plan,
+        season,
+        projection_mode,
+        optimize_roster,
+        id_cache,
+        schedule_cache,
+        stats_cache,
+        projected_contributions=(proj_contributions, proj_player_shooting),
+        current_contributions=(
+            None
+            if optimize_roster
+            else (current_contributions, current_player_shooting)
+        ),
+    )
+
+    # Get team points from Yahoo
+    if weekly_future is not None:
+        weekly: Dict[str, Dict[str, float]] = {}
+        try:
+            weekly = weekly_future.result()
+        except Exception:  # noqa: BLE001
+            # Catch all exceptions (auth errors, server errors, etc.)
+            # Fall back to stats from team_data
+            weekly = {}
+        team_points = weekly.get("team_points", _extract_team_points(team_data))
+    else:
+        team_points = _extract_team_points(team_data)
+
+    raw_name = team_data.get("name")
+    if isinstance(raw_name, dict):
+        team_name = raw_name.get("full") or raw_name.get("name")
+    else:
+        team_name = raw_name
+    if isinstance(team_name, bytes):
+        team_name = team_name.decode("utf-8", errors="ignore")
+    if not isinstance(team_name, str):
+        team_name = str(team_name)
+
+    # Calculate team current totals by summing up player contributions
+    # This is more accurate than Yahoo stats minus inactive contributions
+    current_team_total = _sum_player_contributions_to_team_total(
+        current_contributions, current_player_shooting, plan
+    )
+
+    return _ProjectedTeam(
+        team_key=team_key_value,
+        team_name=team_name,
+        projection=projection,
+        current=current_team_total,
+        team_points=team_points,
+        current_player_contributions=current_contributions,
+        current_player_names=current_player_names,
+        current_player_shooting=current_player_shooting,
+        current_player_ids=current_player_ids,
+        player_contributions=proj_contributions,
+        player_names=proj_player_names,
+        player_total_games=player_total_games,
+        player_remaining_games=player_remaining_games,
+        player_games_played=player_games_played,
+        player_shooting=proj_player_shooting,
+        player_ids=proj_player_ids,
+        is_on_roster_today=is_on_roster_today,
+        remaining_days_projection=remaining_days_projection,
+        player_positions=player_positions,
+    )
+
+
 def _build_matchup_projection(
     league_key: str,
     stat_meta: Sequence[Dict[str, object]],
@@ -1773,6 +2210,7 @@ def _build_matchup_projection(
     week: Optional[int] = None,
     projection_mode: str = "season",
     optimize_map: Optional[Dict[str, bool]] = None,
+    plan: Optional[_ProjectionPlan] = None,
 ) -> Dict[str, object]:
     """Build matchup projection for teams.
 
@@ -1787,123 +2225,66 @@ def _build_matchup_projection(
         season: NBA season string
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
         optimize_map: Dict mapping team_key to whether to optimize that team's roster
+        plan: stat_meta already resolved by _projection_plan (e.g. shared across a
+            league's matchups); resolved here if omitted
 
     Returns:
         Dict with matchup projection data
     """
-    roster_cache = roster_cache or {}
+    if plan is None:
+        plan = _projection_plan(stat_meta)
+    # Keep the caller's cache even when it is still empty, so rosters fetched here
+    # are reused by later calls that share it
+    if roster_cache is None:
+        roster_cache = {}
     optimize_map = optimize_map or {}
 
-    projected_teams = []
-    for team_data in team_entries:
-        team_key_value = _ensure_team_key(team_data.get("team_key"))
-        if not team_key_value:
-            continue
-        team_id = extract_team_id(team_key_value)
-        roster = roster_cache.get(team_key_value)
-        if roster is None:
-            roster = _collect_roster(league_key, team_id, week_start, week_end)
-            roster_cache[team_key_value] = roster
-
-        # Check if this team should use optimized roster positions
-        optimize_roster = optimize_map.get(team_key_value, False)
-
-        projection = _project_team(
-            league_key, roster, week_start, week_end, stat_meta, season, projection_mode, optimize_roster
-        )
-
-        # Get team points from Yahoo
-        if week is not None:
-            weekly: Dict[str, Dict[str, float]] = {}
-            try:
-                weekly = fetch_team_stats_for_week(league_key, team_id, week)
-            except Exception:  # noqa: BLE001
-                # Catch all exceptions (auth errors, server errors, etc.)
-                # Fall back to stats from team_data
-                weekly = {}
-            team_points = weekly.get("team_points", _extract_team_points(team_data))
-        else:
-            team_points = _extract_team_points(team_data)
-
-        raw_name = team_data.get("name")
-        if isinstance(raw_name, dict):
-            team_name = raw_name.get("full") or raw_name.get("name")
-        else:
-            team_name = raw_name
-        if isinstance(team_name, bytes):
-            team_name = team_name.decode("utf-8", errors="ignore")
-        if not isinstance(team_name, str):
-            team_name = str(team_name)
-
-        # Get projected contributions per player
-        (
-            proj_contributions,
-            proj_player_names,
-            player_total_games,
-            player_remaining_games,
-            proj_player_shooting,
-            remaining_days_projection,
-            player_positions,
-            proj_player_ids,
-        ) = _aggregate_projected_contributions(
-            league_key, roster, week_start, week_end, stat_meta, season, projection_mode, optimize_roster
-        )
-
-        # Get actual current week contributions for player breakdown
-        (
-            current_contributions,
-            current_player_names,
-            current_player_shooting,
-            is_on_roster_today,
-            player_games_played,
-            current_player_ids,
-        ) = _aggregate_current_week_player_contributions(
-            league_key, roster, week_start, week_end, stat_meta, season, optimize_roster
-        )
+    valid_entries = [
+        (team_data, team_key_value)
+        for team_data in team_entries
+        if (team_key_value := _ensure_team_key(team_data.get("team_key")))
+    ]
 
-        # Calculate team current totals by summing up player contributions
-        # This is more accurate than Yahoo stats minus inactive contributions
-        current_team_total = _sum_player_contributions_to_team_total(
-            current_contributions, current_player_shooting, stat_meta
+    def _project_entry(entry: Tuple[dict, str]) -> _ProjectedTeam:
+        team_data, team_key_value = entry
+        return _project_team_entry(
+            league_key,
+            plan,
+            week_start,
+            week_end,
+            team_data,
+            season,
+            roster_cache,
+            week,
+            projection_mode,
+            optimize_map.get(team_key_value, False),
+            team_key_value,
         )
 
-        projected_teams.append(
-            {
-                "team_key": team_key_value,
-                "team_name": team_name,
-                "projection": projection,
-                "current": current_team_total,  # Sum of active player contributions
-                "team_points": team_points,
-                "current_player_contributions": current_contributions,  # Actual stats accumulated so far this week
-                "current_player_names": current_player_names,
-                "current_player_shooting": current_player_shooting,  # Actual shooting stats from games played
-                "current_player_ids": current_player_ids,  # NBA player IDs for current contributions
-                "player_contributions": proj_contributions,  # Projected remaining contributions
-                "player_names": proj_player_names,
-                "player_total_games": player_total_games,
-                "player_remaining_games": player_remaining_games,
-                "player_games_played": player_games_played,  # Games played so far this week in active roster spot
-                "player_shooting": proj_player_shooting,  # Projected shooting stats for remaining games
-                "player_ids": proj_player_ids,  # NBA player IDs for projections
-                "is_on_roster_today": is_on_roster_today,  # Track which players are still on roster
-                "remaining_days_projection": remaining_days_projection,
-                "player_positions": player_positions,  # Track player positions by date
-            }
-        )
+    # Each team's projection is independent, so run them side by side. This
+    # uses its own executor rather than the shared I/O pool because every team
+    # submits leaf reads to that pool and must not wait on itself. Their Yahoo
+    # requests (rosters, weekly stats) all go through _yahoo_call, so running
+    # teams together doesn't raise the number of Yahoo calls in flight.
+    if len(valid_entries) > 1:
+        with ThreadPoolExecutor(max_workers=len(valid_entries), thread_name_prefix="shams-team") as executor:
+            projected_teams = list(executor.map(_project_entry, valid_entries))
+    else:
+        projected_teams = [_project_entry(entry) for entry in valid_entries]
 
     # Calculate projected points for head-to-head matchups
     if len(projected_teams) == 2:
         proj_points_a, proj_points_b = _calculate_projected_points(
-            stat_meta,
-            projected_teams[0]["projection"],
-            projected_teams[1]["projection"],
+            plan,
+            projected_teams[0].projection,
+            projected_teams[1].projection,
         )
-        projected_teams[0]["projected_team_points"] = proj_points_a
-        projected_teams[1]["projected_team_points"] = proj_points_b
+        projected_teams[0].projected_team_points = proj_points_a
+        projected_teams[1].projected_team_points = proj_points_b
 
     return {
         "stat_categories": stat_meta,
-        "teams": projected_teams,
+        "teams": [team.to_dict() for team in projected_teams],
         "week_start": week_start.isoformat(),
         "week_end": week_end.isoformat(),
     }
@@ -1929,6 +2310,7 @@ def project_matchup(
     projection_mode: str = "season",
     optimize_user_roster: bool = False,
     optimize_opponent_roster: bool = False,
+    force_refresh: bool = False,
 ) -> Dict[str, object]:
     """Project matchup statistics for a team.
 
@@ -1939,10 +2321,26 @@ def project_matchup(
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
         optimize_user_roster: If True, optimize user's roster positions for maximum active players
         optimize_opponent_roster: If True, optimize opponent's roster positions for maximum active players
+        force_refresh: If True, recompute instead of serving a recently cached
+            projection (e.g. right after a roster move); the result is still cached
 
     Returns:
         Dict with projection data
     """
+    # Serve a projection computed for the same request within the last few minutes
+    cache_path = projection_cache.get_cache_path(
+        league_key,
+        team_key,
+        week,
+        projection_mode,
+        optimize_user_roster,
+        optimize_opponent_roster,
+    )
+    if not force_refresh:
+        cached = projection_cache.load_cached_projection(cache_path)
+        if cached is not None:
+            return cached
+
     # Determine season from date first, then load season-specific metadata.
     # Loading the global metadata (no season arg) is unreliable: the global
     # metadata.json is legacy/stale — all refresh operations write to
@@ -2000,17 +2398,18 @@ def project_matchup(
         raise ValueError("User team not found in matchup data")
 
     opponent_entry = next((team for team in teams if team is not user_entry), None)
+    opponent: Mapping[str, object] = opponent_entry or _EMPTY_ENTRY
 
-    return {
+    result = {
         "stat_categories": projection_bundle["stat_categories"],
         "user_projection": user_entry.get("projection", {}),
-        "opponent_projection": (opponent_entry or {}).get("projection", {}),
+        "opponent_projection": opponent.get("projection", {}),
         "user_current": user_entry.get("current", {}),
-        "opponent_current": (opponent_entry or {}).get("current", {}),
+        "opponent_current": opponent.get("current", {}),
         "user_team_points": user_entry.get("team_points", {}),
-        "opponent_team_points": (opponent_entry or {}).get("team_points", {}),
+        "opponent_team_points": opponent.get("team_points", {}),
         "user_projected_team_points": user_entry.get("projected_team_points", {}),
-        "opponent_projected_team_points": (opponent_entry or {}).get(
+        "opponent_projected_team_points": opponent.get(
             "projected_team_points", {}
         ),
         "current_player_contributions": user_entry.get(
@@ -2027,48 +2426,50 @@ def project_matchup(
         "player_games_played": user_entry.get("player_games_played", {}),
         "player_shooting": user_entry.get("player_shooting", {}),
         "is_on_roster_today": user_entry.get("is_on_roster_today", {}),
-        "opponent_current_player_contributions": (opponent_entry or {}).get(
+        "opponent_current_player_contributions": opponent.get(
             "current_player_contributions", {}
         ),
-        "opponent_current_player_names": (opponent_entry or {}).get(
+        "opponent_current_player_names": opponent.get(
             "current_player_names", {}
         ),
-        "opponent_current_player_shooting": (opponent_entry or {}).get(
+        "opponent_current_player_shooting": opponent.get(
             "current_player_shooting", {}
         ),
-        "opponent_current_player_ids": (opponent_entry or {}).get(
+        "opponent_current_player_ids": opponent.get(
             "current_player_ids", {}
         ),
-        "opponent_player_contributions": (opponent_entry or {}).get(
+        "opponent_player_contributions": opponent.get(
             "player_contributions", {}
         ),
-        "opponent_player_names": (opponent_entry or {}).get("player_names", {}),
-        "opponent_player_ids": (opponent_entry or {}).get("player_ids", {}),
-        "opponent_player_total_games": (opponent_entry or {}).get(
+        "opponent_player_names": opponent.get("player_names", {}),
+        "opponent_player_ids": opponent.get("player_ids", {}),
+        "opponent_player_total_games": opponent.get(
             "player_total_games", {}
         ),
-        "opponent_player_remaining_games": (opponent_entry or {}).get(
+        "opponent_player_remaining_games": opponent.get(
             "player_remaining_games", {}
         ),
-        "opponent_player_games_played": (opponent_entry or {}).get(
+        "opponent_player_games_played": opponent.get(
             "player_games_played", {}
         ),
-        "opponent_player_shooting": (opponent_entry or {}).get("player_shooting", {}),
-        "opponent_is_on_roster_today": (opponent_entry or {}).get(
+        "opponent_player_shooting": opponent.get("player_shooting", {}),
+        "opponent_is_on_roster_today": opponent.get(
             "is_on_roster_today", {}
         ),
         "remaining_days_projection": user_entry.get("remaining_days_projection", {}),
         "player_positions": user_entry.get("player_positions", {}),
-        "opponent_remaining_days_projection": (opponent_entry or {}).get(
+        "opponent_remaining_days_projection": opponent.get(
             "remaining_days_projection", {}
         ),
-        "opponent_player_positions": (opponent_entry or {}).get("player_positions", {}),
+        "opponent_player_positions": opponent.get("player_positions", {}),
         "week": getattr(matchup, "week", None),
         "week_start": projection_bundle["week_start"],
         "week_end": projection_bundle["week_end"],
         "opponent_team": opponent_entry,
         "user_team": user_entry,
     }
+    projection_cache.save_cached_projection(cache_path, result)
+    return result
 
 
 def project_league_matchups(
@@ -2084,7 +2485,9 @@ def project_league_matchups(
         league_key: Yahoo league key
         anchor_team_key: Team key to use for determining current week
         projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
-        summary_only: If True, only return summary data (team names/scores) without detailed projections
+        summary_only: If True, only return summary data (team names/scores) without detailed projections.
+            Stat categories aren't fetched in this mode, so "stat_categories" is an empty list
+            and summary matchups carry no per-matchup copy.
 
     Returns:
         Dict with all matchup projections
@@ -2117,7 +2520,11 @@ def project_league_matchups(
     current_week = determine_current_week(league_key, anchor_team_id)
 
     scoreboard = fetch_league_scoreboard(league_key, current_week)
-    stat_meta = fetch_league_stat_categories(league_key)
+    # Summaries only report scoreboard points, so skip the stat categories request
+    stat_meta: List[Dict[str, object]] = (
+        [] if summary_only else fetch_league_stat_categories(league_key)
+    )
+    plan = _projection_plan(stat_meta)
     roster_cache: Dict[str, Dict[str, List[dict]]] = {}
 
     # Get league name from scoreboard
@@ -2130,6 +2537,8 @@ def project_league_matchups(
             league_name = league.get("name", "")
 
     projections: List[Dict[str, object]] = []
+    # (matchup, team_a, team_b, week_start, week_end) awaiting a detailed projection
+    detailed_matchups: List[Tuple[object, dict, dict, date, date]] = []
     matchups_iter = scoreboard.matchups if hasattr(scoreboard, "matchups") else []
     for matchup_entry in matchups_iter:
         matchup = (
@@ -2194,24 +2603,42 @@ def project_league_matchups(
                         "projected_team_points": team_b_proj_total,
                     },
                 ],
-                "stat_categories": stat_meta,
             }
+            projections.append(bundle)
         else:
-            # Full detailed projection with roster collection
-            bundle = _build_matchup_projection(
-                league_key,
-                stat_meta,
-                week_start,
-                week_end,
-                [team_a, team_b],
-                season=season,
-                roster_cache=roster_cache,
-                week=week_value,
-                projection_mode=projection_mode,
-            )
-            bundle["week"] = getattr(matchup, "week", None)
+            detailed_matchups.append((matchup, team_a, team_b, week_start, week_end))
 
-        projections.append(bundle)
+    def _project_matchup_entry(entry: Tuple[object, dict, dict, date, date]) -> Dict[str, object]:
+        matchup, team_a, team_b, week_start, week_end = entry
+        # Full detailed projection with roster collection
+        bundle = _build_matchup_projection(
+            league_key,
+            stat_meta,
+            week_start,
+            week_end,
+            [team_a, team_b],
+            season=season,
+            roster_cache=roster_cache,
+            week=getattr(matchup, "week", None),
+            projection_mode=projection_mode,
+            plan=plan,
+        )
+        bundle["week"] = getattr(matchup, "week", None)
+        return bundle
+
+    # Matchups share no teams, so they are projected side by side on their own
+    # executor (each one fans out to per-team threads and the shared I/O pool).
+    # Their Yahoo requests all go through _yahoo_call, so however many matchups
+    # run at once, at most _YAHOO_MAX_CONCURRENCY Yahoo calls are in flight.
+    # executor.map keeps the scoreboard order.
+    if len(detailed_matchups) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(detailed_matchups), _MAX_MATCHUP_WORKERS),
+            thread_name_prefix="shams-matchup",
+        ) as executor:
+            projections = list(executor.map(_project_matchup_entry, detailed_matchups))
+    elif detailed_matchups:
+        projections = [_project_matchup_entry(detailed_matchups[0])]
 
     return {
         "league_name": league_name,
@@ -3,14 +3,94 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional, Set
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set
 
 logger = logging.getLogger(__name__)
 
+# Roster positions that don't count as active
+_INACTIVE_POSITIONS: FrozenSet[str] = frozenset({"BN", "IL", "IL+"})
+
+
+# One bit per position name. Yahoo lists flex slots (G, F, Util) among a player's
+# eligible positions too, so they get their own bits for exact matches.
+_POSITION_BITS: Dict[str, int] = {
+    "PG": 1,
+    "SG": 2,
+    "SF": 4,
+    "PF": 8,
+    "C": 16,
+    "G": 32,
+    "F": 64,
+    "Util": 128,
+}
+
+# Flex slots and the positions that can fill them
+_FLEX_SLOT_MASKS: Dict[str, int] = {
+    "G": _POSITION_BITS["PG"] | _POSITION_BITS["SG"],
+    "F": _POSITION_BITS["SF"] | _POSITION_BITS["PF"],
+}
+
+
+class _SlotSpec(NamedTuple):
+    """A roster slot resolved to bitmasks for eligibility and priority checks."""
+
+    exact_bit: int  # the slot's own position bit
+    flex_mask: int  # positions that fill it as a flex slot (0 if not a flex slot)
+    is_util: bool
+
+
+def _position_bits(slot_positions: Iterable[str]) -> Dict[str, int]:
+    """Return position bits covering the standard positions plus any other slot names."""
+    bits = _POSITION_BITS
+    for slot_position in slot_positions:
+        if slot_position not in bits:
+            if bits is _POSITION_BITS:
+                bits = dict(_POSITION_BITS)
+            bits[slot_position] = 1 << len(bits)
+    return bits
+
+
+def _position_mask(player_positions: Iterable[str], bits: Dict[str, int]) -> int:
+    """Encode a player's eligible positions as a bitmask (unknown positions are ignored)."""
+    mask = 0
+    for position in player_positions:
+        mask |= bits.get(position, 0)
+    return mask
+
+
+def _slot_spec(slot_position: str, bits: Dict[str, int]) -> _SlotSpec:
+    return _SlotSpec(
+        bits[slot_position], _FLEX_SLOT_MASKS.get(slot_position, 0), slot_position == "Util"
+    )
+
+
+def _mask_fills_slot(player_mask: int, spec: _SlotSpec) -> bool:
+    """Check eligibility: Util takes anyone, flex slots their positions, others an exact match."""
+    if spec.is_util:
+        return True
+    if spec.flex_mask:
+        return bool(player_mask & spec.flex_mask)
+    return bool(player_mask & spec.exact_bit)
+
+
+def _mask_slot_priority(player_mask: int, spec: _SlotSpec) -> int:
+    """Slot priority (lower is better): exact 1, flex 2, Util 3, not eligible 999."""
+    if player_mask & spec.exact_bit:
+        return 1
+    if player_mask & spec.flex_mask:
+        return 2
+    if spec.is_util:
+        return 3
+    return 999
+
 
 def _get_eligible_slots_for_position(player_positions: List[str], slot_position: str) -> bool:
     """Check if a player with given positions can fill a specific slot.
 
+    Util can be filled by any position, G by PG or SG, F by SF or PF; specific
+    position slots (PG, SG, SF, PF, C) require an exact match.
+
     Args:
         player_positions: List of player's eligible positions (e.g., ["PG", "SG"])
         slot_position: The roster slot position (e.g., "PG", "G", "Util")
@@ -18,20 +98,8 @@ def _get_eligible_slots_for_position(player_positions: List[str], slot_position:
     Returns:
         True if player can fill the slot
     """
-    # Util can be filled by any position
-    if slot_position == "Util":
-        return True
-
-    # G (guard) slot can be filled by PG or SG
-    if slot_position == "G":
-        return "PG" in player_positions or "SG" in player_positions
-
-    # F (forward) slot can be filled by SF or PF
-    if slot_position == "F":
-        return "SF" in player_positions or "PF" in player_positions
-
-    # Specific position slots (PG, SG, SF, PF, C) require exact match
-    return slot_position in player_positions
+    bits = _position_bits((slot_position,))
+    return _mask_fills_slot(_position_mask(player_positions, bits), _slot_spec(slot_position, bits))
 
 
 def _get_slot_priority_for_player(player_positions: List[str], slot_position: str) -> int:
@@ -47,24 +115,80 @@ def _get_slot_priority_for_player(player_positions: List[str], slot_position: st
         slot_position: The roster slot position
 
     Returns:
-        Priority value (lower is better)
+        Priority value (lower is better, 999 if not eligible)
     """
-    # Exact match - highest priority
-    if slot_position in player_positions:
-        return 1
+    bits = _position_bits((slot_position,))
+    return _mask_slot_priority(
+        _position_mask(player_positions, bits), _slot_spec(slot_position, bits)
+    )
 
-    # Flex positions - medium priority
-    if slot_position == "G" and ("PG" in player_positions or "SG" in player_positions):
-        return 2
-    if slot_position == "F" and ("SF" in player_positions or "PF" in player_positions):
-        return 2
 
-    # Util - lowest priority (but still valid)
-    if slot_position == "Util":
-        return 3
+def _candidate_slots(player_mask: int, slot_specs: Sequence[_SlotSpec]) -> List[int]:
+    """Return a player's eligible slot indices, best priority first (ties keep roster order).
 
-    # Not eligible
-    return 999
+    Eligible slots only ever have priority 1-3, so they are bucketed rather than sorted,
+    and the first free slot found in this order is always the best one.
+    """
+    exact: List[int] = []
+    flex: List[int] = []
+    util: List[int] = []
+    for slot_idx, spec in enumerate(slot_specs):
+        if not _mask_fills_slot(player_mask, spec):
+            continue
+        priority = _mask_slot_priority(player_mask, spec)
+        if priority == 1:
+            exact.append(slot_idx)
+        elif priority == 2:
+            flex.append(slot_idx)
+        else:
+            util.append(slot_idx)
+    return exact + flex + util
+
+
+def _assign_slots(player_masks: Sequence[int], slot_specs: Sequence[_SlotSpec]) -> List[int]:
+    """Assign players (in priority order) to slots, maximizing filled slots.
+
+    Works purely on position bitmasks. Each player takes their best-priority free
+    slot (the greedy choice); if none is free, already-placed players are moved
+    between their eligible slots along an augmenting path to open one. A placed
+    player is only ever moved, never benched, so earlier players keep priority.
+
+    Args:
+        player_masks: Position bitmask per player, highest priority first
+        slot_specs: Active roster slots
+
+    Returns:
+        Slot index per player, or -1 for players left on the bench
+    """
+    candidate_slots = [_candidate_slots(player_mask, slot_specs) for player_mask in player_masks]
+    slot_owner: Dict[int, int] = {}  # slot index -> player index
+
+    def _claim_slot(player_idx: int, visited: Set[int]) -> bool:
+        slots = candidate_slots[player_idx]
+        for slot_idx in slots:
+            if slot_idx not in slot_owner:
+                slot_owner[slot_idx] = player_idx
+                return True
+        for slot_idx in slots:
+            if slot_idx in visited:
+                continue
+            visited.add(slot_idx)
+            if _claim_slot(slot_owner[slot_idx], visited):
+                slot_owner[slot_idx] = player_idx
+                return True
+        return False
+
+    for player_idx in range(len(player_masks)):
+        # Once every slot is taken no reshuffle can open one, so the remaining
+        # players are benched without a search
+        if len(slot_owner) == len(slot_specs):
+            break
+        _claim_slot(player_idx, set())
+
+    player_slots = [-1] * len(player_masks)
+    for slot_idx, player_idx in slot_owner.items():
+        player_slots[player_idx] = slot_idx
+    return player_slots
 
 
 def optimize_roster_positions(
@@ -73,14 +197,17 @@ def optimize_roster_positions(
     players_with_games: Set[str],
     player_ranks: Optional[Dict[str, int]] = None,
 ) -> Dict[str, str]:
-    """Optimize roster positions to maximize active players using greedy algorithm.
+    """Optimize roster positions to maximize active players.
 
     Algorithm:
     1. Sort players by position eligibility count (ascending) - least flexible first
     2. For players with same flexibility, use rank as tie-breaker (lower rank = higher priority)
     3. For each player with games scheduled:
-       - Try to assign to most specific eligible position slot
+       - Try to assign to most specific free eligible position slot
        - Prioritize: specific positions > flex positions (G, F) > Util
+       - If no eligible slot is free, move already-assigned players between their
+         eligible slots to open one up (bipartite augmenting path), so the number
+         of active players is always the maximum possible
     4. Return mapping of player_key -> optimized_position
 
     Args:
@@ -95,8 +222,7 @@ def optimize_roster_positions(
         Dictionary mapping player_key to optimized position
     """
     # Filter out inactive positions (BN, IL, IL+)
-    inactive_positions = {"BN", "IL", "IL+"}
-    active_slots = [pos for pos in league_roster_positions if pos not in inactive_positions]
+    active_slots = [pos for pos in league_roster_positions if pos not in _INACTIVE_POSITIONS]
 
     # Track which slots are filled
     available_slots: Dict[int, str] = dict(enumerate(active_slots))
@@ -118,11 +244,11 @@ def optimize_roster_positions(
 
         # Log players without games for debugging
         if player_key not in players_with_games:
-            logger.debug(f"Player {player_key} has no games scheduled, will be benched")
+            logger.debug("Player %s has no games scheduled, will be benched", player_key)
             continue
 
         if not eligible_positions:
-            logger.warning(f"Player {player_key} has games but no eligible_positions data!")
+            logger.warning("Player %s has games but no eligible_positions data!", player_key)
             continue
 
         # Get player rank for tie-breaking (lower rank = better player)
@@ -132,57 +258,68 @@ def optimize_roster_positions(
         players_to_assign.append({
             "player_key": player_key,
             "eligible_positions": eligible_positions,
-            "flexibility": len(eligible_positions),
-            "rank": rank,
+            # (flexibility, rank, player_key)
+            "sort_key": (len(eligible_positions), rank, player_key),
         })
 
     # Sort by flexibility (ascending), then by rank (ascending - lower rank = higher priority)
     # This ensures:
     # 1. Least flexible players are assigned first (to specific slots)
     # 2. Among players with same flexibility, higher-ranked players (lower rank number) get priority
-    players_to_assign.sort(key=lambda p: (p["flexibility"], p["rank"], p["player_key"]))
-
-    logger.info(f"Roster optimization: {len(players_to_assign)} players with games, {len(available_slots)} active slots available")
-    logger.debug(f"Active slots: {active_slots}")
-    logger.debug(f"Players with games: {players_with_games}")
-
-    # Assign players to slots
-    for player_info in players_to_assign:
-        player_key = player_info["player_key"]
-        eligible_positions = player_info["eligible_positions"]
-
-        # Find best available slot for this player
-        best_slot_idx: Optional[int] = None
-        best_priority = 999
-
-        for slot_idx, slot_pos in available_slots.items():
-            if _get_eligible_slots_for_position(eligible_positions, slot_pos):
-                priority = _get_slot_priority_for_player(eligible_positions, slot_pos)
-                if priority < best_priority:
-                    best_priority = priority
-                    best_slot_idx = slot_idx
-
-        # Assign player to best slot if found
-        if best_slot_idx is not None:
-            assigned_position = available_slots[best_slot_idx]
-            player_assignments[player_key] = assigned_position
-            del available_slots[best_slot_idx]
-            logger.info(f"✓ Assigned {player_key} to {assigned_position} (eligible: {eligible_positions})")
-        else:
-            # No available slot - assign to BN
-            player_assignments[player_key] = "BN"
-            logger.warning(f"✗ No slot available for {player_key} (eligible: {eligible_positions}), forced to BN")
+    players_to_assign.sort(key=itemgetter("sort_key"))
+
+    logger.info(
+        "Roster optimization: %d players with games, %d active slots available",
+        len(players_to_assign),
+        len(available_slots),
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Active slots: %s", active_slots)
+        logger.debug("Players with games: %s", players_with_games)
+
+    # Resolve slots and players to bitmasks once, so matching is integer checks
+    bits = _position_bits(active_slots)
+    slot_specs = [_slot_spec(slot_pos, bits) for slot_pos in active_slots]
+
+    player_masks = [
+        _position_mask(player_info["eligible_positions"], bits)
+        for player_info in players_to_assign
+    ]
+    player_slots = _assign_slots(player_masks, slot_specs)
+
+    for player_info, slot_idx in zip(players_to_assign, player_slots):
+        if slot_idx < 0:
+            # No slot even after reshuffling - assign to BN
+            player_assignments[player_info["player_key"]] = "BN"
+            logger.warning(
+                "✗ No slot available for %s (eligible: %s), forced to BN",
+                player_info["player_key"],
+                player_info["eligible_positions"],
+            )
+
+    for slot_idx, player_idx in sorted(
+        (slot_idx, player_idx) for player_idx, slot_idx in enumerate(player_slots) if slot_idx >= 0
+    ):
+        player_info = players_to_assign[player_idx]
+        assigned_position = available_slots.pop(slot_idx)
+        player_assignments[player_info["player_key"]] = assigned_position
+        logger.info(
+            "✓ Assigned %s to %s (eligible: %s)",
+            player_info["player_key"],
+            assigned_position,
+            player_info["eligible_positions"],
+        )
 
     # Log remaining available slots
-    if available_slots:
-        logger.info(f"Remaining unfilled slots: {list(available_slots.values())}")
+    if available_slots and logger.isEnabledFor(logging.INFO):
+        logger.info("Remaining unfilled slots: %s", list(available_slots.values()))
 
     # Assign players without games to BN
     for player in players:
         player_key = player.get("player_key")
         if player_key and player_key not in player_assignments:
             player_assignments[player_key] = "BN"
-            logger.debug(f"Player {player_key} has no games, assigned to BN")
+            logger.debug("Player %s has no games, assigned to BN", player_key)
 
     return player_assignments
 
@@ -196,9 +333,8 @@ def get_active_positions(optimized_positions: Dict[str, str]) -> Set[str]:
     Returns:
         Set of player keys in active positions (not BN, IL, IL+)
     """
-    inactive = {"BN", "IL", "IL+"}
     return {
         player_key
         for player_key, position in optimized_positions.items()
-        if position not in inactive
+        if position not in _INACTIVE_POSITIONS
     }
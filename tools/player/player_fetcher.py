@@ -34,8 +34,19 @@ def clear_game_log_caches() -> None:
     """Clear all game log and shooting stat caches to get fresh data.
 
     Call this to ensure minute trends and shooting stats reflect the latest games.
+    Player lists, name/ID lookups and team mappings are dropped too, so a
+    long-running process picks up roster moves without a restart.
     """
-    fetch_player_team_id.cache_clear()
+    from tools.player import player_minutes_trend
+
+    for cached in (
+        fetch_player_team_id,
+        player_id_lookup,
+        _player_name_index,
+        _team_abbr_map,
+    ):
+        cached.cache_clear()
+    player_minutes_trend.clear_caches()
 
 
 def _latest_season_code(seasons: Iterable[str]) -> Optional[str]:
@@ -50,7 +61,7 @@ def _latest_season_code(seasons: Iterable[str]) -> Optional[str]:
     return None if latest is None else f"{latest}-{str(latest + 1)[-2:]}"
 
 
-@lru_cache(maxsize=512)
+@lru_cache(maxsize=1)
 def _team_abbr_map() -> Dict[str, int]:
     from nba_api.stats.static import teams
 
@@ -62,6 +73,17 @@ def _team_abbr_map() -> Dict[str, int]:
     return mapping
 
 
+@lru_cache(maxsize=1)
+def _player_name_index() -> Dict[str, int]:
+    """Map lowercased full names of the static player list to NBA IDs (first match wins)."""
+    from nba_api.stats.static import players
+
+    index: Dict[str, int] = {}
+    for player in players.get_players():
+        index.setdefault(player["full_name"].lower(), player["id"])
+    return index
+
+
 @lru_cache(maxsize=512)
 def player_id_lookup(full_name: str) -> Optional[int]:
     """Look up a player's NBA ID by full name.
@@ -72,12 +94,9 @@ def player_id_lookup(full_name: str) -> Optional[int]:
     Returns:
         NBA player ID or None if not found
     """
-    from nba_api.stats.static import players
-
-    name_lower = full_name.lower()
-    for player in players.get_players():
-        if player["full_name"].lower() == name_lower:
-            return player["id"]
+    player_id = _player_name_index().get(full_name.lower())
+    if player_id is not None:
+        return player_id
 
     # fallback fuzzy match using existing logic from player_minutes_trend
     from tools.player.player_minutes_trend import find_player_matches
@@ -122,6 +141,12 @@ def fetch_player_team_id(player_id: int) -> Optional[int]:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_game_date(game_date_str: str) -> date:
+    """Parse an ISO game date; game dates repeat across every player's log."""
+    return date.fromisoformat(game_date_str)
+
+
 def fetch_player_stats_from_cache(
     player_id: int, season: str, start: date, end: date,
 ) -> List[Dict]:
@@ -151,7 +176,7 @@ def fetch_player_stats_from_cache(
     for game in games:
         game_date_str = game.get("date", "")
         try:
-            game_date = date.fromisoformat(game_date_str)
+            game_date = _parse_game_date(game_date_str)
             if start <= game_date <= end:
                 filtered_games.append(game)
         except (ValueError, TypeError):
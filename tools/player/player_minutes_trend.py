@@ -9,10 +9,13 @@ These helpers are consumed by the interactive ``shams`` CLI.
 from __future__ import annotations
 
 import difflib
+import heapq
 import os
+import re
 from dataclasses import dataclass
+from datetime import date
 from functools import lru_cache
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from nba_api.stats.endpoints import playerindex
 from nba_api.stats.static import players as players_static
@@ -47,6 +50,11 @@ _SEASON_TYPE_LOOKUP.update(
 
 MAX_SUGGESTION_LIMIT = 50
 
+# Box score minutes as "MM" or "MM:SS"
+_MINUTES_RE = re.compile(r"^\s*(\d+)(?::(\d+))?\s*$")
+
+_DID_NOT_PLAY = frozenset({"dnp", "did not play"})
+
 
 def _resolve_int_env(env_var: str, default: int) -> int:
     value = os.environ.get(env_var)
@@ -122,22 +130,21 @@ def get_all_players() -> List[dict]:
         index = playerindex.PlayerIndex(season=season, league_id="00")
         df = index.get_data_frames()[0]
 
-        # Convert DataFrame to list of dicts matching static players format
-        players = []
-        for _, row in df.iterrows():
-            first_name = row.get("PLAYER_FIRST_NAME", "")
-            last_name = row.get("PLAYER_LAST_NAME", "")
-            full_name = f"{first_name} {last_name}".strip()
-            players.append(
-                {
-                    "id": row["PERSON_ID"],
-                    "full_name": full_name,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "is_active": True,  # All players from PlayerIndex are active
-                }
-            )
-        return players
+        # Convert DataFrame to list of dicts matching static players format,
+        # column-wise rather than row by row
+        names = (
+            df.reindex(columns=["PLAYER_FIRST_NAME", "PLAYER_LAST_NAME"]).fillna("").astype(str)
+        )
+        players = names.rename(
+            columns={"PLAYER_FIRST_NAME": "first_name", "PLAYER_LAST_NAME": "last_name"}
+        ).assign(
+            id=df["PERSON_ID"],
+            full_name=(names["PLAYER_FIRST_NAME"] + " " + names["PLAYER_LAST_NAME"]).str.strip(),
+            is_active=True,  # All players from PlayerIndex are active
+        )
+        return players[["id", "full_name", "first_name", "last_name", "is_active"]].to_dict(
+            "records"
+        )
     except Exception:
         # Fallback to static players list if API fails
         return players_static.get_players()
@@ -153,6 +160,34 @@ def normalize(text: str) -> str:
     return ascii_text.strip().lower()
 
 
+class _PlayerNameIndex(NamedTuple):
+    """get_all_players() as parallel columns for name matching."""
+
+    players: Tuple[dict, ...]
+    names: Tuple[str, ...]  # normalized full names, aligned with players
+    first_by_name: Dict[str, int]  # normalized name -> index of its first player
+
+
+@lru_cache(maxsize=1)
+def _normalized_players() -> _PlayerNameIndex:
+    """Return the player list with full names normalized once."""
+    players = tuple(get_all_players())
+    names = tuple(normalize(player["full_name"]) for player in players)
+    first_by_name: Dict[str, int] = {}
+    for idx, name in enumerate(names):
+        first_by_name.setdefault(name, idx)
+    return _PlayerNameIndex(players, names, first_by_name)
+
+
+@lru_cache(maxsize=1)
+def _players_by_id() -> Dict[int, dict]:
+    """Return get_all_players() keyed by player ID (first record wins)."""
+    index: Dict[int, dict] = {}
+    for player in get_all_players():
+        index.setdefault(player["id"], player)
+    return index
+
+
 def find_player_matches(
     query: str, limit: int = 5
 ) -> Tuple[Optional[int], Sequence[dict]]:
@@ -165,11 +200,17 @@ def find_player_matches(
     players = get_all_players()
     query_norm = normalize(query)
 
-    exact_matches = [p for p in players if normalize(p["full_name"]) == query_norm]
-    if exact_matches:
-        return exact_matches[0]["id"], ()
+    # The first exact match wins outright, otherwise substring matches are
+    # collected in list order
+    index = _normalized_players()
+    exact_idx = index.first_by_name.get(query_norm)
+    if exact_idx is not None:
+        return index.players[exact_idx]["id"], ()
+
+    substring_matches = [
+        player for player, name_norm in zip(index.players, index.names) if query_norm in name_norm
+    ]
 
-    substring_matches = [p for p in players if query_norm in normalize(p["full_name"])]
     if len(substring_matches) == 1:
         return substring_matches[0]["id"], ()
     if len(substring_matches) > 1:
@@ -178,7 +219,7 @@ def find_player_matches(
     # Use a higher cutoff (0.75) to reduce false positives from weak matches
     # like "Steve Settle III" matching "Jimmy Butler III" due to shared suffix
     all_names = [p["full_name"] for p in players]
-    close_names = difflib.get_close_matches(query, all_names, n=limit, cutoff=0.75)
+    close_names = set(difflib.get_close_matches(query, all_names, n=limit, cutoff=0.75))
     close_matches = [p for p in players if p["full_name"] in close_names]
 
     # Only auto-resolve fuzzy matches if the match is very strong (ratio >= 0.85)
@@ -201,71 +242,88 @@ def parse_minutes(min_value: str) -> Optional[float]:
     if isinstance(min_value, (int, float)):
         return float(min_value)
 
-    value = str(min_value).strip()
-    if not value:
-        return None
-
-    if value.isdigit():
-        return float(value)
-
-    if ":" in value:
-        try:
-            minutes_part, seconds_part = value.split(":", 1)
-            minutes = int(minutes_part)
-            seconds = int(seconds_part)
-            return minutes + seconds / 60
-        except ValueError:
-            return None
+    value = str(min_value)
+    match = _MINUTES_RE.match(value)
+    if match:
+        minutes_text, seconds_text = match.groups()
+        if seconds_text is None:
+            return float(minutes_text)
+        return int(minutes_text) + int(seconds_text) / 60
 
-    lowered = value.lower()
-    if lowered in {"dnp", "did not play"}:
+    if value.strip().lower() in _DID_NOT_PLAY:
         return 0.0
 
     return None
 
 
+@lru_cache(maxsize=4)
+def _season_start_date(season: str) -> date:
+    """Return the season's start date, resolved once per season.
+
+    Only the start is cached; callers still read today's date on each call so a
+    long-running process doesn't keep a stale end date.
+    """
+    from tools.schedule.schedule_fetcher import get_season_start_date
+
+    return get_season_start_date(season)
+
+
+def clear_caches() -> None:
+    """Clear the cached player list, its lookup indexes and season start dates."""
+    for cached in (get_all_players, _normalized_players, _players_by_id, _season_start_date):
+        cached.cache_clear()
+
+
+def _game_date(game: dict) -> str:
+    return game.get("date", "")
+
+
+def _minute_records(games: Sequence[dict], count: int) -> List[Tuple[str, float, str]]:
+    """Return (date, minutes, matchup) for the first `count` games with minute data."""
+    records: List[Tuple[str, float, str]] = []
+    for game in games:
+        minutes = parse_minutes(game.get("MIN"))
+        if minutes is None:
+            continue
+        records.append(
+            (
+                _game_date(game),
+                minutes,
+                game.get("matchup", game.get("MATCHUP", "")),
+            )
+        )
+        if len(records) >= count:
+            break
+    return records
+
+
 def fetch_recent_minute_logs(
     player_id: int,
     season_type: SeasonType,  # pylint: disable=unused-argument
     count: int = 4,
     timeout: int = NBA_API_TIMEOUT,  # pylint: disable=unused-argument
 ) -> List[Tuple[str, float, str]]:
-    from datetime import date
-
     from nba_api.stats.library.parameters import SeasonAll
 
     from tools.player.player_fetcher import fetch_player_stats_from_cache
-    from tools.schedule.schedule_fetcher import get_season_start_date
 
     # Try to use cache first
     today = date.today()
-    season_start = get_season_start_date(SeasonAll.current_season)
+    season_start = _season_start_date(SeasonAll.current_season)
 
     try:
         cached_games = fetch_player_stats_from_cache(player_id, SeasonAll.current_season, season_start, today)
 
         if cached_games:
-            # Use cached data
-            records: List[Tuple[str, float, str]] = []
-
-            # Sort by date descending
-            sorted_games = sorted(
-                cached_games, key=lambda g: g.get("date", ""), reverse=True
-            )
-
-            for game in sorted_games:
-                minutes = parse_minutes(game.get("MIN"))
-                if minutes is None:
-                    continue
-                records.append(
-                    (
-                        game.get("date", ""),
-                        minutes,
-                        game.get("matchup", game.get("MATCHUP", "")),
-                    )
+            # Use cached data: the most recent `count` games with minute data.
+            # Rank only the newest few games by date and parse minutes on those;
+            # order the whole season only if too many of them lack minutes.
+            candidates = heapq.nlargest(count * 2, cached_games, key=_game_date)
+            records = _minute_records(candidates, count)
+            if len(records) < count and len(candidates) < len(cached_games):
+                records = _minute_records(
+                    sorted(cached_games, key=_game_date, reverse=True), count
                 )
-                if len(records) >= count:
-                    break
 
             if records:
                 return records
@@ -342,8 +400,7 @@ def process_minute_trend_query(
         )
 
     # We resolved the player ID. Need to obtain the canonical name from matches.
-    players = get_all_players()
-    player_record = next((p for p in players if p["id"] == player_id), None)
+    player_record = _players_by_id().get(player_id)
     player_name = player_record["full_name"] if player_record else player_query
 
     computation = compute_minute_trend_for_player(
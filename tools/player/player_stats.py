@@ -3,46 +3,61 @@
 from __future__ import annotations
 
 import math
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from tools.player import player_fetcher
+from tools.player.player_minutes_trend import parse_minutes
+
+
+# Per-game box score counting stats, in the order compute_player_stats unpacks them
+_COUNTING_STAT_KEYS = (
+    "FGM",
+    "FGA",
+    "FTM",
+    "FTA",
+    "FG3M",
+    "PTS",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+)
+
+_get_counting_stats = itemgetter(*_COUNTING_STAT_KEYS)
+
+_ZERO_COUNTING_STATS = dict.fromkeys(_COUNTING_STAT_KEYS, 0)
+
+
+def _safe_float(value, default: float = 0.0) -> float:
+    """Convert an optional box score value to float, or default if missing/invalid."""
+    if value is None:
+        return default
+    if type(value) is float:  # pylint: disable=unidiomatic-typecheck
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
 
 
 def _parse_minutes(minutes_value) -> float:
     """Parse minutes from various formats (MM:SS string or numeric)."""
-    if minutes_value is None:
-        return 0.0
-
-    # If it's already a number, return it
-    if isinstance(minutes_value, (int, float)):
-        return float(minutes_value)
-
-    # Convert to string and handle MM:SS format
-    minutes_str = str(minutes_value).strip()
-    if not minutes_str or minutes_str == "0":
-        return 0.0
+    minutes = parse_minutes(minutes_value)
+    if minutes is not None:
+        return minutes
 
-    # Try parsing as MM:SS format
-    if ":" in minutes_str:
-        try:
-            parts = minutes_str.split(":")
-            if len(parts) == 2:
-                mins = int(parts[0])
-                secs = int(parts[1])
-                return mins + (secs / 60.0)
-        except (ValueError, IndexError):
-            pass
-
-    # Try parsing as plain number
+    # Not a box score clock value; try parsing as plain number
     try:
-        return float(minutes_str)
-    except ValueError:
+        return float(minutes_value)
+    except (TypeError, ValueError):
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     """Fantasy basketball 9-category statistics."""
 
@@ -160,10 +175,12 @@ def compute_player_stats(
             game_date_str = game.get("date", "")
             try:
                 game_date = date.fromisoformat(game_date_str)
-                if game_date >= cutoff_date:
-                    games_to_use.append(game)
             except (ValueError, TypeError):
                 continue
+            if game_date < cutoff_date:
+                # ISO dates sort chronologically, so every later game is older too
+                break
+            games_to_use.append(game)
     else:
         # Game-based filtering: last N games
         games_to_use = sorted_games[:num_games]
@@ -174,56 +191,45 @@ def compute_player_stats(
     # Extract last game date
     last_game_date = games_to_use[0].get("date") if games_to_use else None
 
-    # Aggregate stats
-    total_fgm = 0.0
-    total_fga = 0.0
-    total_ftm = 0.0
-    total_fta = 0.0
-    total_3pm = 0.0
-    total_pts = 0.0
-    total_reb = 0.0
-    total_ast = 0.0
-    total_stl = 0.0
-    total_blk = 0.0
-    total_to = 0.0
+    games_count = len(games_to_use)
+
+    # Aggregate counting stats column by column: one row per game, transposed and
+    # summed per column (each column still adds in game order)
+    rows = []
+    for game in games_to_use:
+        try:
+            rows.append(_get_counting_stats(game))
+        except KeyError:
+            # Older box scores can lack a stat; count it as 0
+            rows.append(_get_counting_stats({**_ZERO_COUNTING_STATS, **game}))
+    (
+        total_fgm,
+        total_fga,
+        total_ftm,
+        total_fta,
+        total_3pm,
+        total_pts,
+        total_reb,
+        total_ast,
+        total_stl,
+        total_blk,
+        total_to,
+    ) = (sum(map(float, column)) for column in zip(*rows))
+
     total_usage = 0.0
     total_plus_minus = 0.0
     total_minutes = 0.0
     games_started = 0
 
-    games_count = len(games_to_use)
-
     for game in games_to_use:
-        total_fgm += float(game.get("FGM", 0))
-        total_fga += float(game.get("FGA", 0))
-        total_ftm += float(game.get("FTM", 0))
-        total_fta += float(game.get("FTA", 0))
-        total_3pm += float(game.get("FG3M", 0))
-        total_pts += float(game.get("PTS", 0))
-        total_reb += float(game.get("REB", 0))
-        total_ast += float(game.get("AST", 0))
-        total_stl += float(game.get("STL", 0))
-        total_blk += float(game.get("BLK", 0))
-        total_to += float(game.get("TO", 0))
-
         # Minutes played
         total_minutes += _parse_minutes(game.get("MIN", 0))
 
         # Usage percentage (already a percentage from 0-1)
-        usg = game.get("USG_PCT")
-        if usg is not None:
-            try:
-                total_usage += float(usg)
-            except (ValueError, TypeError):
-                pass
+        total_usage += _safe_float(game.get("USG_PCT"))
 
         # Plus-minus
-        pm = game.get("PLUS_MINUS")
-        if pm is not None:
-            try:
-                total_plus_minus += float(pm)
-            except (ValueError, TypeError):
-                pass
+        total_plus_minus += _safe_float(game.get("PLUS_MINUS"))
 
         # Count games started
         is_starter = game.get("IS_STARTER", 0)
@@ -234,37 +240,21 @@ def compute_player_stats(
     fg_pct = (total_fgm / total_fga) if total_fga > 0 else 0.0
     ft_pct = (total_ftm / total_fta) if total_fta > 0 else 0.0
 
-    # Calculate counting stats based on aggregation mode
-    if agg_mode == "sum":
-        # Use totals directly
-        result_3pm = total_3pm
-        result_pts = total_pts
-        result_reb = total_reb
-        result_ast = total_ast
-        result_stl = total_stl
-        result_blk = total_blk
-        result_to = total_to
-        result_pm = total_plus_minus
-        result_minutes = total_minutes
-        result_fgm = total_fgm
-        result_fga = total_fga
-        result_ftm = total_ftm
-        result_fta = total_fta
-    else:  # agg_mode == 'avg'
-        # Calculate per-game averages
-        result_3pm = total_3pm / games_count
-        result_pts = total_pts / games_count
-        result_reb = total_reb / games_count
-        result_ast = total_ast / games_count
-        result_stl = total_stl / games_count
-        result_blk = total_blk / games_count
-        result_to = total_to / games_count
-        result_pm = total_plus_minus / games_count
-        result_minutes = total_minutes / games_count
-        result_fgm = total_fgm / games_count
-        result_fga = total_fga / games_count
-        result_ftm = total_ftm / games_count
-        result_fta = total_fta / games_count
+    # Counting stats are totals in 'sum' mode and per-game averages in 'avg' mode
+    divisor = 1 if agg_mode == "sum" else games_count
+    result_3pm = total_3pm / divisor
+    result_pts = total_pts / divisor
+    result_reb = total_reb / divisor
+    result_ast = total_ast / divisor
+    result_stl = total_stl / divisor
+    result_blk = total_blk / divisor
+    result_to = total_to / divisor
+    result_pm = total_plus_minus / divisor
+    result_minutes = total_minutes / divisor
+    result_fgm = total_fgm / divisor
+    result_fga = total_fga / divisor
+    result_ftm = total_ftm / divisor
+    result_fta = total_fta / divisor
 
     # Calculate average usage percentage (always averaged)
     avg_usage = total_usage / games_count if games_count > 0 else 0.0
@@ -292,6 +282,46 @@ def compute_player_stats(
     )
 
 
+def _stats_sort_key(attr: str, missing: float = 0):
+    """Sort key reading a PlayerStats attribute, or `missing` for players without stats."""
+    get_stat = attrgetter(attr)
+
+    def key(player: dict):
+        stats = player.get("stats")
+        return get_stat(stats) if stats else missing
+
+    return key
+
+
+# Sort key function for each sortable column (see sort_by_column)
+_SORT_KEY_FUNCTIONS = {
+    "FG%": _stats_sort_key("fg_pct"),
+    "FT%": _stats_sort_key("ft_pct"),
+    "3PM": _stats_sort_key("threes"),
+    "PTS": _stats_sort_key("points"),
+    "REB": _stats_sort_key("rebounds"),
+    "AST": _stats_sort_key("assists"),
+    "STL": _stats_sort_key("steals"),
+    "BLK": _stats_sort_key("blocks"),
+    "TO": _stats_sort_key("turnovers", missing=999),  # Higher TO is worse
+    "USG%": _stats_sort_key("usage_pct"),
+    "STARTER": _stats_sort_key("games_started"),
+    "GAMES_STARTED": _stats_sort_key("games_started"),
+    "TREND": lambda p: p.get("trend", 0),
+    "MIN_TREND": lambda p: p.get("trend", 0),  # Alias for TREND
+    "MINUTE": lambda p: p.get("minutes", 0),
+    "MIN": lambda p: p.get("minutes", 0),  # Alias for MINUTE
+    "+/-": _stats_sort_key("plus_minus"),
+    "PLUS_MINUS": _stats_sort_key("plus_minus"),
+    "PM": _stats_sort_key("plus_minus"),
+    # Shooting volume stats (not displayed as columns but sortable)
+    "FGM": _stats_sort_key("fgm"),
+    "FGA": _stats_sort_key("fga"),
+    "FTM": _stats_sort_key("ftm"),
+    "FTA": _stats_sort_key("fta"),
+}
+
+
 def sort_by_column(
     players: List[dict], column: str, ascending: bool = None
 ) -> List[dict]:
@@ -316,39 +346,7 @@ def sort_by_column(
     """
     column_upper = column.upper().replace(" ", "_")
 
-    # Define sort key functions for each column
-    column_map = {
-        "FG%": lambda p: p.get("stats").fg_pct if p.get("stats") else 0,
-        "FT%": lambda p: p.get("stats").ft_pct if p.get("stats") else 0,
-        "3PM": lambda p: p.get("stats").threes if p.get("stats") else 0,
-        "PTS": lambda p: p.get("stats").points if p.get("stats") else 0,
-        "REB": lambda p: p.get("stats").rebounds if p.get("stats") else 0,
-        "AST": lambda p: p.get("stats").assists if p.get("stats") else 0,
-        "STL": lambda p: p.get("stats").steals if p.get("stats") else 0,
-        "BLK": lambda p: p.get("stats").blocks if p.get("stats") else 0,
-        "TO": lambda p: (
-            p.get("stats").turnovers if p.get("stats") else 999
-        ),  # Higher TO is worse
-        "USG%": lambda p: p.get("stats").usage_pct if p.get("stats") else 0,
-        "STARTER": lambda p: p.get("stats").games_started if p.get("stats") else 0,
-        "GAMES_STARTED": lambda p: (
-            p.get("stats").games_started if p.get("stats") else 0
-        ),
-        "TREND": lambda p: p.get("trend", 0),
-        "MIN_TREND": lambda p: p.get("trend", 0),  # Alias for TREND
-        "MINUTE": lambda p: p.get("minutes", 0),
-        "MIN": lambda p: p.get("minutes", 0),  # Alias for MINUTE
-        "+/-": lambda p: p.get("stats").plus_minus if p.get("stats") else 0,
-        "PLUS_MINUS": lambda p: p.get("stats").plus_minus if p.get("stats") else 0,
-        "PM": lambda p: p.get("stats").plus_minus if p.get("stats") else 0,
-        # Shooting volume stats (not displayed as columns but sortable)
-        "FGM": lambda p: p.get("stats").fgm if p.get("stats") else 0,
-        "FGA": lambda p: p.get("stats").fga if p.get("stats") else 0,
-        "FTM": lambda p: p.get("stats").ftm if p.get("stats") else 0,
-        "FTA": lambda p: p.get("stats").fta if p.get("stats") else 0,
-    }
-
-    key_fn = column_map.get(column_upper)
+    key_fn = _SORT_KEY_FUNCTIONS.get(column_upper)
 
     if not key_fn:
         # Invalid column, return unsorted
@@ -365,6 +363,22 @@ def sort_by_column(
     return sorted(players, key=key_fn, reverse=reverse)
 
 
+# The 9 fantasy categories, in PlayerStats attribute names
+_NINE_CATEGORIES = (
+    "fg_pct",
+    "ft_pct",
+    "threes",
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+)
+
+_get_9cat_values = attrgetter(*_NINE_CATEGORIES)
+
+
 def calculate_league_averages_and_stddevs(
     players_stats: List[PlayerStats],
 ) -> tuple[dict, dict]:
@@ -379,46 +393,18 @@ def calculate_league_averages_and_stddevs(
     if not players_stats:
         return {}, {}
 
-    # 9 categories to calculate
-    categories = [
-        "fg_pct",
-        "ft_pct",
-        "threes",
-        "points",
-        "rebounds",
-        "assists",
-        "steals",
-        "blocks",
-        "turnovers",
-    ]
+    # One column of values per category, collected in a single pass over players
+    columns = zip(*map(_get_9cat_values, players_stats))
+    count = len(players_stats)
 
-    # Collect values for each category
-    values = {cat: [] for cat in categories}
-    for stats in players_stats:
-        values["fg_pct"].append(stats.fg_pct)
-        values["ft_pct"].append(stats.ft_pct)
-        values["threes"].append(stats.threes)
-        values["points"].append(stats.points)
-        values["rebounds"].append(stats.rebounds)
-        values["assists"].append(stats.assists)
-        values["steals"].append(stats.steals)
-        values["blocks"].append(stats.blocks)
-        values["turnovers"].append(stats.turnovers)
-
-    # Calculate averages
     averages = {}
-    for cat in categories:
-        if values[cat]:
-            averages[cat] = sum(values[cat]) / len(values[cat])
-        else:
-            averages[cat] = 0.0
-
-    # Calculate standard deviations
     stddevs = {}
-    for cat in categories:
-        if len(values[cat]) > 1:
-            mean = averages[cat]
-            variance = sum((x - mean) ** 2 for x in values[cat]) / len(values[cat])
+    for cat, column in zip(_NINE_CATEGORIES, columns):
+        mean = sum(column) / count
+        averages[cat] = mean
+        if count > 1:
+            # Two-pass variance around the mean stays accurate for small spreads
+            variance = sum((x - mean) ** 2 for x in column) / count
             stddevs[cat] = math.sqrt(variance)
         else:
             stddevs[cat] = 1.0  # Avoid division by zero
@@ -442,30 +428,36 @@ def compute_9cat_zscore(
     Returns:
         Total z-score (sum of all 9 category z-scores)
     """
-    total_zscore = 0.0
+    return _sum_zscores(_get_9cat_values(stats), _zscore_plan(averages, stddevs))
 
-    # Categories where higher is better
-    positive_cats = [
-        ("fg_pct", stats.fg_pct),
-        ("ft_pct", stats.ft_pct),
-        ("threes", stats.threes),
-        ("points", stats.points),
-        ("rebounds", stats.rebounds),
-        ("assists", stats.assists),
-        ("steals", stats.steals),
-        ("blocks", stats.blocks),
-    ]
 
-    for cat_name, value in positive_cats:
-        if stddevs.get(cat_name, 0) > 0:
-            z = (value - averages.get(cat_name, 0)) / stddevs[cat_name]
-            total_zscore += z
+# (index into the 9-cat values, mean, stddev, lower_is_better) per scored category
+_ZScorePlan = List[Tuple[int, float, float, bool]]
+
 
-    # Turnovers: lower is better, so invert the z-score
-    if stddevs.get("turnovers", 0) > 0:
-        z = (averages.get("turnovers", 0) - stats.turnovers) / stddevs["turnovers"]
-        total_zscore += z
+def _zscore_plan(averages: dict, stddevs: dict) -> _ZScorePlan:
+    """Resolve league means/stddevs once for scoring many players.
+
+    Categories without a positive stddev don't contribute. Turnovers are
+    inverted since lower is better.
+    """
+    plan: _ZScorePlan = []
+    for idx, cat in enumerate(_NINE_CATEGORIES):
+        stddev = stddevs.get(cat, 0)
+        if stddev > 0:
+            plan.append((idx, averages.get(cat, 0), stddev, cat == "turnovers"))
+    return plan
 
+
+def _sum_zscores(values: Tuple[float, ...], plan: _ZScorePlan) -> float:
+    """Sum a player's 9-cat z-scores (values from _get_9cat_values) under a plan."""
+    total_zscore = 0.0
+    for idx, mean, stddev, lower_is_better in plan:
+        value = values[idx]
+        if lower_is_better:
+            total_zscore += (mean - value) / stddev
+        else:
+            total_zscore += (value - mean) / stddev
     return total_zscore
 
 
@@ -481,37 +473,39 @@ def rank_players_by_zscore(
         List of players sorted by z-score (highest first), with 'z_score' and
         'rank' fields added to each player dict
     """
-    # Filter to players with valid stats
-    valid_players = [p for p in players_with_stats if p.get("stats") is not None]
+    # Extract all PlayerStats objects
+    all_stats = [
+        stats for p in players_with_stats if (stats := p.get("stats")) is not None
+    ]
 
-    if not valid_players:
+    if not all_stats:
         return players_with_stats
 
-    # Extract all PlayerStats objects
-    all_stats = [p["stats"] for p in valid_players]
-
     # Calculate league averages and standard deviations
     averages, stddevs = calculate_league_averages_and_stddevs(all_stats)
 
-    # Compute z-score for each player
-    for player in valid_players:
-        stats = player["stats"]
-        player["z_score"] = compute_9cat_zscore(stats, averages, stddevs)
-
-    # Players without stats get z_score of None
+    # Compute z-score for each player, resolving the league means/stddevs once.
+    # Players without stats get z_score of None and sort last.
+    plan = _zscore_plan(averages, stddevs)
+    sort_keys = []
     for player in players_with_stats:
-        if player.get("stats") is None:
+        stats = player.get("stats")
+        if stats is None:
             player["z_score"] = None
+            sort_keys.append(float("-inf"))
+        else:
+            z_score = _sum_zscores(_get_9cat_values(stats), plan)
+            player["z_score"] = z_score
+            sort_keys.append(z_score)
 
-    # Sort by z-score descending (highest first)
-    sorted_players = sorted(
-        players_with_stats,
-        key=lambda p: p.get("z_score") if p.get("z_score") is not None else float("-inf"),
-        reverse=True,
+    # Sort by z-score descending (highest first) and assign ranks
+    order = sorted(
+        range(len(players_with_stats)), key=sort_keys.__getitem__, reverse=True
     )
-
-    # Assign ranks
-    for idx, player in enumerate(sorted_players, start=1):
-        player["rank"] = idx
+    sorted_players = []
+    for rank, idx in enumerate(order, start=1):
+        player = players_with_stats[idx]
+        player["rank"] = rank
+        sorted_players.append(player)
 
     return sorted_players
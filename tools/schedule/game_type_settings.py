@@ -8,8 +8,9 @@ All-Star, and playoffs can be toggled on/off based on league rules.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Default settings for which game types count towards fantasy
@@ -45,17 +46,17 @@ SETTING_DESCRIPTIONS: Dict[str, str] = {
 }
 
 # Categories for UI grouping
-SETTING_CATEGORIES: Dict[str, list] = {
-    "Regular Season": ["regular_season"],
-    "NBA Cup": ["nba_cup_group_stage", "nba_cup_knockout", "nba_cup_final"],
-    "Playoffs": [
+SETTING_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "Regular Season": ("regular_season",),
+    "NBA Cup": ("nba_cup_group_stage", "nba_cup_knockout", "nba_cup_final"),
+    "Playoffs": (
         "play_in",
         "playoffs_first_round",
         "playoffs_conf_semis",
         "playoffs_conf_finals",
         "nba_finals",
-    ],
-    "Other": ["preseason", "all_star", "global_games"],
+    ),
+    "Other": ("preseason", "all_star", "global_games"),
 }
 
 
@@ -74,18 +75,34 @@ def load_settings() -> Dict[str, bool]:
     """Load game type settings from file.
 
     Returns settings merged with defaults to handle new settings added in updates.
+    The file is only re-read when its modification time or size changes.
 
     Returns:
         Dictionary of setting name to boolean value
     """
     settings_file = get_settings_file_path()
 
+    try:
+        file_stat = settings_file.stat()
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    except OSError:
+        file_version = None
+
+    # Copy so callers can modify their settings without touching the cache
+    return dict(_load_settings_file(str(settings_file), file_version))
+
+
+@lru_cache(maxsize=4)
+def _load_settings_file(
+    settings_path: str, file_version: Optional[Tuple[int, int]]
+) -> Dict[str, bool]:
+    """Read and merge the settings file; file_version is None when it doesn't exist."""
     # Start with defaults
     settings = DEFAULT_SETTINGS.copy()
 
-    if settings_file.exists():
+    if file_version is not None:
         try:
-            with open(settings_file, "r", encoding="utf-8") as f:
+            with open(settings_path, "r", encoding="utf-8") as f:
                 saved_settings = json.load(f)
 
             # Merge saved settings (only override known keys)
@@ -110,22 +127,23 @@ def save_settings(settings: Dict[str, bool]) -> bool:
     """
     settings_file = get_settings_file_path()
 
-    # Only save known settings
+    # Only save known settings, walking the fixed schema in its declared order
     filtered_settings = {
-        key: value
-        for key, value in settings.items()
-        if key in DEFAULT_SETTINGS and isinstance(value, bool)
+        key: settings[key]
+        for key in DEFAULT_SETTINGS
+        if isinstance(settings.get(key), bool)
     }
 
     try:
         with open(settings_file, "w", encoding="utf-8") as f:
             json.dump(filtered_settings, f, indent=2)
+        _load_settings_file.cache_clear()
         return True
     except IOError:
         return False
 
 
-def get_game_type(row: Any) -> Optional[str]:  # pylint: disable=too-many-return-statements
+def get_game_type(row: Any) -> Optional[str]:
     """Determine the game type category from a schedule row.
 
     Args:
@@ -134,61 +152,61 @@ def get_game_type(row: Any) -> Optional[str]:  # pylint: disable=too-many-return
     Returns:
         The setting key that matches this game type, or None if unknown
     """
-    game_subtype = row.get("gameSubtype", "") or ""
-    game_label = row.get("gameLabel", "") or ""
-    game_sublabel = row.get("gameSubLabel", "") or ""
-
-    # Check in order of specificity
+    return _classify_game_type(
+        row.get("gameSubtype", "") or "",
+        row.get("gameLabel", "") or "",
+        row.get("gameSubLabel", "") or "",
+    )
+
+
+# gameSubtype values that decide the game type on their own
+# (NBA Cup knockout games are split on gameSubLabel first)
+_SUBTYPE_GAME_TYPES: Dict[str, str] = {
+    "in-season": "nba_cup_group_stage",
+    "Global Games": "global_games",
+}
 
-    # NBA Cup Final (Championship)
-    if game_subtype == "in-season-knockout" and game_sublabel == "Championship":
-        return "nba_cup_final"
+# gameLabel values that match exactly
+_LABEL_GAME_TYPES: Dict[str, str] = {
+    "Preseason": "preseason",
+    "NBA Finals": "nba_finals",
+}
 
-    # NBA Cup Knockout (Quarterfinals, Semifinals)
+# gameLabel substrings, checked in order of specificity
+_LABEL_SUBSTRING_GAME_TYPES: Tuple[Tuple[str, str], ...] = (
+    ("All-Star", "all_star"),
+    ("Play-In", "play_in"),
+    ("Conf. Finals", "playoffs_conf_finals"),
+    ("Conf. Semifinals", "playoffs_conf_semis"),
+    ("First Round", "playoffs_first_round"),
+)
+
+
+# A season schedule only has a handful of distinct (subtype, label, sublabel)
+# combinations, so classifying each combination once covers every row.
+@lru_cache(maxsize=256)
+def _classify_game_type(
+    game_subtype: str, game_label: str, game_sublabel: str
+) -> Optional[str]:
+    """Classify a game from its normalized schedule fields (see get_game_type)."""
+    # NBA Cup Final (Championship) vs. Knockout (Quarterfinals, Semifinals)
     if game_subtype == "in-season-knockout":
+        if game_sublabel == "Championship":
+            return "nba_cup_final"
         return "nba_cup_knockout"
 
-    # NBA Cup Group Stage
-    if game_subtype == "in-season":
-        return "nba_cup_group_stage"
-
-    # Global Games
-    if game_subtype == "Global Games":
-        return "global_games"
-
-    # Preseason
-    if game_label == "Preseason":
-        return "preseason"
-
-    # All-Star events
-    if "All-Star" in game_label:
-        return "all_star"
-
-    # Play-In Tournament
-    if "Play-In" in game_label:
-        return "play_in"
-
-    # NBA Finals
-    if game_label == "NBA Finals":
-        return "nba_finals"
-
-    # Conference Finals
-    if "Conf. Finals" in game_label:
-        return "playoffs_conf_finals"
-
-    # Conference Semifinals
-    if "Conf. Semifinals" in game_label:
-        return "playoffs_conf_semis"
-
-    # First Round
-    if "First Round" in game_label:
-        return "playoffs_first_round"
+    game_type = _SUBTYPE_GAME_TYPES.get(game_subtype)
+    if game_type is None:
+        game_type = _LABEL_GAME_TYPES.get(game_label)
+    if game_type is not None:
+        return game_type
 
-    # Regular season (empty label and subtype)
-    if not game_label and not game_subtype:
-        return "regular_season"
+    for substring, substring_game_type in _LABEL_SUBSTRING_GAME_TYPES:
+        if substring in game_label:
+            return substring_game_type
 
-    # Unknown game type - default to regular season behavior
+    # Regular season (empty label and subtype); unknown game types default to
+    # regular season behavior too
     return "regular_season"
 
 
@@ -215,6 +233,39 @@ def is_fantasy_eligible_game(row: Any, settings: Optional[Dict[str, bool]] = Non
     return settings.get(game_type, False)
 
 
+def fantasy_eligible_flags(
+    schedule_df: Any, settings: Optional[Dict[str, bool]] = None
+) -> List[bool]:
+    """Check fantasy eligibility for every game in a schedule DataFrame at once.
+
+    Equivalent to calling is_fantasy_eligible_game on each row, but reads the
+    three game type columns once instead of building a row Series per game.
+
+    Args:
+        schedule_df: The NBA API schedule DataFrame
+        settings: Optional settings dict. If None, loads from file.
+
+    Returns:
+        One flag per row, True if that game should count towards fantasy stats
+    """
+    if settings is None:
+        settings = load_settings()
+
+    # Missing values (None/NaN) are blanked like get_game_type does for rows
+    row_count = len(schedule_df)
+    columns = []
+    for column_name in ("gameSubtype", "gameLabel", "gameSubLabel"):
+        column = schedule_df.get(column_name)
+        if column is None:
+            columns.append([""] * row_count)
+        else:
+            columns.append(column.fillna("").tolist())
+
+    return [
+        settings.get(_classify_game_type(*fields), False) for fields in zip(*columns)
+    ]
+
+
 def get_settings_with_metadata() -> Dict[str, Any]:
     """Get settings with descriptions and categories for API response.
 
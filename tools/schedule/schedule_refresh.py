@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 
 from rich.console import Console
 
-from tools.schedule.game_type_settings import is_fantasy_eligible_game, load_settings
+from tools.schedule.game_type_settings import fantasy_eligible_flags, load_settings
 from tools.utils.api_retry import retry_with_backoff
 from tools.utils.timing import TimingTracker
 
@@ -101,18 +101,12 @@ def cache_all_team_schedules(
     # Build team ID to name/abbreviation mapping
     team_info = {team["id"]: team for team in all_teams}
 
-    # Load game type settings for filtering
-    game_type_settings = load_settings()
-    games_filtered = 0
-    games_included = 0
+    # Filter out games that don't count towards fantasy based on settings
+    eligible_df = df[fantasy_eligible_flags(df, load_settings())]
+    games_included = len(eligible_df)
+    games_filtered = len(df) - games_included
 
-    for _, row in df.iterrows():
-        # Filter out games that don't count towards fantasy based on settings
-        if not is_fantasy_eligible_game(row, game_type_settings):
-            games_filtered += 1
-            continue
-
-        games_included += 1
+    for _, row in eligible_df.iterrows():
         home_id = row.get("homeTeam_teamId")
         away_id = row.get("awayTeam_teamId")
         game_date_est = row.get("gameDateEst", "")
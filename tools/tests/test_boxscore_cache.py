@@ -62,6 +62,21 @@ def test_save_and_load_player_games(temp_cache_dir, sample_player_games, monkeyp
     assert len(loaded_player["games"]) == 3
 
 
+
+@pytest.mark.unit
+def test_player_has_game_on(temp_cache_dir, sample_player_games, monkeypatch):
+    """Test checking a player's cached games for a specific date."""
+    monkeypatch.setattr(boxscore_cache, "get_cache_dir", lambda: temp_cache_dir)
+
+    player_id = sample_player_games["player_id"]
+    boxscore_cache.save_player_games(
+        player_id, sample_player_games["player_name"], sample_player_games, "2025-26"
+    )
+
+    assert boxscore_cache.player_has_game_on(player_id, "2025-26", "2024-10-25")
+    assert not boxscore_cache.player_has_game_on(player_id, "2025-26", "2024-10-26")
+    assert not boxscore_cache.player_has_game_on(999999, "2025-26", "2024-10-25")
+
 @pytest.mark.unit
 def test_get_cached_date_range(temp_cache_dir, monkeypatch):
     """Test getting cached date range from metadata."""
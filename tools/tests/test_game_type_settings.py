@@ -11,6 +11,7 @@ import pytest
 
 from tools.schedule.game_type_settings import (
     DEFAULT_SETTINGS,
+    fantasy_eligible_flags,
     get_game_type,
     is_fantasy_eligible_game,
     load_settings,
@@ -230,6 +231,29 @@ class TestIsFantasyEligibleGame:
         custom_settings = {**DEFAULT_SETTINGS, "nba_finals": True}
         assert is_fantasy_eligible_game(row, custom_settings) is True
 
+    @pytest.mark.unit
+    def test_fantasy_eligible_flags_match_per_row_check(self):
+        """Whole-schedule flags agree with checking each row."""
+        pd = pytest.importorskip("pandas")
+        rows = [
+            {"gameLabel": "", "gameSubtype": "", "gameSubLabel": ""},
+            {"gameLabel": None, "gameSubtype": None, "gameSubLabel": None},
+            {"gameLabel": "Preseason", "gameSubtype": "", "gameSubLabel": ""},
+            {
+                "gameLabel": "Emirates NBA Cup",
+                "gameSubtype": "in-season-knockout",
+                "gameSubLabel": "Championship",
+            },
+            {"gameLabel": "NBA Finals", "gameSubtype": "", "gameSubLabel": "Game 7"},
+            {"gameLabel": "", "gameSubtype": "Global Games", "gameSubLabel": ""},
+        ]
+        custom_settings = {**DEFAULT_SETTINGS, "nba_finals": True}
+
+        flags = fantasy_eligible_flags(pd.DataFrame(rows), custom_settings)
+
+        assert flags == [is_fantasy_eligible_game(row, custom_settings) for row in rows]
+        assert flags == [True, True, False, False, True, True]
+
 
 class TestSettingsPersistence:
     """Tests for saving and loading settings."""
@@ -294,6 +318,32 @@ class TestSettingsPersistence:
                 assert loaded["nba_cup_final"] is False
                 assert loaded["nba_finals"] is False
 
+    @pytest.mark.unit
+    def test_load_settings_rereads_file_after_external_edit(self):
+        """Load picks up changes made to the file outside save_settings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "game_type_settings.json"
+            with open(settings_file, "w", encoding="utf-8") as f:
+                json.dump({"preseason": True}, f)
+
+            with patch(
+                "tools.schedule.game_type_settings.get_settings_file_path",
+                return_value=settings_file,
+            ):
+                assert load_settings()["preseason"] is True
+
+                # Different size, so the change is seen even with a coarse mtime
+                with open(settings_file, "w", encoding="utf-8") as f:
+                    json.dump({"preseason": False, "all_star": True}, f)
+
+                loaded = load_settings()
+                assert loaded["preseason"] is False
+                assert loaded["all_star"] is True
+
+                # Mutating the result doesn't leak into later loads
+                loaded["all_star"] = False
+                assert load_settings()["all_star"] is True
+
 
 class TestScheduleFilteringIntegration:
     """Integration tests for schedule filtering with game type settings."""
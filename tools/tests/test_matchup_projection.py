@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import date
+import threading
+import time
+from datetime import date, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -98,7 +100,9 @@ def test_calculate_projected_points(sample_stat_categories):
     }
 
     points_a, points_b = matchup_projection._calculate_projected_points(
-        sample_stat_categories, team_a_projection, team_b_projection
+        matchup_projection._projection_plan(sample_stat_categories),
+        team_a_projection,
+        team_b_projection,
     )
 
     # Team A should win: FG%, FT%, 3PTM, PTS, REB, STL, TO = 7 categories
@@ -131,7 +135,7 @@ def test_calculate_projected_points_tie():
     team_b_projection = {"0": 100.0, "1": 45.0}  # Tie in PTS
 
     points_a, points_b = matchup_projection._calculate_projected_points(
-        sample_categories, team_a_projection, team_b_projection
+        matchup_projection._projection_plan(sample_categories), team_a_projection, team_b_projection
     )
 
     # PTS is tie (1.0 tie each), REB goes to B
@@ -170,7 +174,11 @@ def test_project_player_stats(mock_load_stats, mock_lookup, sample_stat_categori
     game_dates = ["2024-11-01", "2024-11-03", "2024-11-05"]  # 3 games
 
     projected = matchup_projection._project_player_stats(
-        "league_key", player, game_dates, sample_stat_categories, "2024-25"
+        "league_key",
+        player,
+        game_dates,
+        matchup_projection._projection_plan(sample_stat_categories),
+        "2024-25",
     )
 
     # Percentages should not be multiplied
@@ -198,7 +206,11 @@ def test_project_player_stats_no_nba_id(mock_lookup, sample_stat_categories):
     game_dates = ["2024-11-01"]
 
     projected = matchup_projection._project_player_stats(
-        "league_key", player, game_dates, sample_stat_categories, "2024-25"
+        "league_key",
+        player,
+        game_dates,
+        matchup_projection._projection_plan(sample_stat_categories),
+        "2024-25",
     )
 
     # Should return zeros for all stats
@@ -206,6 +218,652 @@ def test_project_player_stats_no_nba_id(mock_lookup, sample_stat_categories):
         assert projected[stat_id] == 0.0
 
 
+@pytest.mark.unit
+def test_project_season_stats_scales_counting_stats_only():
+    """Test that season projection scales counting stats but not percentages."""
+    categories = matchup_projection._projection_plan(
+        [
+            {"stat_id": "0", "display_name": "FG%", "is_only_display_stat": 0},
+            {"stat_id": "12", "display_name": "PTS", "is_only_display_stat": 0},
+            {"stat_id": "99", "display_name": "DD", "is_only_display_stat": 0},
+            {"stat_id": "9004003", "display_name": "FGM/A", "is_only_display_stat": 1},
+        ]
+    ).categories
+
+    projected = matchup_projection._project_season_stats(
+        {"fg_pct": 0.5, "points": 20.0}, 3, categories
+    )
+
+    assert projected == {"0": 0.5, "12": 60.0, "99": 0.0}
+
+
+@pytest.mark.unit
+def test_projection_plan_resolves_fields_and_percentages(sample_stat_categories):
+    """Test that the projection plan maps counting stats to game fields and finds FG%/FT%."""
+    plan = matchup_projection._projection_plan(sample_stat_categories)
+
+    assert ("2", "FG3M") in plan.counting_fields
+    assert ("3", "PTS") in plan.counting_fields
+    assert all(stat_id not in ("0", "1") for stat_id, _ in plan.counting_fields)
+    assert plan.fg_pct_ids == ("0",)
+    assert plan.ft_pct_ids == ("1",)
+
+
+@pytest.mark.unit
+def test_projection_plan_resolves_sort_order_and_tiebreaks():
+    """Test that scored categories resolve sort direction and FG%/FT% tiebreak volume."""
+    stat_meta = [
+        {"stat_id": 5, "display_name": "FG%", "sort_order": "1", "is_only_display_stat": 0},
+        {"stat_id": "9", "name": "TO", "sort_order": "0", "is_only_display_stat": 0},
+        {"stat_id": "10", "display_name": "FGM/A", "is_only_display_stat": 1},
+    ]
+
+    categories = matchup_projection._projection_plan(stat_meta).categories
+
+    assert [c.stat_id for c in categories] == ["5", "9"]
+    assert categories[0].tiebreak_volume_key == "_FGA"
+    assert not categories[0].is_ascending
+    assert categories[1].is_ascending
+    assert categories[1].tiebreak_volume_key is None
+
+
+@pytest.mark.unit
+@patch("tools.boxscore.boxscore_cache.load_player_season_stats")
+def test_prefetch_season_stats_loads_each_player_once(mock_load_stats):
+    """Test that season stats are prefetched once per unique NBA ID."""
+    mock_load_stats.side_effect = lambda nba_id, season: {"points": float(nba_id)}
+
+    prefetched = matchup_projection._prefetch_season_stats([1, 2, 2, None], "2024-25")
+
+    assert prefetched == {1: {"points": 1.0}, 2: {"points": 2.0}}
+    assert mock_load_stats.call_count == 2
+
+
+@pytest.mark.unit
+def test_sum_player_contributions_to_team_total(sample_stat_categories):
+    """Test that counting stats are summed and percentages use shooting volume."""
+    contributions = {
+        "p1": {"0": 0.5, "1": 0.8, "2": 3.0, "3": 20.0},
+        "p2": {"0": 0.4, "1": 0.9, "2": 1.0},
+    }
+    shooting = {
+        "p1": {"fgm": 8.0, "fga": 16.0, "ftm": 4.0, "fta": 5.0},
+        "p2": {"fgm": 2.0, "fga": 4.0},
+    }
+
+    totals = matchup_projection._sum_player_contributions_to_team_total(
+        contributions, shooting, matchup_projection._projection_plan(sample_stat_categories)
+    )
+
+    assert totals["0"] == 10.0 / 20.0
+    assert totals["1"] == 4.0 / 5.0
+    assert totals["2"] == 4.0
+    assert totals["3"] == 20.0
+    assert totals["_FGA"] == 20.0
+    assert totals["_FTA"] == 5.0
+
+
+@pytest.mark.unit
+def test_sum_player_contributions_keeps_empty_categories(sample_stat_categories):
+    """Test that categories without contributions are zero and keep stat_meta order."""
+    totals = matchup_projection._sum_player_contributions_to_team_total(
+        {"p1": {"3": 20.0}}, {}, matchup_projection._projection_plan(sample_stat_categories)
+    )
+
+    stat_ids = [str(stat["stat_id"]) for stat in sample_stat_categories]
+    assert list(totals)[: len(stat_ids)] == stat_ids
+    assert totals["3"] == 20.0
+    assert all(totals[stat_id] == 0.0 for stat_id in stat_ids if stat_id != "3")
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection._aggregate_projected_contributions")
+@patch("tools.matchup.matchup_projection._aggregate_current_week_player_contributions")
+def test_project_team_reuses_projected_contributions(
+    mock_current, mock_projected, sample_stat_categories
+):
+    """Test that precomputed projected contributions skip the projected pass."""
+    mock_current.return_value = ({"p1": {"3": 10.0}}, {}, {}, {}, {}, {})
+    week_start = date.today()
+
+    totals = matchup_projection._project_team(
+        "league",
+        {},
+        week_start,
+        week_start + timedelta(days=6),
+        matchup_projection._projection_plan(sample_stat_categories),
+        "2024-25",
+        projected_contributions=({"p1": {"3": 5.0}}, {}),
+    )
+
+    mock_projected.assert_not_called()
+    assert totals["3"] == 15.0
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection._aggregate_projected_contributions")
+@patch("tools.matchup.matchup_projection._aggregate_current_week_player_contributions")
+def test_project_team_reuses_current_contributions(
+    mock_current, mock_projected, sample_stat_categories
+):
+    """Test that precomputed current-week contributions skip the current-week pass."""
+    week_start = date.today()
+
+    totals = matchup_projection._project_team(
+        "league",
+        {},
+        week_start,
+        week_start + timedelta(days=6),
+        matchup_projection._projection_plan(sample_stat_categories),
+        "2024-25",
+        projected_contributions=({"p1": {"3": 5.0}}, {}),
+        current_contributions=({"p1": {"3": 10.0}}, {}),
+    )
+
+    mock_current.assert_not_called()
+    mock_projected.assert_not_called()
+    assert totals["3"] == 15.0
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection._project_team", return_value={})
+@patch("tools.matchup.matchup_projection._aggregate_current_week_player_contributions")
+@patch("tools.matchup.matchup_projection._aggregate_projected_contributions")
+@patch("tools.matchup.matchup_projection.fetch_team_stats_for_week")
+def test_project_team_entry_fetches_weekly_stats_within_yahoo_limit(
+    mock_weekly, mock_projected, mock_current, _mock_project_team
+):
+    """Test that the background weekly stats request holds a Yahoo slot."""
+    limit = threading.BoundedSemaphore(1)
+    held_during_fetch = []
+
+    def _weekly(league_key, team_id, week):
+        # The only slot is taken while the request runs
+        held_during_fetch.append(not limit.acquire(blocking=False))
+        return {"team_points": {"total": "4"}}
+
+    mock_weekly.side_effect = _weekly
+    mock_projected.return_value = ({}, {}, {}, {}, {}, {}, {}, {})
+    mock_current.return_value = ({}, {}, {}, {}, {}, {})
+    week_start = date(2024, 11, 4)
+
+    with patch.object(matchup_projection, "_YAHOO_CALL_LIMIT", limit):
+        team = matchup_projection._project_team_entry(
+            "nba.l.1",
+            matchup_projection._projection_plan([]),
+            week_start,
+            week_start + timedelta(days=6),
+            {"name": "Team"},
+            "2024-25",
+            {"nba.l.1.t.1": {}},
+            5,
+            "season",
+            False,
+            "nba.l.1.t.1",
+        )
+
+    assert held_during_fetch == [True]
+    assert team.team_points == {"total": "4"}
+
+
+@pytest.mark.unit
+def test_team_totals_use_string_stat_ids_for_scoring():
+    """Test that int stat_ids in stat_meta produce str-keyed totals that scoring reads."""
+    stat_meta = [
+        {"stat_id": 12, "display_name": "PTS", "sort_order": "1", "is_only_display_stat": 0},
+        {"stat_id": 19, "display_name": "TO", "sort_order": "0", "is_only_display_stat": 0},
+    ]
+    team_a = matchup_projection._sum_player_contributions_to_team_total(
+        {"p1": {"12": 30.0, "19": 2.0}}, {}, matchup_projection._projection_plan(stat_meta)
+    )
+    team_b = matchup_projection._sum_player_contributions_to_team_total(
+        {"p2": {"12": 20.0, "19": 4.0}}, {}, matchup_projection._projection_plan(stat_meta)
+    )
+
+    assert team_a["12"] == 30.0 and 12 not in team_a
+    points_a, points_b = matchup_projection._calculate_projected_points(
+        matchup_projection._projection_plan(stat_meta), team_a, team_b
+    )
+    assert points_a["win"] == 2.0
+    assert points_b["loss"] == 2.0
+
+
+@pytest.mark.unit
+def test_combine_team_totals_recomputes_percentages(sample_stat_categories):
+    """Test that combined totals add counting stats and derive FG%/FT% from volume."""
+    current = {"0": 0.5, "1": 0.8, "2": 3.0, "3": 40.0, "_FGM": 10.0, "_FGA": 20.0, "_FTM": 4.0, "_FTA": 5.0}
+    remaining = {"0": 0.25, "1": 1.0, "2": 2.0, "3": 10.0, "_FGM": 2.0, "_FGA": 8.0, "_FTM": 1.0, "_FTA": 1.0}
+
+    totals = matchup_projection._combine_team_totals(
+        current, remaining, matchup_projection._projection_plan(sample_stat_categories)
+    )
+
+    assert totals["0"] == 12.0 / 28.0
+    assert totals["1"] == 5.0 / 6.0
+    assert totals["2"] == 5.0
+    assert totals["3"] == 50.0
+    assert totals["_FGA"] == 28.0
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection._project_team_entry")
+def test_build_matchup_projection_keeps_team_order(mock_project_entry):
+    """Test that concurrently projected teams come back in entry order."""
+    mock_project_entry.side_effect = lambda *args: matchup_projection._ProjectedTeam(
+        team_key=args[4]["team_key"], team_name="", projection={}, current={}, team_points={}
+    )
+    team_entries = [{"team_key": "nba.l.1.t.2"}, {"team_key": None}, {"team_key": "nba.l.1.t.1"}]
+
+    result = matchup_projection._build_matchup_projection(
+        "nba.l.1", [], date(2024, 11, 4), date(2024, 11, 10), team_entries, "2024-25"
+    )
+
+    assert [team["team_key"] for team in result["teams"]] == ["nba.l.1.t.2", "nba.l.1.t.1"]
+    assert result["teams"][0]["projected_team_points"]["total"] == 0.0
+    assert mock_project_entry.call_count == 2
+
+
+@pytest.mark.unit
+def test_project_league_matchups_keeps_scoreboard_order(tmp_path):
+    """Test that concurrently projected league matchups come back in scoreboard order."""
+    stats_dir = tmp_path / "season_stats" / "2024-25"
+    stats_dir.mkdir(parents=True)
+    (stats_dir / "1.json").write_text("{}")
+    matchups = [
+        Mock(week=5, week_start="2024-11-04", week_end="2024-11-10", key=f"m{i}")
+        for i in range(4)
+    ]
+    mock_cache = Mock()
+    mock_cache.load_metadata.return_value = {"games_cached": 10}
+    mock_cache.get_cache_dir.return_value = tmp_path
+
+    with patch.object(matchup_projection, "boxscore_cache", mock_cache), patch.object(
+        matchup_projection, "_current_season", return_value="2024-25"
+    ), patch.object(matchup_projection, "determine_current_week", return_value=5), patch.object(
+        matchup_projection, "fetch_league_scoreboard", return_value=Mock(matchups=matchups, week=5)
+    ), patch.object(
+        matchup_projection, "fetch_league_stat_categories", return_value=[]
+    ), patch.object(
+        matchup_projection,
+        "_resolve_matchup_teams",
+        side_effect=lambda matchup: ({"team_key": matchup.key}, {"team_key": "x"}),
+    ), patch.object(
+        matchup_projection,
+        "_build_matchup_projection",
+        side_effect=lambda league_key, stat_meta, start, end, teams, **kwargs: {
+            "teams": [teams[0]["team_key"]]
+        },
+    ) as mock_build:
+        result = matchup_projection.project_league_matchups(
+            "nba.l.1", anchor_team_key="nba.l.1.t.1"
+        )
+
+    assert [bundle["teams"][0] for bundle in result["matchups"]] == ["m0", "m1", "m2", "m3"]
+    assert all(bundle["week"] == 5 for bundle in result["matchups"])
+    assert mock_build.call_count == 4
+    # Stat categories are resolved once for the whole league, not per matchup
+    assert len({id(call.kwargs["plan"]) for call in mock_build.call_args_list}) == 1
+
+
+@pytest.mark.unit
+def test_project_league_matchups_caps_concurrent_yahoo_calls(tmp_path):
+    """Test that concurrent matchups and teams stay within the Yahoo call limit."""
+    stats_dir = tmp_path / "season_stats" / "2024-25"
+    stats_dir.mkdir(parents=True)
+    (stats_dir / "1.json").write_text("{}")
+    matchups = [
+        Mock(week=5, week_start="2024-11-04", week_end="2024-11-10", key=i)
+        for i in range(4)
+    ]
+    mock_cache = Mock()
+    mock_cache.load_metadata.return_value = {"games_cached": 10}
+    mock_cache.get_cache_dir.return_value = tmp_path
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    def _yahoo_request(result):
+        def _request(*args):
+            with lock:
+                state["active"] += 1
+                state["calls"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.005)
+            with lock:
+                state["active"] -= 1
+            return result
+
+        return _request
+
+    with patch.object(matchup_projection, "boxscore_cache", mock_cache), patch.object(
+        matchup_projection, "_current_season", return_value="2024-25"
+    ), patch.object(matchup_projection, "determine_current_week", return_value=5), patch.object(
+        matchup_projection, "fetch_league_scoreboard", return_value=Mock(matchups=matchups, week=5)
+    ), patch.object(
+        matchup_projection, "fetch_league_stat_categories", return_value=[]
+    ), patch.object(
+        matchup_projection,
+        "_resolve_matchup_teams",
+        side_effect=lambda matchup: (
+            {"team_key": f"nba.l.1.t.{2 * matchup.key + 1}"},
+            {"team_key": f"nba.l.1.t.{2 * matchup.key + 2}"},
+        ),
+    ), patch.object(
+        matchup_projection, "fetch_team_roster_for_date", side_effect=_yahoo_request([])
+    ), patch.object(
+        matchup_projection, "fetch_team_stats_for_week", side_effect=_yahoo_request({})
+    ), patch.object(
+        matchup_projection,
+        "_aggregate_projected_contributions",
+        return_value=({}, {}, {}, {}, {}, {}, {}, {}),
+    ), patch.object(
+        matchup_projection,
+        "_aggregate_current_week_player_contributions",
+        return_value=({}, {}, {}, {}, {}, {}),
+    ), patch.object(
+        matchup_projection, "_project_team", return_value={}
+    ):
+        result = matchup_projection.project_league_matchups(
+            "nba.l.1", anchor_team_key="nba.l.1.t.1"
+        )
+
+    assert len(result["matchups"]) == 4
+    # 8 teams, each with 7 roster dates and one weekly stats request
+    assert state["calls"] == 8 * 8
+    assert 1 <= state["peak"] <= matchup_projection._YAHOO_MAX_CONCURRENCY
+
+
+@pytest.mark.unit
+def test_project_matchup_serves_cached_result_unless_forced(tmp_path, monkeypatch):
+    """Test that a repeated projection is served from disk and force_refresh recomputes it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    stats_dir = tmp_path / "season_stats" / "2024-25"
+    stats_dir.mkdir(parents=True)
+    (stats_dir / "1.json").write_text("{}")
+    mock_cache = Mock()
+    mock_cache.load_metadata.return_value = {"games_cached": 10}
+    mock_cache.get_cache_dir.return_value = tmp_path
+    matchup = Mock(week=5, week_start="2024-11-04", week_end="2024-11-10")
+    user = {"team_key": "nba.l.1.t.1", "projection": {"12": 100.0}}
+    opponent = {"team_key": "nba.l.1.t.2", "projection": {"12": 90.0}}
+
+    with patch.object(matchup_projection, "boxscore_cache", mock_cache), patch.object(
+        matchup_projection, "_current_season", return_value="2024-25"
+    ), patch.object(
+        matchup_projection, "fetch_matchup_context", return_value=(matchup, None)
+    ) as mock_context, patch.object(
+        matchup_projection, "fetch_league_stat_categories", return_value=[]
+    ), patch.object(
+        matchup_projection, "_resolve_matchup_teams", return_value=(user, opponent)
+    ), patch.object(
+        matchup_projection,
+        "_build_matchup_projection",
+        return_value={
+            "stat_categories": [],
+            "teams": [user, opponent],
+            "week_start": "2024-11-04",
+            "week_end": "2024-11-10",
+        },
+    ) as mock_build:
+        first = matchup_projection.project_matchup("nba.l.1", "nba.l.1.t.1", week=5)
+        second = matchup_projection.project_matchup("nba.l.1", "nba.l.1.t.1", week=5)
+        assert mock_build.call_count == 1
+        assert mock_context.call_count == 1
+
+        forced = matchup_projection.project_matchup(
+            "nba.l.1", "nba.l.1.t.1", week=5, force_refresh=True
+        )
+        assert mock_build.call_count == 2
+
+    assert first["user_projection"] == {"12": 100.0}
+    assert second == first
+    assert forced == first
+
+
+@pytest.mark.unit
+def test_project_league_matchups_summary_skips_stat_categories():
+    """Test that summary mode doesn't fetch stat categories or attach them per matchup."""
+    matchup = Mock(week=5, week_start="2024-11-04", week_end="2024-11-10")
+    team_a = {"team_key": "a", "name": "A", "team_points": {"total": "6"}}
+    team_b = {"team_key": "b", "name": "B", "team_points": {"total": "3"}}
+
+    with patch.object(matchup_projection, "_current_season", return_value="2024-25"), patch.object(
+        matchup_projection, "determine_current_week", return_value=5
+    ), patch.object(
+        matchup_projection, "fetch_league_scoreboard", return_value=Mock(matchups=[matchup], week=5)
+    ), patch.object(
+        matchup_projection, "fetch_league_stat_categories"
+    ) as mock_stat_categories, patch.object(
+        matchup_projection, "_resolve_matchup_teams", return_value=(team_a, team_b)
+    ):
+        result = matchup_projection.project_league_matchups(
+            "nba.l.1", anchor_team_key="nba.l.1.t.1", summary_only=True
+        )
+
+    mock_stat_categories.assert_not_called()
+    assert result["stat_categories"] == []
+    bundle = result["matchups"][0]
+    assert "stat_categories" not in bundle
+    assert [team["team_points"] for team in bundle["teams"]] == [6.0, 3.0]
+
+
+@pytest.mark.unit
+def test_projected_team_to_dict_omits_unset_projected_points():
+    """Test that a team without head-to-head points serializes without that key."""
+    contributions = {"p1": {"3": 1.0}}
+    team = matchup_projection._ProjectedTeam(
+        team_key="nba.l.1.t.1",
+        team_name="Team",
+        projection={},
+        current={},
+        team_points={},
+        player_contributions=contributions,
+    )
+
+    data = team.to_dict()
+
+    assert "projected_team_points" not in data
+    assert data["player_contributions"] is contributions
+    assert data["player_positions"] == {}
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection.fetch_team_roster_for_date")
+def test_collect_roster_reuses_latest_roster_for_future_dates(mock_fetch_roster):
+    """Test that past dates are fetched and future dates reuse today's roster."""
+
+    class _FixedDate(date):
+        @classmethod
+        def today(cls):
+            return date(2024, 11, 5)
+
+    mock_fetch_roster.side_effect = lambda league_key, team_id, current: [
+        {"player": {"player_key": f"nba.p.{current.day}"}}
+    ]
+
+    with patch("tools.matchup.matchup_projection.date", _FixedDate):
+        rosters = matchup_projection._collect_roster(
+            "nba.l.1", 1, date(2024, 11, 4), date(2024, 11, 7)
+        )
+
+    assert list(rosters) == ["2024-11-04", "2024-11-05", "2024-11-06", "2024-11-07"]
+    assert rosters["2024-11-04"] == [{"player_key": "nba.p.4"}]
+    assert rosters["2024-11-06"] == [{"player_key": "nba.p.5"}]
+    assert rosters["2024-11-07"] == [{"player_key": "nba.p.5"}]
+    assert mock_fetch_roster.call_count == 2
+
+
+def _track_concurrent_roster_fetches(mock_fetch_roster):
+    """Make the roster mock record the peak number of overlapping calls."""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def _fetch(league_key, team_id, current):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return [{"player": {"player_key": f"nba.p.{current.day}"}}]
+
+    mock_fetch_roster.side_effect = _fetch
+    return state
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection.fetch_team_roster_for_date")
+def test_collect_roster_bounds_past_week_fetches(mock_fetch_roster):
+    """Test that a past week is fetched in parallel, but within the Yahoo limit."""
+    state = _track_concurrent_roster_fetches(mock_fetch_roster)
+
+    rosters = matchup_projection._collect_roster(
+        "nba.l.1", 1, date(2024, 11, 4), date(2024, 11, 10)
+    )
+
+    assert list(rosters)[0] == "2024-11-04"
+    assert rosters["2024-11-10"] == [{"player_key": "nba.p.10"}]
+    assert mock_fetch_roster.call_count == 7
+    assert 1 <= state["peak"] <= matchup_projection._YAHOO_MAX_CONCURRENCY
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection.fetch_team_roster_for_date")
+def test_collect_roster_fetches_current_week_sequentially(mock_fetch_roster):
+    """Test that the current week's roster dates are fetched one at a time."""
+    state = _track_concurrent_roster_fetches(mock_fetch_roster)
+    today = date.today()
+
+    matchup_projection._collect_roster(
+        "nba.l.1", 1, today - timedelta(days=3), today + timedelta(days=3)
+    )
+
+    assert mock_fetch_roster.call_count == 4
+    assert state["peak"] == 1
+
+
+@pytest.mark.unit
+@patch("tools.player.player_fetcher.player_id_lookup")
+def test_lookup_player_id_reuses_id_cache(mock_lookup):
+    """Test that a shared id_cache resolves each name once, including misses."""
+    mock_lookup.side_effect = lambda name: 203507 if name == "Test Player" else None
+    id_cache = {}
+
+    for _ in range(3):
+        assert matchup_projection._lookup_player_id("Test Player", id_cache) == 203507
+        assert matchup_projection._lookup_player_id("Unknown", id_cache) is None
+
+    assert mock_lookup.call_count == 2
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection.compute_player_stats")
+def test_compute_mode_stats_reuses_stats_cache(mock_compute):
+    """Test that a shared stats_cache computes each player's mode averages once."""
+    mock_compute.return_value = None
+    stats_cache = {}
+
+    for _ in range(3):
+        assert matchup_projection._compute_mode_stats(203507, "2024-25", "last7", stats_cache) is None
+        matchup_projection._compute_mode_stats(203507, "2024-25", "last3", stats_cache)
+
+    assert mock_compute.call_count == 2
+
+
+@pytest.mark.unit
+@patch("tools.matchup.matchup_projection.compute_player_stats")
+def test_prefetch_mode_stats_fills_stats_cache(mock_compute):
+    """Test that mode stats are computed once per missing NBA ID into the cache."""
+    mock_compute.side_effect = lambda **kwargs: kwargs["player_id"] * 10
+    stats_cache = {(1, "last7"): 5}
+
+    matchup_projection._prefetch_mode_stats([1, 2, 2, None, 3], "2024-25", "last7", stats_cache)
+
+    assert stats_cache == {(1, "last7"): 5, (2, "last7"): 20, (3, "last7"): 30}
+    assert mock_compute.call_count == 2
+
+
+@pytest.mark.unit
+@patch("tools.schedule.schedule_fetcher.fetch_player_upcoming_games_from_cache")
+def test_player_schedule_reuses_schedule_cache(mock_schedule):
+    """Test that a shared schedule_cache loads each player's week schedule once."""
+    mock_schedule.return_value = PlayerSchedule(player_id=203507, game_dates=["2024-11-05"])
+    schedule_cache = {}
+
+    for _ in range(3):
+        schedule = matchup_projection._player_schedule(
+            203507, "2024-11-04", "2024-11-10", "2024-25", schedule_cache
+        )
+        assert schedule.game_dates == ["2024-11-05"]
+
+    mock_schedule.assert_called_once_with(203507, "2024-11-04", "2024-11-10", "2024-25")
+
+
+@pytest.mark.unit
+@patch("tools.schedule.schedule_fetcher.fetch_player_upcoming_games_from_cache")
+@patch("tools.player.player_fetcher.player_id_lookup")
+def test_compute_daily_player_contributions_marks_inactive_dates(
+    mock_lookup, mock_schedule, sample_stat_categories
+):
+    """Test that active dates get the per-game line and benched dates are marked inactive."""
+    mock_lookup.return_value = 203507
+    mock_schedule.return_value = PlayerSchedule(
+        player_id=203507, game_dates=["2024-11-05", "2024-11-06"]
+    )
+    roster = {
+        "2024-11-05": [
+            {"player_key": "nba.p.1", "name": {"full": "Test Player"}, "selected_position": {"position": "PG"}}
+        ],
+        "2024-11-06": [
+            {"player_key": "nba.p.1", "name": {"full": "Test Player"}, "selected_position": {"position": "BN"}}
+        ],
+    }
+    season_stats = {203507: {"fg_pct": 0.5, "points": 25.0, "threes": 2.0, "fgm": 9.0, "fga": 18.0}}
+
+    daily, _, positions, _ = matchup_projection._compute_daily_player_contributions(
+        "nba.l.1",
+        roster,
+        date(2024, 11, 4),
+        date(2024, 11, 10),
+        matchup_projection._projection_plan(sample_stat_categories),
+        "2024-25",
+        prefetched_season_stats=season_stats,
+    )
+
+    active_day = daily["nba.p.1"]["2024-11-05"]
+    assert active_day["0"] == 0.5
+    assert active_day["2"] == 2.0
+    assert active_day["3"] == 25.0
+    assert active_day["_FGA"] == 18.0
+    assert daily["nba.p.1"]["2024-11-06"] == {"_INACTIVE": 1}
+    assert positions["nba.p.1"] == {"2024-11-05": "PG", "2024-11-06": "BN"}
+
+
+@pytest.mark.unit
+def test_extract_player_stats_handles_mixed_entries():
+    """Test stat extraction from wrapped, flat, serializable and malformed entries."""
+    serializable = Mock()
+    serializable.serialized.return_value = {"stat_id": 15, "value": "4"}
+    player = {
+        "player_stats": {
+            "stats": [
+                {"stat": {"stat_id": 12, "value": "25"}},
+                {"stat_id": "5", "value": 0.5},
+                {"stat": {"stat_id": 18, "value": "-"}},
+                serializable,
+                "not a stat",
+            ]
+        }
+    }
+
+    assert matchup_projection._extract_player_stats(player) == {
+        "12": 25.0,
+        "5": 0.5,
+        "18": 0.0,
+        "15": 4.0,
+    }
+
+
 @pytest.mark.unit
 def test_date_range():
     """Test _date_range helper function."""
@@ -220,6 +878,17 @@ def test_date_range():
     assert dates[2] == date(2024, 11, 3)
 
 
+@pytest.mark.unit
+def test_roster_dates_preserves_sorted_insertion_order():
+    """Test that roster dates come back chronological regardless of key order."""
+    in_order = {"2024-11-01": [], "2024-11-02": [], "2024-11-03": []}
+    out_of_order = {"2024-11-03": [], "2024-11-01": [], "2024-11-02": []}
+
+    expected = ["2024-11-01", "2024-11-02", "2024-11-03"]
+    assert matchup_projection._roster_dates(in_order) == expected
+    assert matchup_projection._roster_dates(out_of_order) == expected
+
+
 @pytest.mark.unit
 def test_stat_sort_order():
     """Test _stat_sort_order helper function."""
@@ -517,7 +1186,7 @@ class TestRosterContributionsLogic:
                     roster,
                     week_start,
                     week_end,
-                    stat_meta,
+                    matchup_projection._projection_plan(stat_meta),
                     _season="2024-25",
                 )
 
@@ -610,7 +1279,7 @@ class TestRosterContributionsLogic:
                         roster,
                         week_start,
                         week_end,
-                        stat_meta,
+                        matchup_projection._projection_plan(stat_meta),
                         _season="2024-25",
                     )
 
@@ -737,7 +1406,7 @@ class TestRosterContributionsLogic:
                                 roster,
                                 week_start,
                                 week_end,
-                                stat_meta,
+                                matchup_projection._projection_plan(stat_meta),
                                 season="2024-25",
                             )
 
@@ -866,7 +1535,7 @@ class TestRosterContributionsLogic:
                                 roster,
                                 week_start,
                                 week_end,
-                                stat_meta,
+                                matchup_projection._projection_plan(stat_meta),
                                 season="2024-25",
                             )
 
@@ -1066,7 +1735,12 @@ class TestProjectionModes:
             }
 
             result = matchup_projection._project_player_stats(
-                "test_league", player, game_dates, stat_meta, "2024-25", "season"
+                "test_league",
+                player,
+                game_dates,
+                matchup_projection._projection_plan(stat_meta),
+                "2024-25",
+                "season",
             )
 
             # Should use season stats: 25.5 * 2 games = 51.0
@@ -1119,7 +1793,12 @@ class TestProjectionModes:
             )
 
             result = matchup_projection._project_player_stats(
-                "test_league", player, game_dates, stat_meta, "2024-25", "last3"
+                "test_league",
+                player,
+                game_dates,
+                matchup_projection._projection_plan(stat_meta),
+                "2024-25",
+                "last3",
             )
 
             # Should use last3 average: 22.0 * 2 games = 44.0
@@ -0,0 +1,80 @@
+"""Tests for minute trend helpers."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from tools.player import player_minutes_trend
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("36:30", 36.5),
+        (" 12:45 ", 12.75),
+        ("34", 34.0),
+        (" 7 ", 7.0),
+        (31.5, 31.5),
+        ("DNP", 0.0),
+        (" Did Not Play ", 0.0),
+    ],
+)
+def test_parse_minutes_accepts_box_score_formats(value, expected):
+    """Test parsing clock, plain and did-not-play minute values."""
+    assert player_minutes_trend.parse_minutes(value) == pytest.approx(expected)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [None, "", "   ", "12:3a", "1:2:3", "31.5", "n/a"])
+def test_parse_minutes_rejects_unparseable_values(value):
+    """Test that values outside the box score formats are not parsed."""
+    assert player_minutes_trend.parse_minutes(value) is None
+
+
+def _recent_minute_logs(games, count=4):
+    with patch.object(
+        player_minutes_trend, "_season_start_date", return_value=date(2025, 10, 21)
+    ), patch("tools.player.player_fetcher.fetch_player_stats_from_cache", return_value=games):
+        return player_minutes_trend.fetch_recent_minute_logs(1, "Regular Season", count=count)
+
+
+@pytest.mark.unit
+def test_fetch_recent_minute_logs_parses_only_newest_games():
+    """Test that the newest games are returned without parsing the whole season."""
+    games = [
+        {"date": f"2025-11-{day:02d}", "MIN": f"{day}:30", "matchup": f"G{day}"}
+        for day in range(1, 31)
+    ]
+    games[-1]["MIN"] = "bad"  # newest game has no usable minutes
+
+    with patch.object(
+        player_minutes_trend, "parse_minutes", wraps=player_minutes_trend.parse_minutes
+    ) as parse:
+        logs = _recent_minute_logs(games)
+
+    assert logs == [
+        ("2025-11-29", 29.5, "G29"),
+        ("2025-11-28", 28.5, "G28"),
+        ("2025-11-27", 27.5, "G27"),
+        ("2025-11-26", 26.5, "G26"),
+    ]
+    assert parse.call_count == 5
+
+
+@pytest.mark.unit
+def test_fetch_recent_minute_logs_falls_back_when_newest_games_lack_minutes():
+    """Test that older games are used when too many recent ones can't be parsed."""
+    games = [{"date": f"2025-11-{day:02d}", "MIN": "bad"} for day in range(1, 31)]
+    games[0]["MIN"] = "20:00"
+    games[1]["MIN"] = "22:00"
+
+    logs = _recent_minute_logs(games)
+
+    assert [(game_date, minutes) for game_date, minutes, _ in logs] == [
+        ("2025-11-02", 22.0),
+        ("2025-11-01", 20.0),
+    ]
@@ -58,6 +58,16 @@ def test_parse_stat_mode_invalid():
     assert num_days is None
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("36:30", 36.5), (" 34 ", 34.0), ("31.5", 31.5), (12, 12.0), ("DNP", 0.0), (None, 0.0), ("1:2:3", 0.0)],
+)
+def test_parse_minutes(value, expected):
+    """Test parsing box score minutes, defaulting to 0 when unparseable."""
+    assert player_stats._parse_minutes(value) == pytest.approx(expected)
+
+
 @pytest.mark.unit
 @patch("tools.player.player_fetcher.fetch_player_stats_from_cache")
 def test_compute_player_stats_last_game(mock_fetch):
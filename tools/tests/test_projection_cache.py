@@ -0,0 +1,110 @@
+"""Tests for the matchup projection result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from tools.utils import projection_cache
+
+
+@pytest.fixture(autouse=True)
+def _temp_home(tmp_path, monkeypatch):
+    """Point ~ at a temporary directory so the cache never touches the real one."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def _cache_path(team_key: str = "nba.l.1.t.1"):
+    return projection_cache.get_cache_path("nba.l.1", team_key, 5, "season", False, True)
+
+
+@pytest.mark.unit
+def test_cache_lives_under_boxscore_cache(_temp_home):
+    """Test that projections are stored next to the box score cache they derive from."""
+    cache_path = _cache_path()
+
+    assert cache_path.parent == _temp_home / ".shams" / "boxscores" / "matchup_projections"
+    assert cache_path.name.startswith("nba_l_1_nba_l_1_t_1_5_season_opt01_")
+
+
+@pytest.mark.unit
+def test_load_returns_none_on_miss():
+    """Test that a projection that was never saved is a cache miss."""
+    assert projection_cache.load_cached_projection(_cache_path()) is None
+
+
+@pytest.mark.unit
+def test_save_then_load_hits():
+    """Test that a saved projection is served back while fresh."""
+    cache_path = _cache_path()
+    projection = {"user_projection": {"12": 101.5}, "week": 5}
+
+    projection_cache.save_cached_projection(cache_path, projection)
+
+    assert projection_cache.load_cached_projection(cache_path) == projection
+    # Written atomically: no temp files are left behind
+    assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
+
+
+@pytest.mark.unit
+def test_load_ignores_expired_projection():
+    """Test that a projection older than max_age_seconds is not served."""
+    cache_path = _cache_path()
+    stale = datetime.now() - timedelta(seconds=projection_cache.DEFAULT_MAX_AGE_SECONDS + 1)
+    cache_path.write_text(
+        json.dumps({"timestamp": stale.isoformat(), "projection": {"week": 5}}),
+        encoding="utf-8",
+    )
+
+    assert projection_cache.load_cached_projection(cache_path) is None
+    assert projection_cache.load_cached_projection(cache_path, max_age_seconds=3600) == {
+        "week": 5
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content",
+    ["{not json", json.dumps({"projection": {}}), json.dumps({"timestamp": "soon"})],
+)
+def test_load_treats_corrupt_file_as_miss(content):
+    """Test that unreadable or incomplete cache files are ignored."""
+    cache_path = _cache_path()
+    cache_path.write_text(content, encoding="utf-8")
+
+    assert projection_cache.load_cached_projection(cache_path) is None
+
+
+@pytest.mark.unit
+def test_save_prunes_expired_projections():
+    """Test that saving removes projections too old to be served, keeping fresh ones."""
+    expired_path = _cache_path("nba.l.1.t.2")
+    fresh_path = _cache_path("nba.l.1.t.3")
+    projection_cache.save_cached_projection(expired_path, {"week": 4})
+    projection_cache.save_cached_projection(fresh_path, {"week": 5})
+    old = time.time() - projection_cache.DEFAULT_MAX_AGE_SECONDS - 60
+    os.utime(expired_path, (old, old))
+
+    cache_path = _cache_path()
+    projection_cache.save_cached_projection(cache_path, {"week": 6})
+
+    assert not expired_path.exists()
+    assert fresh_path.exists()
+    assert cache_path.exists()
+
+
+@pytest.mark.unit
+def test_clear_all_caches_removes_every_projection():
+    """Test that clearing the cache deletes all stored projections."""
+    for team in ("1", "2"):
+        projection_cache.save_cached_projection(_cache_path(f"nba.l.1.t.{team}"), {"week": 5})
+
+    projection_cache.clear_all_caches()
+
+    assert list(projection_cache.get_projection_cache_dir().glob("*.json")) == []
+    assert projection_cache.load_cached_projection(_cache_path()) is None
@@ -4,8 +4,12 @@ import pytest
 from tools.matchup.roster_optimizer import (
     optimize_roster_positions,
     get_active_positions,
+    _assign_slots,
     _get_eligible_slots_for_position,
     _get_slot_priority_for_player,
+    _position_bits,
+    _position_mask,
+    _slot_spec,
 )
 
 
@@ -48,6 +52,14 @@ class TestEligibleSlots:
         assert _get_eligible_slots_for_position(dual_eligible, "Util")
         assert not _get_eligible_slots_for_position(dual_eligible, "C")
 
+    def test_listed_flex_and_custom_slots_match_exactly(self):
+        """Flex or non-standard positions listed by Yahoo match their slots exactly."""
+        yahoo_positions = ["PG", "G", "Util"]
+        assert _get_slot_priority_for_player(yahoo_positions, "G") == 1
+        assert _get_slot_priority_for_player(yahoo_positions, "Util") == 1
+        assert _get_eligible_slots_for_position(["PG", "SG/SF"], "SG/SF")
+        assert not _get_eligible_slots_for_position(["PG"], "SG/SF")
+
 
 class TestSlotPriority:
     """Test slot priority calculation."""
@@ -185,6 +197,39 @@ class TestRosterOptimization:
         # pg_sg could get PG or SG
         assert result["pg_sg"] in ["PG", "SG"]
 
+    def test_reshuffles_instead_of_benching(self):
+        """A player should not be benched when moving others frees a slot for them."""
+        players = [
+            {"player_key": "pg", "eligible_positions": ["PG"]},
+            {"player_key": "sg_sf", "eligible_positions": ["SG", "SF"]},
+            {"player_key": "pg_sg", "eligible_positions": ["PG", "SG"]},
+        ]
+        league_roster = ["PG", "G", "F", "BN"]
+        players_with_games = {"pg", "sg_sf", "pg_sg"}
+
+        result = optimize_roster_positions(players, league_roster, players_with_games)
+
+        # Greedy alone would put sg_sf at G and bench pg_sg
+        assert result["pg"] == "PG"
+        assert result["sg_sf"] == "F"
+        assert result["pg_sg"] == "G"
+
+    def test_assign_slots_returns_slot_index_per_player(self):
+        """The mask kernel returns each player's slot index, -1 for the bench."""
+        slots = ["PG", "G", "F"]
+        bits = _position_bits(slots)
+        specs = [_slot_spec(slot, bits) for slot in slots]
+        masks = [
+            _position_mask(positions, bits)
+            for positions in (["PG"], ["SG", "SF"], ["PG", "SG"], ["C"])
+        ]
+
+        player_slots = _assign_slots(masks, specs)
+
+        # Every slot filled by an eligible player; the C can't play any of them
+        assert sorted(player_slots[:3]) == [0, 1, 2]
+        assert player_slots[3] == -1
+
     def test_inactive_positions_not_used(self):
         """IL and IL+ positions should not be assigned."""
         players = [
@@ -6,10 +6,12 @@ HTTP session, so long-running processes don't leak sockets/connection pools.
 
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from yfpy.exceptions import YahooFantasySportsException
 
 from tools.utils import yahoo
 
@@ -96,3 +98,79 @@ def test_clear_query_cache_closes_all_sessions():
     assert len(yahoo._query_cache) == 0
     for session in sessions:
         session.close.assert_called_once()
+
+
+def _make_query(method):
+    """Return a raw query stand-in exposing `method` as get_data and an OAuth session."""
+    return SimpleNamespace(
+        oauth=SimpleNamespace(session=MagicMock()),
+        league_id="1",
+        game_code="nba",
+        get_data=method,
+    )
+
+
+def test_clear_query_cache_waits_for_in_flight_call():
+    """A session still serving a call is closed only once that call returns."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def _slow_call():
+        started.set()
+        release.wait(5)
+        return "data"
+
+    query = _make_query(_slow_call)
+    wrapper = yahoo.TokenRefreshQueryWrapper(query)
+    with patch.object(yahoo, "_build_query_wrapper", return_value=wrapper):
+        yahoo._load_query(league_key="nba.l.1")
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(wrapper.get_data()))
+    worker.start()
+    assert started.wait(5)
+
+    yahoo.clear_query_cache()
+    assert len(yahoo._query_cache) == 0
+    query.oauth.session.close.assert_not_called()
+
+    release.set()
+    worker.join(5)
+    assert results == ["data"]
+    query.oauth.session.close.assert_called_once()
+
+
+def test_concurrent_token_expiry_refreshes_once(monkeypatch):
+    """Calls that hit an expired token together share a single token refresh."""
+    monkeypatch.setenv("YAHOO_CONSUMER_KEY", "key")
+    monkeypatch.setenv("YAHOO_CONSUMER_SECRET", "secret")
+    thread_count = 3
+    barrier = threading.Barrier(thread_count)
+
+    def _expired_call():
+        barrier.wait(5)
+        raise YahooFantasySportsException("token_expired")
+
+    wrapper = yahoo.TokenRefreshQueryWrapper(_make_query(_expired_call))
+
+    with patch.object(
+        yahoo.TokenRefreshQueryWrapper, "_force_token_refresh"
+    ) as mock_refresh, patch.object(yahoo, "load_dotenv"), patch.object(
+        yahoo, "_ensure_token_dir"
+    ), patch.object(
+        yahoo,
+        "YahooFantasySportsQuery",
+        side_effect=lambda **kwargs: _make_query(lambda: "fresh"),
+    ):
+        results = []
+        workers = [
+            threading.Thread(target=lambda: results.append(wrapper.get_data()))
+            for _ in range(thread_count)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+    assert results == ["fresh"] * thread_count
+    mock_refresh.assert_called_once()
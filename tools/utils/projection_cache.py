@@ -0,0 +1,137 @@
+"""Short-lived cache of matchup projection results."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from tools.boxscore import boxscore_cache
+from tools.utils.file_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# How long a cached projection is served before it is recomputed
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+
+def get_projection_cache_dir() -> Path:
+    """Get the matchup projection cache directory (~/.shams/boxscores/matchup_projections/).
+
+    Projections are derived from the box score cache, so they live next to it.
+    """
+    cache_dir = boxscore_cache.get_cache_dir() / "matchup_projections"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_cache_path(
+    league_key: str,
+    team_key: str,
+    week: Optional[int],
+    projection_mode: str,
+    optimize_user_roster: bool,
+    optimize_opponent_roster: bool,
+) -> Path:
+    """Get the cache file path for one projection request.
+
+    Today's date is part of the key, so a projection is never reused across days
+    (remaining games and the active season both depend on it).
+
+    Args:
+        league_key: Yahoo league key
+        team_key: Yahoo team key
+        week: Week number, or None for the current week
+        projection_mode: One of "season", "last3", "last7", "last7d", "last30d"
+        optimize_user_roster: Whether the user's roster is optimized
+        optimize_opponent_roster: Whether the opponent's roster is optimized
+
+    Returns:
+        Path to the cache file
+    """
+    parts = [
+        league_key,
+        team_key,
+        "current" if week is None else str(week),
+        projection_mode,
+        f"opt{int(optimize_user_roster)}{int(optimize_opponent_roster)}",
+        date.today().isoformat(),
+    ]
+    # Sanitize keys to be filesystem-safe
+    safe_key = "_".join(parts).replace(".", "_")
+    return get_projection_cache_dir() / f"{safe_key}.json"
+
+
+def load_cached_projection(
+    cache_path: Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+) -> Optional[Dict[str, object]]:
+    """Load a cached projection if it exists and is fresh.
+
+    Args:
+        cache_path: Path from get_cache_path
+        max_age_seconds: Maximum cache age; older entries are ignored
+
+    Returns:
+        The cached projection, or None if missing, stale or unreadable
+    """
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        timestamp = datetime.fromisoformat(data["timestamp"])
+        if (datetime.now() - timestamp).total_seconds() > max_age_seconds:
+            return None
+        return data["projection"]
+    except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError):
+        # If cache is corrupted, treat as if it doesn't exist
+        return None
+
+
+def save_cached_projection(cache_path: Path, projection: Dict[str, object]) -> None:
+    """Save a projection to the cache with the current timestamp.
+
+    The file is written atomically so a concurrent reader never sees a partial
+    projection, and expired projections are pruned so the directory doesn't grow
+    with every league/team/week/mode/day combination.
+
+    Args:
+        cache_path: Path from get_cache_path
+        projection: JSON-serializable projection result
+    """
+    try:
+        payload = json.dumps(
+            {"timestamp": datetime.now().isoformat(), "projection": projection}
+        )
+        atomic_write(cache_path, payload)
+    except (IOError, TypeError, ValueError) as e:
+        # Log but don't fail if we can't write cache
+        logger.warning("Could not write matchup projection cache: %s", e)
+
+    _prune_expired_projections(cache_path.parent)
+
+
+def _prune_expired_projections(
+    cache_dir: Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+) -> None:
+    """Delete cached projections too old to be served (including earlier days')."""
+    cutoff = time.time() - max_age_seconds
+    for cache_file in cache_dir.glob("*.json"):
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+        except OSError:
+            pass  # Already removed by another request, or not ours to delete
+
+
+def clear_all_caches() -> None:
+    """Delete all cached matchup projections (e.g. after box scores are refreshed)."""
+    for cache_file in get_projection_cache_dir().glob("*.json"):
+        try:
+            cache_file.unlink()
+        except IOError:
+            pass  # Silently ignore if we can't delete
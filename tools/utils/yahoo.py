@@ -34,6 +34,11 @@ _QUERY_CACHE_MAXSIZE = 8
 _query_cache: "OrderedDict[tuple, TokenRefreshQueryWrapper]" = OrderedDict()
 _query_cache_lock = threading.Lock()
 
+# Serializes OAuth token refreshes; the generation counts completed refreshes so a
+# thread that failed with the old token can tell someone else already refreshed it
+_token_refresh_lock = threading.Lock()
+_token_generation = 0
+
 
 def _close_query_session(query) -> None:
     """Close the underlying requests session of a query object. Never raises.
@@ -55,6 +60,14 @@ def _close_query_session(query) -> None:
         logger.debug("Failed to close Yahoo query session: %s", close_err)
 
 
+def _retire_query(query) -> None:
+    """Release a query dropped from the cache without cutting off in-flight calls."""
+    if isinstance(query, TokenRefreshQueryWrapper):
+        query.retire()
+    else:
+        _close_query_session(query)
+
+
 class TokenRefreshQueryWrapper:
     """Wrapper around YahooFantasySportsQuery that automatically handles token expiration.
 
@@ -64,6 +77,61 @@ class TokenRefreshQueryWrapper:
 
     def __init__(self, query: YahooFantasySportsQuery):
         self._query = query
+        # In-flight call count, so a retired wrapper's session is only closed
+        # once no other thread is still using it
+        self._calls_lock = threading.Lock()
+        self._active_calls = 0
+        self._retired = False
+
+    def retire(self) -> None:
+        """Close the OAuth session now if idle, otherwise when the last call finishes."""
+        with self._calls_lock:
+            self._retired = True
+            close_now = self._active_calls == 0
+        if close_now:
+            _close_query_session(self)
+
+    def _begin_call(self) -> None:
+        with self._calls_lock:
+            self._active_calls += 1
+
+    def _end_call(self) -> None:
+        with self._calls_lock:
+            self._active_calls -= 1
+            close_now = self._retired and self._active_calls == 0
+        if close_now:
+            _close_query_session(self)
+
+    def _refresh_tokens_once(self, seen_generation: int) -> None:
+        """Refresh OAuth tokens unless another thread already did since seen_generation.
+
+        Concurrent calls that all hit an expired token share a single refresh:
+        the first one clears the query cache and rewrites .env, the rest wait for
+        it and then just reload the new tokens.
+        """
+        global _token_generation  # pylint: disable=global-statement
+        with _token_refresh_lock:
+            if _token_generation == seen_generation:
+                # Clear the cache to force fresh query creation
+                clear_query_cache()
+
+                # Force token refresh by manually calling OAuth refresh
+                # This is a fallback in case backend didn't catch the expiration
+                try:
+                    self._force_token_refresh()
+                except Exception as refresh_err:
+                    print(f"[WARNING] Manual token refresh failed: {refresh_err}")
+
+                _token_generation += 1
+
+                # Small delay to ensure .env file is written
+                import time
+
+                time.sleep(0.2)
+
+            # Reload environment variables to pick up refreshed tokens
+            # Must specify the correct path where tokens were saved
+            load_dotenv(DEFAULT_TOKEN_DIR / ".env", override=True)
 
     def _force_token_refresh(self):
         """Manually refresh OAuth tokens using the refresh token."""
@@ -131,6 +199,8 @@ class TokenRefreshQueryWrapper:
         # Wrap callable methods with retry logic
         def wrapper(*args, **kwargs):
             retry_attempted = False
+            seen_generation = _token_generation
+            self._begin_call()
             try:
                 return attr(*args, **kwargs)
             except YahooFantasySportsException as exc:
@@ -144,24 +214,7 @@ class TokenRefreshQueryWrapper:
                     )
                     retry_attempted = True
 
-                    # Clear the cache to force fresh query creation
-                    clear_query_cache()
-
-                    # Force token refresh by manually calling OAuth refresh
-                    # This is a fallback in case backend didn't catch the expiration
-                    try:
-                        self._force_token_refresh()
-                    except Exception as refresh_err:
-                        print(f"[WARNING] Manual token refresh failed: {refresh_err}")
-
-                    # Reload environment variables to pick up refreshed tokens
-                    # Must specify the correct path where tokens were saved
-                    load_dotenv(DEFAULT_TOKEN_DIR / ".env", override=True)
-
-                    # Small delay to ensure .env file is written
-                    import time
-
-                    time.sleep(0.2)
+                    self._refresh_tokens_once(seen_generation)
 
                     # Get consumer credentials from environment (just reloaded)
                     consumer_key = os.environ.get("YAHOO_CONSUMER_KEY")
@@ -207,6 +260,8 @@ class TokenRefreshQueryWrapper:
                 # Not a token/auth error — re-raise as the original Yahoo exception
                 # so callers receive a 500-level error rather than a 401 logout
                 raise
+            finally:
+                self._end_call()
 
         return wrapper
 
@@ -233,12 +288,13 @@ def clear_query_cache():
 
     This should be called when tokens are refreshed to force recreation
     of query objects with new OAuth credentials. Closes each query's
-    underlying OAuth2 HTTP session first so sockets/memory are reclaimed
-    instead of leaking.
+    underlying OAuth2 HTTP session so sockets/memory are reclaimed instead
+    of leaking; a session another thread is still calling through is closed
+    once that call finishes.
     """
     with _query_cache_lock:
         for query in _query_cache.values():
-            _close_query_session(query)
+            _retire_query(query)
         _query_cache.clear()
 
 
@@ -305,7 +361,7 @@ def _load_query(  # noqa: PLR0913
         # wrapper's OAuth2 session so it does not leak.
         while len(_query_cache) > _QUERY_CACHE_MAXSIZE:
             _, evicted = _query_cache.popitem(last=False)
-            _close_query_session(evicted)
+            _retire_query(evicted)
 
         return wrapper
 